@@ -3,6 +3,8 @@
 # from __future__ import annotations
 import logging
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_IP_ADDRESS,
@@ -14,11 +16,25 @@ from homeassistant.const import (
     Platform,
     REVOLUTIONS_PER_MINUTE,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import slugify
 
-from .const import DOMAIN, UPDATE_INTERVAL
+from . import protocol_transport
+from .config_helpers import entry_polling_options
+from .const import (
+    CAPTURE_PATH,
+    DEFAULT_CAPTURE_FILE,
+    DOMAIN,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    REFRESH_COOLDOWN,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_CAPTURE,
+    UPDATE_INTERVAL,
+)
 from .coordinator import EcoVentCoordinator
 from .frontend import async_register_frontend
 
@@ -220,6 +236,39 @@ async def _async_migrate_statistics_metadata_on_start(
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_run_at_start)
 
 
+def _async_register_capture_services(hass: HomeAssistant) -> None:
+    """Register the services recording UDP traffic for later replay.
+
+    The capture covers the socket shared by every EcoVent device, so the
+    services belong to the integration rather than to one entry.
+    """
+    if hass.services.has_service(DOMAIN, SERVICE_START_CAPTURE):
+        return
+
+    async def _async_start_capture(call: ServiceCall) -> None:
+        path = call.data.get(CAPTURE_PATH)
+        if path is None:
+            path = hass.config.path(DEFAULT_CAPTURE_FILE)
+        elif not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Capture path {path} is not allowed")
+        try:
+            await hass.async_add_executor_job(protocol_transport.start_capture, path)
+        except OSError as err:
+            raise HomeAssistantError(f"Cannot open capture file {path}: {err}") from err
+        _LOGGER.info("Recording EcoVent V2 traffic to %s", path)
+
+    async def _async_stop_capture(call: ServiceCall) -> None:
+        await hass.async_add_executor_job(protocol_transport.stop_capture)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_CAPTURE,
+        _async_start_capture,
+        schema=vol.Schema({vol.Optional(CAPTURE_PATH): cv.string}),
+    )
+    hass.services.async_register(DOMAIN, SERVICE_STOP_CAPTURE, _async_stop_capture)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up EcoVent_v2 from a config entry."""
 
@@ -229,18 +278,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # CONF_DEVICE_ID: entry.data.get(CONF_DEVICE_ID, "DEFAULT_DEVICEID"),
         CONF_PASSWORD: entry.data.get(CONF_PASSWORD, "1111"),
         CONF_NAME: entry.data.get(CONF_NAME, "Vento Expert Fan"),
-        UPDATE_INTERVAL: entry.data.get(UPDATE_INTERVAL, 30),
+        **entry_polling_options(entry.data),
     }
 
     coordinator = EcoVentCoordinator(
-        hass, entry, update_seconds=entry.runtime_data[UPDATE_INTERVAL]
+        hass,
+        entry,
+        update_seconds=entry.runtime_data[UPDATE_INTERVAL],
+        refresh_cooldown=entry.runtime_data[REFRESH_COOLDOWN],
+        min_update_seconds=entry.runtime_data[MIN_UPDATE_INTERVAL],
+        max_update_seconds=entry.runtime_data[MAX_UPDATE_INTERVAL],
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await coordinator.async_shutdown()
+        raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     await async_register_frontend(hass)
+    _async_register_capture_services(hass)
     _async_migrate_entity_registry(hass, coordinator)
     await _async_migrate_statistics_metadata_on_start(hass, coordinator)
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
@@ -251,4 +310,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
+    if unload_ok:
+        coordinator: EcoVentCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        if not hass.data[DOMAIN]:
+            await hass.async_add_executor_job(protocol_transport.stop_capture)
+            hass.services.async_remove(DOMAIN, SERVICE_START_CAPTURE)
+            hass.services.async_remove(DOMAIN, SERVICE_STOP_CAPTURE)
     return unload_ok
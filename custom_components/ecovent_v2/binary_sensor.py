@@ -189,8 +189,7 @@ class VentoBinarySensor(CoordinatorEntity, BinarySensorEntity):  # CoordinatorEn
     ) -> None:
         """Initialize fan binary sensors."""
         coordinator: EcoVentCoordinator = hass.data[DOMAIN][config.entry_id]
-        super().__init__(coordinator)
-        self._fan: Fan = coordinator._fan
+        super().__init__(coordinator, context=coordinator.param_context(method))
         self._attr_unique_id = self._fan.id + key
         self._attr_name = name
         self._state = None
@@ -204,6 +203,11 @@ class VentoBinarySensor(CoordinatorEntity, BinarySensorEntity):  # CoordinatorEn
             identifiers={(DOMAIN, self._fan.id)}, name=self._fan.name
         )
 
+    @property
+    def _fan(self) -> Fan:
+        """Return the read-only fan state of the last coordinator update."""
+        return self.coordinator.data
+
     @property
     def is_on(self):
         """Is on."""
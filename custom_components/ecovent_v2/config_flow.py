@@ -18,7 +18,15 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, UPDATE_INTERVAL
+from .config_helpers import entry_polling_options
+from .config_schema import polling_fields
+from .const import (
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DOMAIN,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,7 +39,7 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         # vol.Optional(CONF_DEVICE_ID, default="DEFAULT_DEVICEID"): str,   nothing useful to enter
         vol.Required(CONF_PASSWORD, default="1111"): str,
         vol.Optional(CONF_NAME, default="Vento Expert Fan"): str,
-        vol.Optional(UPDATE_INTERVAL, default=30): int,
+        **polling_fields(entry_polling_options({})),
     }
 )
 
@@ -50,7 +58,10 @@ class VentoHub:
     async def authenticate(self, hass: HomeAssistant, password: str) -> bool:
         """Authenticate."""
         self.fan = Fan(self.host, password, self.fan_id, self.name, self.port)
-        await hass.async_add_executor_job(self.fan.init_device)
+        try:
+            await hass.async_add_executor_job(self.fan.init_device)
+        finally:
+            self.fan.close()
         self.fan_id = self.fan.id
         _LOGGER.info(
             "Config Flow: Authenticated fan with name:%s ID: %s", self.name, self.fan_id
@@ -150,6 +161,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "update interval must be at least 3 seconds to prevent overloading the device with requests."
                 )
                 raise exceptions.HomeAssistantError("update interval too low")
+            _check_interval_range(user_input, errors)
 
             info = await validate_input(self.hass, user_input)
             await self.async_set_unique_id(info["id"])
@@ -205,6 +217,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         "update interval must be at least 3 seconds to prevent overloading the device with requests."
                     )
                     raise exceptions.HomeAssistantError("update interval too low")
+                _check_interval_range(user_input, errors)
 
                 await validate_input(self.hass, user_input)
             except CannotConnect:
@@ -232,9 +245,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         name_configured = self._get_reconfigure_entry().data.get(
             CONF_NAME, "Vento Expert Fan"
         )
-        update_interval_configured = self._get_reconfigure_entry().data.get(
-            UPDATE_INTERVAL, 30
-        )
+        polling_configured = entry_polling_options(self._get_reconfigure_entry().data)
+        if polling_configured[MIN_UPDATE_INTERVAL] is None:
+            polling_configured[MIN_UPDATE_INTERVAL] = polling_configured[
+                UPDATE_INTERVAL
+            ]
 
         return self.async_show_form(
             step_id="reconfigure",
@@ -245,15 +260,31 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # vol.Optional(CONF_DEVICE_ID, default=devId_configured): str,
                     vol.Required(CONF_PASSWORD, default=password_configured): str,
                     vol.Optional(CONF_NAME, default=name_configured): str,
-                    vol.Optional(
-                        UPDATE_INTERVAL, default=update_interval_configured
-                    ): int,
+                    **polling_fields(polling_configured),
                 }
             ),
             errors=errors,
         )
 
 
+def _check_interval_range(user_input: dict[str, Any], errors: dict[str, str]) -> None:
+    """Reject adaptive polling bounds that would overload the device."""
+    min_interval = user_input.get(
+        MIN_UPDATE_INTERVAL, user_input[UPDATE_INTERVAL]
+    )
+    max_interval = user_input.get(MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL)
+    if min_interval < 3:
+        errors[MIN_UPDATE_INTERVAL] = (
+            "minimum update interval must be at least 3 seconds to prevent overloading the device with requests."
+        )
+        raise exceptions.HomeAssistantError("minimum update interval too low")
+    if max_interval < min_interval:
+        errors[MAX_UPDATE_INTERVAL] = (
+            "maximum update interval must not be below the minimum update interval."
+        )
+        raise exceptions.HomeAssistantError("update interval range inverted")
+
+
 class CannotConnect(exceptions.HomeAssistantError):
     """Error to indicate we cannot connect."""
 
@@ -0,0 +1,38 @@
+"""Home Assistant independent helpers for EcoVent config entries."""
+
+try:
+    from .const import (
+        DEFAULT_MAX_UPDATE_INTERVAL,
+        DEFAULT_REFRESH_COOLDOWN,
+        DEFAULT_UPDATE_INTERVAL,
+        MAX_UPDATE_INTERVAL,
+        MIN_UPDATE_INTERVAL,
+        REFRESH_COOLDOWN,
+        UPDATE_INTERVAL,
+    )
+except ImportError:
+    from const import (
+        DEFAULT_MAX_UPDATE_INTERVAL,
+        DEFAULT_REFRESH_COOLDOWN,
+        DEFAULT_UPDATE_INTERVAL,
+        MAX_UPDATE_INTERVAL,
+        MIN_UPDATE_INTERVAL,
+        REFRESH_COOLDOWN,
+        UPDATE_INTERVAL,
+    )
+
+
+def entry_polling_options(data):
+    """Return the polling options of config entry ``data``, with defaults.
+
+    A missing minimum update interval stays ``None``; the coordinator then
+    uses the update interval as the minimum.
+    """
+    return {
+        UPDATE_INTERVAL: data.get(UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+        REFRESH_COOLDOWN: data.get(REFRESH_COOLDOWN, DEFAULT_REFRESH_COOLDOWN),
+        MIN_UPDATE_INTERVAL: data.get(MIN_UPDATE_INTERVAL),
+        MAX_UPDATE_INTERVAL: data.get(
+            MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+        ),
+    }
@@ -0,0 +1,41 @@
+"""Voluptuous fields shared by the EcoVent config and reconfigure forms."""
+
+import voluptuous as vol
+
+try:
+    from .const import (
+        MAX_UPDATE_INTERVAL,
+        MIN_UPDATE_INTERVAL,
+        REFRESH_COOLDOWN,
+        UPDATE_INTERVAL,
+    )
+except ImportError:
+    from const import (
+        MAX_UPDATE_INTERVAL,
+        MIN_UPDATE_INTERVAL,
+        REFRESH_COOLDOWN,
+        UPDATE_INTERVAL,
+    )
+
+
+def polling_fields(options):
+    """Return the polling option fields, defaulting to ``options``.
+
+    ``options`` is an ``entry_polling_options`` result; a ``None`` minimum
+    update interval leaves that field empty.
+    """
+    min_update_interval = options[MIN_UPDATE_INTERVAL]
+    return {
+        vol.Optional(UPDATE_INTERVAL, default=options[UPDATE_INTERVAL]): int,
+        vol.Optional(REFRESH_COOLDOWN, default=options[REFRESH_COOLDOWN]): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        (
+            vol.Optional(MIN_UPDATE_INTERVAL)
+            if min_update_interval is None
+            else vol.Optional(MIN_UPDATE_INTERVAL, default=min_update_interval)
+        ): int,
+        vol.Optional(
+            MAX_UPDATE_INTERVAL, default=options[MAX_UPDATE_INTERVAL]
+        ): int,
+    }
@@ -2,6 +2,16 @@
 
 DOMAIN = "ecovent_v2"
 UPDATE_INTERVAL = "update_interval"
+DEFAULT_UPDATE_INTERVAL = 30
+REFRESH_COOLDOWN = "refresh_cooldown"
+DEFAULT_REFRESH_COOLDOWN = 1.0
+MIN_UPDATE_INTERVAL = "min_update_interval"
+MAX_UPDATE_INTERVAL = "max_update_interval"
+DEFAULT_MAX_UPDATE_INTERVAL = 120
 
 SERVICE_FILTER_TIMER_RESET = "filter_timer_reset"
 SERVICE_RESET_ALARMS = "reset_alarms"
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+CAPTURE_PATH = "path"
+DEFAULT_CAPTURE_FILE = "ecovent_v2_capture.evcap"
@@ -1,9 +1,19 @@
 """VentoUpdateCoordinator class."""
 
 # from __future__ import annotations
+import asyncio
 from datetime import timedelta
 import logging
+from typing import Any
 
+from .coordinator_helpers import (
+    SCHEDULE,
+    ListenerChanges,
+    TrailingCall,
+    listener_should_update,
+    next_update_interval,
+    polling_bounds,
+)
 from .ecoventv2 import Fan
 from .schedule_helpers import (
     SCHEDULE_DAY_LABELS,
@@ -21,17 +31,27 @@ from homeassistant.const import (
     CONF_PORT,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_REFRESH_COOLDOWN,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Entity writes arriving within this window share one write_return packet.
+WRITE_COALESCE_SECONDS = 0.05
+# Slow-tier parameters (setpoints, counters, settings) are polled this often.
+SLOW_TIER_INTERVAL = timedelta(minutes=5)
+
 
-class EcoVentCoordinator(DataUpdateCoordinator):
+class EcoVentCoordinator(DataUpdateCoordinator[Fan]):
     """Class for Vento Fan Update Coordinator."""
 
     def __init__(
@@ -39,6 +59,9 @@ class EcoVentCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         config: ConfigEntry,
         update_seconds: int = 30,
+        refresh_cooldown: float = DEFAULT_REFRESH_COOLDOWN,
+        min_update_seconds: int | None = None,
+        max_update_seconds: int = DEFAULT_MAX_UPDATE_INTERVAL,
     ) -> None:
         """Initialize global Vento data updater."""
         self._fan = Fan(
@@ -49,12 +72,28 @@ class EcoVentCoordinator(DataUpdateCoordinator):
             config.data[CONF_NAME],
             config.data[CONF_PORT],
         )
-        # self._fan.init_device()  is a blocking call cannot be done in constructur ...
+        # self._fan.async_init_device() needs the event loop; it runs on first refresh
         self.fan_initialized = False  # flag to indicate if the fan has been initialized
         self.updateCounter = 0
         self._schedule_day = 1
         self._weekly_schedule: dict[int, dict[int, WeeklyScheduleRecord]] = {}
         self._last_clock_sync = None
+        self._last_slow_poll = None
+        self._static_stale = False
+        min_update_seconds, max_update_seconds = polling_bounds(
+            update_seconds, min_update_seconds, max_update_seconds
+        )
+        self._min_update_interval = timedelta(seconds=min_update_seconds)
+        self._max_update_interval = timedelta(seconds=max_update_seconds)
+        self._notified_success: bool | None = None
+        self._listener_changes = ListenerChanges()
+        self._pending_writes: dict[str, Any] = {}
+        self._write_flush: asyncio.Task | None = None
+        # Bursts of writes (a dragged slider) share one dependent read once the
+        # cooldown has passed since the first of them.
+        self._write_refresh = TrailingCall(
+            refresh_cooldown, self._async_refresh_write_dependencies
+        )
         _LOGGER.debug(
             "EcoVentCoordinator initialized with update rate: %d", update_seconds
         )
@@ -63,17 +102,26 @@ class EcoVentCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             config_entry=config,
-            update_interval=timedelta(seconds=update_seconds),
+            update_interval=min(
+                max(timedelta(seconds=update_seconds), self._min_update_interval),
+                self._max_update_interval,
+            ),
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=refresh_cooldown, immediate=False
+            ),
         )
 
-    async def _async_update_data(self) -> None:
+    async def _async_update_data(self) -> Fan:
         """Fetch data from API endpoint.
 
         The concept is, we have one common update rate and read all data into the fan object, then the entities read from that object. This way we can avoid multiple API calls and have a single source of truth for the data.
+
+        The cycle returns a read-only snapshot of the fan, which becomes
+        ``self.data``, so entities never see a half-applied response.
         """
         if not self.fan_initialized:
             _LOGGER.debug("EcoVentCoordinator: Initializing fan for the first time...")
-            await self.hass.async_add_executor_job(self._fan.init_device)
+            await self._fan.async_init_device()
             if self._fan.id is None or self._fan.id == "DEFAULT_DEVICEID":
                 _LOGGER.error(
                     "EcoVentCoordinator: Failed to initialize fan, check connection and configuration."
@@ -82,37 +130,187 @@ class EcoVentCoordinator(DataUpdateCoordinator):
                     "Failed to initialize fan, check connection and configuration."
                 )
             self.fan_initialized = True
+            # async_init_device has just read every tier.
+            self._last_slow_poll = dt_util.utcnow()
             await self._async_post_init_setup()
 
+        self._fan.reset_retry_budget()
         self.updateCounter += 1
-        if (self.updateCounter % 2 == 0) or (self.updateCounter < 4):
-            # every 2nd update do a full update, otherwise a quick update to reduce load on the device
-            _LOGGER.debug("EcoVentCoordinator: Starting full data update...")
-            await self.hass.async_add_executor_job(self._fan.update)
-        else:
-            _LOGGER.debug("EcoVentCoordinator: Starting quick data update...")
-            await self.hass.async_add_executor_job(self._fan.quick_update)
+        await self._async_poll_tiers()
 
         if self._fan.supports_parameter("weekly_schedule_setup") and (
             not self._weekly_schedule or self.updateCounter % 10 == 0
         ):
-            await self.hass.async_add_executor_job(self._load_schedule_week)
+            await self._async_load_schedule_week()
 
         if self._fan.supports_parameter("rtc_time") and self._fan.supports_parameter(
             "rtc_date"
         ):
             await self._async_maybe_sync_clock()
 
+        return self._snapshot()
+
+    def _snapshot(self) -> Fan:
+        """Return a read-only copy of the fan state, reused while nothing changed."""
+        if self.data is None or self._fan.has_changed_params:
+            return self._fan.snapshot()
+        return self.data
+
+    def _async_publish(self) -> None:
+        """Swap in a snapshot of the latest values and notify entities."""
+        self.data = self._snapshot()
+        self.async_update_listeners()
+
+    def param_context(self, *names: str) -> frozenset[int] | None:
+        """Return the listener context of an entity rendering ``names``.
+
+        Entities pass it to CoordinatorEntity and are then only updated when
+        one of these parameters changed. ``None`` (always update) is returned
+        when a name is not a parameter of the active profile.
+        """
+        ids = [self._fan.get_params_index(name) for name in names]
+        if not ids or None in ids:
+            return None
+        return frozenset(ids)
+
+    def async_update_listeners(self) -> None:
+        """Update only the entities whose parameters changed since last time.
+
+        Coordinator state such as the cached schedule is notified under its
+        own key. Entities without a context are updated whenever anything
+        changed, transport sensors on every update, and every entity after a
+        profile switch or an availability change.
+        """
+        changed = self._listener_changes.pop(self._fan.pop_changed_params())
+        if changed is None or self.last_update_success != self._notified_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if listener_should_update(context, changed):
+                update_callback()
+
+    @property
+    def pending_writes(self) -> dict[str, Any]:
+        """Return parameter writes waiting for the next coalesced packet."""
+        return self._pending_writes
+
+    def transport_value(self, name: str) -> Any:
+        """Return a transport counter of the live client, not the snapshot."""
+        return self._fan.transport_value(name)
+
+    async def async_write_params(self, values: dict[str, Any]) -> None:
+        """Write profile parameters, batching concurrent callers into one packet.
+
+        A scene touching preset, speed and direction calls several entity
+        methods at once; their writes are merged for WRITE_COALESCE_SECONDS and
+        sent as one multi-parameter write_return, followed by one dependent
+        read. A later value for the same parameter replaces an earlier one.
+        """
+        if not values:
+            return
+        self._pending_writes.update(values)
+        if self._write_flush is None:
+            self._write_flush = self.hass.async_create_task(
+                self._async_flush_writes()
+            )
+        await asyncio.shield(self._write_flush)
+
+    async def _async_flush_writes(self) -> None:
+        """Send every queued write in one packet once the window closes."""
+        await asyncio.sleep(WRITE_COALESCE_SECONDS)
+        values, self._pending_writes = self._pending_writes, {}
+        self._write_flush = None
+        if not await self._fan.async_set_params(values):
+            _LOGGER.warning(
+                "EcoVentCoordinator: device did not confirm write of %s",
+                sorted(values),
+            )
+            return
+        await self.async_write_completed()
+
+    async def async_write_completed(self) -> None:
+        """Publish echoed write results and schedule the dependent read.
+
+        Write commands use write_return, whose reply already updated the fan
+        object, so listeners are notified before any further round-trip. The
+        read of derived values is debounced, so a burst of writes costs one.
+        """
+        self._async_publish()
+        await self._write_refresh.async_call()
+
+    async def _async_refresh_write_dependencies(self) -> None:
+        """Read back the values derived from writes since the last read."""
+        self._fan.reset_retry_budget()
+        if await self._fan.async_read_write_dependencies():
+            self._async_publish()
+
+    async def _async_poll_tiers(self) -> None:
+        """Read the fast tier, plus the slow and static tiers when they are due.
+
+        Static rows are re-read after a failed poll, since the device may have
+        been replaced or re-addressed while it was unreachable.
+        """
+        now = dt_util.utcnow()
+        tiers = {"fast"}
+        if self._last_slow_poll is None or now - self._last_slow_poll >= (
+            SLOW_TIER_INTERVAL
+        ):
+            tiers.add("slow")
+        if self._static_stale:
+            tiers.add("static")
+        _LOGGER.debug("EcoVentCoordinator: polling %s tiers", sorted(tiers))
+        previous = self._fan.activity_values()
+        if not await self._fan.async_update_tiers(tiers):
+            self._static_stale = True
+            return
+        if "slow" in tiers:
+            self._last_slow_poll = now
+        self._static_stale = False
+        self._adapt_update_interval(self._fan.activity_values() != previous)
+
+    def _adapt_update_interval(self, changed: bool) -> None:
+        """Poll at the minimum interval while the device is active, else back off.
+
+        A changed fast-tier value (humidity rising, speed changed from the
+        panel) or a running boost or timer counts as activity. Failed polls
+        keep the current interval, so an unreachable device is retried as
+        often as before.
+        """
+        interval = next_update_interval(
+            self.update_interval,
+            self._min_update_interval,
+            self._max_update_interval,
+            changed or self._fan.timer_running,
+            self._fan.state == "off",
+        )
+        if interval != self.update_interval:
+            _LOGGER.debug(
+                "EcoVentCoordinator: update interval %ss",
+                interval.total_seconds(),
+            )
+            self.update_interval = interval
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and release the device socket."""
+        self._write_refresh.cancel()
+        await super().async_shutdown()
+        self._fan.close()
+
     async def _async_post_init_setup(self) -> None:
         """Load slow one-off state after device discovery."""
         if self._fan.supports_parameter("weekly_schedule_setup"):
-            await self.hass.async_add_executor_job(self._load_schedule_week)
+            await self._async_load_schedule_week()
 
-    def _load_schedule_week(self) -> None:
+    async def _async_load_schedule_week(self) -> None:
         """Read and cache the full weekly schedule from the device."""
-        self._weekly_schedule = {
-            day: self._fan.read_weekly_schedule_day(day) for day in range(1, 8)
+        schedule = {
+            day: await self._fan.async_read_weekly_schedule_day(day)
+            for day in range(1, 8)
         }
+        if schedule != self._weekly_schedule:
+            self._weekly_schedule = schedule
+            self._listener_changes.mark(SCHEDULE)
 
     async def _async_maybe_sync_clock(self) -> None:
         """Keep documented RTC-capable devices close to HA local time."""
@@ -122,10 +320,7 @@ class EcoVentCoordinator(DataUpdateCoordinator):
         ):
             return
 
-        await self.hass.async_add_executor_job(
-            self._fan.set_rtc_datetime,
-            now.replace(tzinfo=None),
-        )
+        await self._fan.async_set_rtc_datetime(now.replace(tzinfo=None))
         self._last_clock_sync = now
 
     @property
@@ -175,16 +370,15 @@ class EcoVentCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Apply one schedule payload from the custom dialog."""
         if selected_day is not None:
-            self._schedule_day = SCHEDULE_DAY_TO_INDEX[selected_day]
+            day = SCHEDULE_DAY_TO_INDEX[selected_day]
+            if day != self._schedule_day:
+                self._schedule_day = day
+                self._listener_changes.mark(SCHEDULE)
 
         if weekly_schedule_enabled is not None:
             target = "on" if weekly_schedule_enabled else "off"
             if self._fan.weekly_schedule_state != target:
-                await self.hass.async_add_executor_job(
-                    self._fan.set_param,
-                    "weekly_schedule_state",
-                    target,
-                )
+                await self._fan.async_set_param("weekly_schedule_state", target)
 
         if days:
             for day_payload in days:
@@ -198,9 +392,8 @@ class EcoVentCoordinator(DataUpdateCoordinator):
                 )
 
                 for record in records_to_write:
-                    written = await self.hass.async_add_executor_job(
-                        self._fan.write_weekly_schedule_record,
-                        record,
+                    written = await self._fan.async_write_weekly_schedule_record(
+                        record
                     )
                     if not written:
                         raise RuntimeError(
@@ -208,14 +401,12 @@ class EcoVentCoordinator(DataUpdateCoordinator):
                             f"{day_label} period {record.period}"
                         )
                     self._weekly_schedule.setdefault(day, {})[record.period] = record
+                    self._listener_changes.mark(SCHEDULE)
 
-        self.async_update_listeners()
+        self._async_publish()
 
     async def async_sync_device_clock(self) -> None:
         """Synchronize the device RTC with HA local time immediately."""
-        await self.hass.async_add_executor_job(
-            self._fan.set_rtc_datetime,
-            dt_util.now().replace(tzinfo=None),
-        )
+        await self._fan.async_set_rtc_datetime(dt_util.now().replace(tzinfo=None))
         self._last_clock_sync = dt_util.now()
-        await self.async_refresh()
+        await self.async_request_refresh()
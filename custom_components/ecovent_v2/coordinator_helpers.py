@@ -0,0 +1,105 @@
+"""Home Assistant independent helpers for the EcoVent update coordinator."""
+
+import asyncio
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Coordinator state keys notified alongside changed parameter ids.
+SCHEDULE = "schedule"
+TRANSPORT = "transport"
+
+# Listener context of entities showing transport counters, which change on
+# every poll whether or not a parameter did.
+TRANSPORT_CONTEXT = frozenset({TRANSPORT})
+
+
+class ListenerChanges:
+    """Coordinator state changed since listeners were last notified.
+
+    Parameter changes are tracked by the fan; this adds keys such as
+    ``SCHEDULE`` for state the coordinator keeps itself (cached schedule
+    records, the selected editor day).
+    """
+
+    def __init__(self):
+        self._keys = set()
+
+    def mark(self, key):
+        self._keys.add(key)
+
+    def pop(self, params):
+        """Return ``params`` plus the marked keys and reset them.
+
+        ``params`` is the fan's ``pop_changed_params()`` result; ``None``
+        (every listener must update) is passed through.
+        """
+        keys, self._keys = self._keys, set()
+        if params is None:
+            return None
+        return params | keys
+
+
+class TrailingCall:
+    """Run ``function`` once, ``cooldown`` seconds after the first of a burst.
+
+    Calls made while a run is pending join it; a call after the run started
+    schedules the next one.
+    """
+
+    def __init__(self, cooldown, function):
+        self._cooldown = cooldown
+        self._function = function
+        self._task = None
+
+    async def async_call(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._async_run())
+
+    async def _async_run(self):
+        await asyncio.sleep(self._cooldown)
+        self._task = None
+        try:
+            await self._function()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error running %s", self._function)
+
+    def cancel(self):
+        """Drop the pending run, if any."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+def listener_should_update(context, changed):
+    """Return whether a listener with ``context`` renders anything in ``changed``.
+
+    Listeners without a context update whenever anything changed; transport
+    listeners update on every notification.
+    """
+    if context is None:
+        return bool(changed)
+    return TRANSPORT in context or not changed.isdisjoint(context)
+
+
+def polling_bounds(update_seconds, min_seconds, max_seconds):
+    """Return the ``(minimum, maximum)`` adaptive polling interval in seconds.
+
+    Without a configured minimum the entry's update interval is used, so
+    entries created before adaptive polling keep their rate while active.
+    """
+    minimum = update_seconds if min_seconds is None else min_seconds
+    return minimum, max(minimum, max_seconds)
+
+
+def next_update_interval(current, minimum, maximum, active, off):
+    """Return the polling interval after a successful poll.
+
+    An active device polls at ``minimum``; one that is off and steady drops
+    straight to ``maximum``; otherwise the interval doubles up to ``maximum``.
+    """
+    if active:
+        return minimum
+    if off:
+        return maximum
+    return min(current * 2, maximum)
@@ -0,0 +1,42 @@
+"""Diagnostics support for EcoVent_v2."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import EcoVentCoordinator
+
+TO_REDACT = {CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return device, polling and transport diagnostics of a config entry."""
+    coordinator: EcoVentCoordinator = hass.data[DOMAIN][entry.entry_id]
+    fan = coordinator._fan
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "device": {
+            "id": fan.id,
+            "unit_type": fan.unit_type,
+            "profile": fan.profile_key,
+            "firmware": fan.firmware,
+            "unknown_params": {
+                f"{param_id:04x}": value
+                for param_id, value in fan.unknown_params.items()
+            },
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "update_count": coordinator.updateCounter,
+        },
+        "transport": fan.transport_stats,
+    }
@@ -1,5 +1,6 @@
 """Library to handle communication with Wifi ecofan from TwinFresh / Blauberg."""
 
+import asyncio
 import logging
 
 __version__ = "loc_0.9.29"
@@ -8,6 +9,7 @@ _LOGGER = logging.getLogger(__name__)
 
 try:
     from . import protocol_maps
+    from .fan_async_protocol import FanAsyncProtocolMixin
     from .fan_breezy_properties import FanBreezyPropertiesMixin
     from .fan_capabilities import FanCapabilitiesMixin
     from .fan_controls import FanControlsMixin
@@ -18,8 +20,11 @@ try:
     from .fan_protocol_parse import FanProtocolParseMixin
     from .fan_speed_properties import FanSpeedPropertiesMixin
     from .protocol_profiles import DEVICE_MODELS, DEVICE_PROFILES
+    from .protocol_state import ParamStore
+    from .protocol_transport import RttEstimator, TransportMetrics
 except ImportError:
     import protocol_maps
+    from fan_async_protocol import FanAsyncProtocolMixin
     from fan_breezy_properties import FanBreezyPropertiesMixin
     from fan_capabilities import FanCapabilitiesMixin
     from fan_controls import FanControlsMixin
@@ -30,6 +35,8 @@ except ImportError:
     from fan_protocol_parse import FanProtocolParseMixin
     from fan_speed_properties import FanSpeedPropertiesMixin
     from protocol_profiles import DEVICE_MODELS, DEVICE_PROFILES
+    from protocol_state import ParamStore
+    from protocol_transport import RttEstimator, TransportMetrics
 
 """"
 # currently having entities in HA:
@@ -98,6 +105,7 @@ Sw used for switch
 
 
 class Fan(
+    FanAsyncProtocolMixin,
     FanCapabilitiesMixin,
     FanControlsMixin,
     FanCorePropertiesMixin,
@@ -154,6 +162,7 @@ class Fan(
     breezy_write_params = protocol_maps.breezy_write_params
     freshbox_write_params = protocol_maps.freshbox_write_params
     arc_write_params = protocol_maps.arc_write_params
+    write_dependencies = protocol_maps.write_dependencies
 
     device_profiles = DEVICE_PROFILES
     device_models = DEVICE_MODELS
@@ -163,133 +172,22 @@ class Fan(
     _port = None
     _id = None
     _password = None
-    _state = None
-    _speed = None
-    _boost_status = None
-    _heater_status = None
-    _timer_mode = None
-    _timer_counter = None
-    _humidity_sensor_state = None
-    _relay_sensor_state = None
-    _analogV_sensor_state = None
-    _humidity_treshold = None
-    _battery_voltage = None
-    _humidity = None
-    _analogV = None
-    _relay_status = None
-    _supply_speed_low = None
-    _exhaust_speed_low = None
-    _supply_speed_medium = None
-    _exhaust_speed_medium = None
-    _supply_speed_high = None
-    _exhaust_speed_high = None
-    _man_speed = None
-    _fan1_speed = None
-    _fan2_speed = None
-    _filter_timer_setpoint = None
-    _filter_timer_countdown = None
-    _boost_time = None
     _rtc_time = None
     _rtc_date = None
     _rtc_weekday = None
-    _weekly_schedule_state = None
     _weekly_schedule_setup = None
     _weekly_schedule_setup_record = None
     _device_search = None
     _device_password = None
-    _machine_hours = None
-    _alarm_status = None
-    _cloud_server_state = None
     _firmware = None
-    _filter_replacement_status = None
-    _wifi_operation_mode = None
     _wifi_name = None
     _wifi_pasword = None
-    _wifi_enc_type = None
-    _wifi_freq_channel = None
-    _wifi_dhcp = None
-    _wifi_assigned_ip = None
-    _wifi_assigned_netmask = None
-    _wifi_main_gateway = None
-    _current_wifi_ip = None
-    _airflow = None
-    _analogV_treshold = None
     _unit_type = None
     _unit_type_id = None
-    _night_mode_timer = None
-    _party_mode_timer = None
-    _humidity_status = None
-    _analogV_status = None
-    _beeper = None
     _unknown_params = None
     _profile_key = "vento"
-    _battery_status = None
-    _low_battery_status = None
-    _all_day_mode = None
-    _boost_timer_countdown = None
-    _timer_status = None
-    _temperature_status = None
-    _motion_status = None
-    _light_status = None
-    _interval_ventilation_status = None
-    _silent_mode_status = None
-    _temperature_sensor_state = None
-    _motion_sensor_state = None
-    _light_sensor_state = None
-    _air_quality_sensor_state = None
-    _humidity_airflow = None
-    _motion_light_airflow = None
-    _air_quality_airflow = None
-    _interval_ventilation_airflow = None
-    _all_day_airflow = None
-    _temperature_airflow = None
-    _temperature_treshold = None
-    _max_speed_setpoint = None
-    _silent_speed_setpoint = None
-    _interval_ventilation_speed_setpoint = None
-    _interval_ventilation_state = None
-    _silent_mode_state = None
-    _silent_mode_start_time = None
-    _silent_mode_end_time = None
-    _turn_on_delay_timer = None
-    _temperature = None
-    _room_temperature = None
-    _air_quality = None
-    _air_quality_treshold = None
-    _co2_sensor_state = None
-    _co2_treshold = None
-    _co2 = None
-    _outdoor_temperature = None
-    _supply_temperature = None
-    _exhaust_in_temperature = None
-    _exhaust_out_temperature = None
-    _heater_state = None
     _alarm_list = None
     _air_quality_status = None
-    _recovery_efficiency = None
-    _schedule_speed = None
-    _frost_protection_status = None
-    _voc_sensor_state = None
-    _voc_treshold = None
-    _voc = None
-    _screen_brightness = None
-    _screen_backlight_mode = None
-    _screen_temperature_source = None
-    _screen_air_quality_source = None
-    _screen_display_mode = None
-    _screen_standby_time_state = None
-    _screen_display_state = None
-    _screen_off_start_time = None
-    _screen_off_end_time = None
-    _boost_switch_status = None
-    _fire_alarm_status = None
-    _supply_speed_4 = None
-    _exhaust_speed_4 = None
-    _supply_speed_5 = None
-    _exhaust_speed_5 = None
-    _wifi_module_status = None
-    _wifi_connection_status = None
-    _heater_blowing_status = None
 
     def __init__(
         self,
@@ -307,7 +205,17 @@ class Fan(
         self._pwd_size = 0
         self._password = password
         self._unknown_params = {}
+        self._store = ParamStore()
+        self._written_params = set()
+        self._changed_params = set()
+        self._all_params_changed = True
         self.socket = None
+        self._endpoint = None
+        self._async_request_lock = asyncio.Lock()
+        self._rtt = RttEstimator(self.RESPONSE_TIMEOUT)
+        self._metrics = TransportMetrics()
+        self._retry_budget = None
+        self._retry_budget_spent = False
         self._bulk_read_supported = None
         self._profile_key = "vento"
         self._set_device_profile("vento")
@@ -14,6 +14,7 @@ from .const import SERVICE_FILTER_TIMER_RESET
 from .const import SERVICE_RESET_ALARMS
 from .const import DOMAIN
 from .coordinator import EcoVentCoordinator
+from .ecoventv2 import Fan
 
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -58,7 +59,6 @@ class VentoExpertFan(CoordinatorEntity, FanEntity):
         coordinator: EcoVentCoordinator = hass.data[DOMAIN][config.entry_id]
         super().__init__(coordinator)
 
-        self._fan = coordinator._fan
         # self._percentage = self._fan.man_speed we use fan object directly otherwise we would miss changes from fan changes via remote or direct control
         self._attr_unique_id = self._fan.id
         self._attr_name = self._fan.name
@@ -88,6 +88,11 @@ class VentoExpertFan(CoordinatorEntity, FanEntity):
             configuration_url=f"http://{self._fan.current_wifi_ip}",
         )
 
+    @property
+    def _fan(self) -> Fan:
+        """Return the read-only fan state of the last coordinator update."""
+        return self.coordinator.data
+
     @property
     def extra_state_attributes(self):
         """Return extra state attributes."""
@@ -134,9 +139,10 @@ class VentoExpertFan(CoordinatorEntity, FanEntity):
             return "off"
         return self._fan.speed
 
-    def _set_param_if_changed(self, name: str, target: Any) -> bool:
-        """Write a device parameter only when it actually changes."""
-        current = getattr(self._fan, name)
+    def _queue_if_changed(self, writes: dict[str, Any], name: str, target: Any) -> bool:
+        """Queue a device parameter write only when it actually changes."""
+        pending = self.coordinator.pending_writes
+        current = writes.get(name, pending.get(name, getattr(self._fan, name)))
         if current == target:
             _LOGGER.debug(
                 "Skipping unchanged %s command for %s: %s",
@@ -146,13 +152,23 @@ class VentoExpertFan(CoordinatorEntity, FanEntity):
             )
             return False
 
-        self._fan.set_param(name, target)
+        writes[name] = target
         return True
 
-    def _set_manual_percentage_if_changed(self, percentage: int) -> bool:
-        """Write manual speed percentage only when it actually changes."""
+    def _queue_manual_percentage_if_changed(
+        self, writes: dict[str, Any], percentage: int
+    ) -> bool:
+        """Queue a manual speed percentage write only when it actually changes."""
         target_percentage = max(2, percentage)
-        if self._fan.man_speed == target_percentage:
+        value = self._fan._man_speed_percent_value(target_percentage)
+        pending = writes.get(
+            "man_speed", self.coordinator.pending_writes.get("man_speed")
+        )
+        if pending is not None:
+            unchanged = pending == value
+        else:
+            unchanged = self._fan.man_speed == target_percentage
+        if unchanged:
             _LOGGER.debug(
                 "Skipping unchanged manual speed command for %s: %s%%",
                 self._fan.name,
@@ -160,7 +176,9 @@ class VentoExpertFan(CoordinatorEntity, FanEntity):
             )
             return False
 
-        self._fan.set_man_speed_percent(target_percentage)
+        if value is None:
+            return False
+        writes["man_speed"] = value
         return True
 
     @property
@@ -209,107 +227,101 @@ class VentoExpertFan(CoordinatorEntity, FanEntity):
         ):
             preset_mode = speed
 
+        writes: dict[str, Any] = {}
         if preset_mode is not None:
-            await self.hass.async_add_executor_job(
-                self.set_preset_mode,
-                preset_mode,
-                True,
-            )
+            self._queue_preset_mode(writes, preset_mode, True)
         if percentage is not None:
-            await self.hass.async_add_executor_job(
-                self.set_percentage,
-                percentage,
-                True,
-            )
-
+            self._queue_percentage(writes, percentage, True)
         if preset_mode is None and percentage is None:
-            await self.hass.async_add_executor_job(
-                self._set_param_if_changed, "state", "on"
-            )
-        await self.coordinator.async_refresh()
+            self._queue_if_changed(writes, "state", "on")
+        await self.coordinator.async_write_params(writes)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the entity."""
-        await self.hass.async_add_executor_job(
-            self._set_param_if_changed, "state", "off"
-        )
-        await self.coordinator.async_refresh()
+        writes: dict[str, Any] = {}
+        self._queue_if_changed(writes, "state", "off")
+        await self.coordinator.async_write_params(writes)
 
-    def set_preset_mode(self, preset_mode: str, turn_on: bool = True) -> None:
-        """Set the preset mode of the fan."""
+    def _queue_preset_mode(
+        self, writes: dict[str, Any], preset_mode: str, turn_on: bool = True
+    ) -> None:
+        """Queue the writes that select a preset mode."""
         if preset_mode == "off":
-            self._set_param_if_changed("state", "off")
+            self._queue_if_changed(writes, "state", "off")
             return
 
         if self._fan.uses_operating_mode_presets:
             if turn_on:
-                self._set_param_if_changed("state", "on")
-            self._fan.set_operating_mode_preset(preset_mode)
+                self._queue_if_changed(writes, "state", "on")
+            writes.update(self._fan._operating_mode_preset_values(preset_mode))
             return
 
         if preset_mode in self.preset_modes:
-            state_changed = False
             if turn_on:
-                state_changed = self._set_param_if_changed("state", "on")
-            speed_changed = self._set_param_if_changed("speed", preset_mode)
-            if preset_mode != "manual" and (state_changed or speed_changed):
-                self._fan.update_preset_speed_settings()
+                self._queue_if_changed(writes, "state", "on")
+            self._queue_if_changed(writes, "speed", preset_mode)
         else:
             raise ValueError(f"Invalid preset mode: {preset_mode}")
 
+    async def _async_set_preset_mode(
+        self, preset_mode: str, turn_on: bool = True
+    ) -> None:
+        """Set the preset mode of the fan."""
+        writes: dict[str, Any] = {}
+        self._queue_preset_mode(writes, preset_mode, turn_on)
+        await self.coordinator.async_write_params(writes)
+
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode of the fan."""
-        await self.hass.async_add_executor_job(self.set_preset_mode, preset_mode, True)
-        await self.coordinator.async_refresh()
+        await self._async_set_preset_mode(preset_mode, True)
 
-    def set_percentage(self, percentage: int, turn_on: bool = True) -> None:
-        """Set the speed of the fan, as a percentage."""
+    def _queue_percentage(
+        self, writes: dict[str, Any], percentage: int, turn_on: bool = True
+    ) -> None:
+        """Queue the writes that set the speed as a percentage."""
         if percentage <= 0:
-            self._set_param_if_changed("state", "off")
+            self._queue_if_changed(writes, "state", "off")
             return
 
         if turn_on:
-            self._set_param_if_changed("state", "on")
+            self._queue_if_changed(writes, "state", "on")
 
         if self._fan.uses_operating_mode_presets:
-            self._fan.set_speed_setpoint_percent(percentage)
+            writes.update(self._fan._speed_setpoint_percent_values(percentage))
             return
 
-        self._set_param_if_changed("speed", "manual")
-        self._set_manual_percentage_if_changed(percentage)
+        self._queue_if_changed(writes, "speed", "manual")
+        self._queue_manual_percentage_if_changed(writes, percentage)
+
+    async def _async_set_percentage(
+        self, percentage: int, turn_on: bool = True
+    ) -> None:
+        """Set the speed of the fan, as a percentage."""
+        writes: dict[str, Any] = {}
+        self._queue_percentage(writes, percentage, turn_on)
+        await self.coordinator.async_write_params(writes)
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed of the fan, as a percentage."""
-        await self.hass.async_add_executor_job(self.set_percentage, percentage, True)
-        await self.coordinator.async_refresh()
+        await self._async_set_percentage(percentage, True)
 
     async def async_set_direction(self, direction: str) -> None:
         """Set the direction of the fan."""
+        writes: dict[str, Any] = {}
         if direction == "forward":
-            await self.hass.async_add_executor_job(
-                self._set_param_if_changed,
-                "airflow",
-                "ventilation",
-            )
+            self._queue_if_changed(writes, "airflow", "ventilation")
         elif direction == "reverse":
-            await self.hass.async_add_executor_job(
-                self._set_param_if_changed,
-                "airflow",
-                "air_supply",
-            )
+            self._queue_if_changed(writes, "airflow", "air_supply")
         else:
             raise ValueError(f"Invalid direction: {direction}")
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_write_params(writes)
 
     async def async_oscillate(self, oscillating: bool) -> None:
         """Set oscillation."""
         target_airflow = "heat_recovery" if oscillating else "ventilation"
-        await self.hass.async_add_executor_job(
-            self._set_param_if_changed,
-            "airflow",
-            target_airflow,
-        )
-        await self.coordinator.async_refresh()
+        writes: dict[str, Any] = {}
+        self._queue_if_changed(writes, "airflow", target_airflow)
+        await self.coordinator.async_write_params(writes)
         # self.schedule_update_ha_state()
 
     ###### Custom services
@@ -317,13 +329,11 @@ class VentoExpertFan(CoordinatorEntity, FanEntity):
     # Reset filter timer
     async def async_reset_filter_timer(self, fan_target) -> None:
         """Reset Fan's filter timer."""
-        await self.hass.async_add_executor_job(
-            self._fan.set_param, "filter_timer_reset", ""
-        )
-        await self.coordinator.async_refresh()
+        await self.coordinator._fan.async_set_param("filter_timer_reset", "")
+        await self.coordinator.async_write_completed()
 
     # Reset alarms
     async def async_reset_alarms(self, fan_target) -> None:
         """Reset Fan's Alarms."""
-        await self.hass.async_add_executor_job(self._fan.set_param, "reset_alarms", "")
-        await self.coordinator.async_refresh()
+        await self.coordinator._fan.async_set_param("reset_alarms", "")
+        await self.coordinator.async_write_completed()
@@ -0,0 +1,232 @@
+"""EcoVent Fan mixin with awaitable protocol requests."""
+
+import asyncio
+from datetime import datetime
+import logging
+
+try:
+    from .protocol_transport import async_open_endpoint
+    from .schedule_helpers import WeeklyScheduleRecord
+except ImportError:
+    from protocol_transport import async_open_endpoint
+    from schedule_helpers import WeeklyScheduleRecord
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FanAsyncProtocolMixin:
+    """Event-loop native counterparts of the blocking request helpers.
+
+    Request building and response parsing are shared with the synchronous
+    methods; only the socket wait differs, so no executor thread is held while a
+    device is slow to answer.
+    """
+
+    async def async_do_func(self, func, param, value="", retries=10):
+        _LOGGER.debug(f"Executing function {func} with param {param} and value {value}")
+        data = self._encode_request(func, param, value)
+        return await self._async_do_request(
+            data, self._request_param_ids(param), retries
+        )
+
+    async def _async_do_request(self, data, expected, retries=10, frame=None):
+        payload = self.encode_frame(data) if frame is None else frame
+        loop = asyncio.get_running_loop()
+        async with self._async_request_lock:
+            self._metrics.requests += 1
+            self._rtt.start_request()
+            deadline = loop.time() + self.RESPONSE_TIMEOUT * retries
+            for attempt in range(retries):
+                if attempt and not self._consume_retry(data):
+                    return False
+                endpoint = await self._async_connect()
+                if endpoint is None:
+                    return False
+                endpoint.device_id = self._id
+                if not attempt:
+                    endpoint.discard_pending()
+                elif await self._async_receive_reply(endpoint, expected, 0):
+                    # The previous attempt was answered after its timeout.
+                    return True
+                wait = self._request_wait(deadline, loop.time())
+                if not wait:
+                    return False
+                if not endpoint.send(payload):
+                    self.async_disconnect()
+                    continue
+                self._metrics.sent(payload)
+                sent_at = loop.time()
+                if await self._async_receive_reply(endpoint, expected, wait):
+                    if not attempt:
+                        rtt = loop.time() - sent_at
+                        self._rtt.sample(rtt)
+                        self._metrics.rtt(rtt)
+                    return True
+                self._rtt.expired()
+            return False
+
+    async def _async_receive_reply(self, endpoint, expected, timeout):
+        """Apply the first reply answering ``expected`` within ``timeout``."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            response = await endpoint.receive(max(0, deadline - loop.time()))
+            if response is None:
+                return False
+            self._metrics.received(response)
+            if self.parse_response(response, expected):
+                return True
+            _LOGGER.debug("EcoVentV2: ignoring unmatched reply from %s", self._host)
+
+    async def _async_connect(self):
+        """Return this device's route on the shared endpoint, opening it when needed."""
+        if self._endpoint is None or not self._endpoint.is_open:
+            self._endpoint = await async_open_endpoint(self._host, self._port)
+        return self._endpoint
+
+    def async_disconnect(self):
+        """Leave the shared endpoint; the next request registers again."""
+        if self._endpoint is not None:
+            self._endpoint.close()
+            self._endpoint = None
+
+    async def async_init_device(self):
+        if self._id == "DEFAULT_DEVICEID":
+            await self.async_get_param("device_search")
+            self._id = self.device_search
+        _LOGGER.debug("EcoventV2: Initialized fan with ID: %s", self._id)
+        if not self._id:
+            return False
+        await self.async_get_param("unit_type")
+        self._apply_device_profile()
+        return await self.async_update()
+
+    async def async_update(self):
+        return await self._async_read_params(self._update_request())
+
+    async def async_update_tiers(self, tiers):
+        """Read the parameters of the given polling tiers in one request."""
+        request = self._tier_request(tiers)
+        if not request:
+            return True
+        return await self._async_read_params(request)
+
+    async def async_quick_update(self):
+        return await self._async_read_params(self.device_profile.quick_update_request)
+
+    async def async_update_preset_speed_settings(self):
+        if not self.supports_preset_speed_settings:
+            return True
+
+        return await self._async_read_params(self.PRESET_SPEED_SETTINGS_REQUEST)
+
+    async def _async_read_params(self, request):
+        if self._bulk_read_supported is not False:
+            data, expected, frame = self._compiled_read(request)
+            self._retry_budget_spent = False
+            if await self._async_do_request(data, expected, retries=3, frame=frame):
+                self._bulk_read_supported = True
+                return True
+            if self._retry_budget_spent:
+                # Out of retries for this cycle, not evidence against bulk reads.
+                return False
+
+        self._bulk_read_supported = False
+        self._metrics.bulk_read_fallbacks += 1
+        success = False
+        for i in range(0, len(request), 4):
+            success = (
+                await self.async_do_func(
+                    self.func["read"], request[i : i + 4], retries=1
+                )
+                or success
+            )
+        return success
+
+    async def async_read_write_dependencies(self):
+        """Read back only the values that recent writes may have changed."""
+        request = self.write_dependencies_request()
+        if not request:
+            return True
+        return await self._async_read_params(request)
+
+    async def async_get_param(self, param):
+        request = self._param_read_request(param)
+        if request is None:
+            return False
+        return await self.async_do_func(self.func["read"], request)
+
+    async def async_set_param(self, param, value):
+        request = self._param_write_request(param, value)
+        if request is None:
+            return False
+        return self._record_written(
+            (param,), await self.async_do_func(self.func["write_return"], *request)
+        )
+
+    async def async_set_params(self, values):
+        """Write several profile-mapped parameters in one command.
+
+        Return whether the device echoed the write.
+        """
+        request = self._params_write_frame(values)
+        if not request:
+            return False
+        return self._record_written(values, await self._async_do_request(*request))
+
+    async def async_set_man_speed_percent(self, speed):
+        value = self._man_speed_percent_value(speed)
+        if value is None:
+            return False
+        return self._record_written(
+            ("man_speed",),
+            await self.async_do_func(self.func["write_return"], "0044", value),
+        )
+
+    async def async_set_speed_setpoint_percent(self, percentage):
+        """Set speed setpoints used by autonomous operating modes."""
+        for param, value in self._speed_setpoint_percent_values(percentage).items():
+            await self.async_set_param(param, value)
+
+    async def async_set_operating_mode_preset(self, preset_mode):
+        """Activate one autonomous operating mode and disable the others."""
+        return await self.async_set_params(
+            self._operating_mode_preset_values(preset_mode)
+        )
+
+    async def async_read_weekly_schedule_record(self, day, period):
+        """Read one weekly schedule period via the special 0x0077 request."""
+        request_value = self._weekly_schedule_read_value(day, period)
+        if request_value is None:
+            return None
+
+        self._weekly_schedule_setup_record = None
+        if not await self.async_do_func(self.func["read"], "0077", request_value):
+            return None
+        return self._weekly_schedule_setup_record
+
+    async def async_read_weekly_schedule_day(self, day):
+        """Read all four schedule periods for a day."""
+        records = {}
+        for period in range(1, 5):
+            record = await self.async_read_weekly_schedule_record(day, period)
+            if record is not None:
+                records[period] = record
+        return records
+
+    async def async_write_weekly_schedule_record(self, record):
+        """Write one weekly schedule period via 0x0077."""
+        if not isinstance(record, WeeklyScheduleRecord):
+            raise TypeError("record must be a WeeklyScheduleRecord")
+        return await self.async_do_func(
+            self.func["write_return"], "0077", record.to_hex_payload()
+        )
+
+    async def async_set_rtc_datetime(self, value: datetime):
+        """Write the device RTC using local calendar/time rows."""
+        values = self._rtc_datetime_values(value)
+        if values is None:
+            return False
+
+        return await self.async_set_params(values)
@@ -3,13 +3,21 @@
 import logging
 
 try:
+    from .protocol_decoders import compile_decoders
+    from .protocol_metadata import ACTIVITY_NOISE_PARAMS
+    from .protocol_state import profile_layout
     from .schedule_helpers import SCHEDULE_SPEED_ICONS, SCHEDULE_SPEED_TO_OPTION
 except ImportError:
+    from protocol_decoders import compile_decoders
+    from protocol_metadata import ACTIVITY_NOISE_PARAMS
+    from protocol_state import profile_layout
     from schedule_helpers import SCHEDULE_SPEED_ICONS, SCHEDULE_SPEED_TO_OPTION
 
 
 _LOGGER = logging.getLogger(__name__)
 
+_profile_indexes = {}
+
 
 class FanCapabilitiesMixin:
     @property
@@ -52,6 +60,24 @@ class FanCapabilitiesMixin:
         """Return whether speed maps to autonomous operating modes."""
         return self.device_profile.uses_operating_mode_presets
 
+    @property
+    def timer_running(self):
+        """Return whether a boost or timer mode is counting down."""
+        return (
+            self.boost_status in ("on", "delay")
+            or self.timer_mode in ("night", "party")
+            or self.timer_status == "on"
+        )
+
+    def activity_values(self):
+        """Return the fast-tier values whose change means the device is active."""
+        values = {}
+        for index in self._request_param_ids(self._tier_request({"fast"})):
+            name = self.params[index][0]
+            if name not in ACTIVITY_NOISE_PARAMS:
+                values[name] = getattr(self, name, None)
+        return values
+
     def supports_capability(self, capability):
         """Return whether the active profile declares a named capability."""
         return capability in self.device_profile.capabilities
@@ -88,7 +114,7 @@ class FanCapabilitiesMixin:
         if index is None:
             return None
 
-        param = self.params.get(index) or self.write_params.get(index)
+        param = self._param_specs[index]
         if param[1] is None:
             return None
         return list(param[1].values())
@@ -133,23 +159,26 @@ class FanCapabilitiesMixin:
         """Return a profile-specific enum map by class attribute name."""
         return getattr(type(self), enum_name)
 
-    def _decode_uint(self, input, byteorder="little"):
-        """Decode unsigned protocol integers from hex payload bytes."""
-        return int.from_bytes(bytes.fromhex(input), byteorder=byteorder, signed=False)
+    def _raw_bytes(self, input):
+        """Return payload bytes; hex strings are still accepted for manual sets."""
+        if isinstance(input, str):
+            return bytes.fromhex(input)
+        return input
 
-    def _decode_signed_temperature(self, input):
-        """Decode Breezy/Freshpoint signed tenths-of-degree temperature values."""
-        value = int.from_bytes(bytes.fromhex(input), byteorder="little", signed=True)
-        if value in (-32768, 32767):
-            return None
-        return round(value / 10, 1)
+    def _decode_int(self, input):
+        """Decode a payload as one big-endian unsigned integer."""
+        return int.from_bytes(self._raw_bytes(input), byteorder="big", signed=False)
 
-    def _decode_time_minutes_hours(self, input):
-        """Decode two-byte minute/hour protocol time into HH:MM text."""
-        value = bytes.fromhex(input)
-        if len(value) < 2:
-            return None
-        return f"{value[1]:02d}:{value[0]:02d}"
+    def _decode_bytes(self, input, size):
+        """Return a payload left-padded with zero bytes to ``size`` bytes."""
+        raw = self._raw_bytes(input)
+        if len(raw) > size:
+            return self._decode_int(raw).to_bytes(size, "big")
+        return bytes(size - len(raw)) + bytes(raw)
+
+    def _decode_text(self, input):
+        """Decode a payload holding single-byte characters."""
+        return bytes(self._raw_bytes(input)).decode("latin-1")
 
     def _set_device_profile(self, profile_key):
         """Apply protocol maps for the selected device family."""
@@ -158,12 +187,70 @@ class FanCapabilitiesMixin:
         if previous_profile != profile_key:
             _LOGGER.info("EcoVentV2: using %s parameter profile", profile_key)
 
+        previous_specs = getattr(self, "_param_specs", {})
+        previous_decoders = getattr(self, "_decoders", None)
         self._profile_key = profile_key
-        self.params = getattr(type(self), profile.params_name).copy()
-        self.write_params = getattr(type(self), profile.write_params_name).copy()
-        self._write_only_params = set(self.write_params)
+        # Profile maps and their indexes are shared, never mutated per device.
+        self.params = getattr(type(self), profile.params_name)
+        self.write_params = getattr(type(self), profile.write_params_name)
+        self._index_params()
+        self._decoders = compile_decoders(self, self.params)
+        layout = profile_layout((type(self), profile_key), self._decoders)
+        if self._store.layout is not layout:
+            # Keep values only for ids that still name the same parameter.
+            self._store = self._store.rebind(
+                layout,
+                (
+                    param_id
+                    for param_id, spec in self._param_specs.items()
+                    if previous_specs.get(param_id, (None,))[0] == spec[0]
+                ),
+            )
+        if self._decoders is not previous_decoders:
+            # Tables are shared per profile, so identity tracks a real change;
+            # a repeated unit_type decode keeps the compiled requests.
+            self._full_update_request = None
+            self._tier_requests = {}
+            self._compiled_reads = {}
         if previous_profile != profile_key:
             self._bulk_read_supported = None
+            self._all_params_changed = True
+
+    def _index_params(self):
+        """Bind name and enum-value lookups for the active parameter maps.
+
+        Read parameters win over write-only ones, and the first id or raw value
+        listed for a name wins, as with the linear scans these replace. The
+        lookups only depend on class-level maps, so they are built once per
+        class and profile.
+        """
+        key = (type(self), self._profile_key)
+        indexes = _profile_indexes.get(key)
+        if indexes is None:
+            indexes = _profile_indexes[key] = self._build_param_indexes()
+        (
+            self._param_ids,
+            self._param_specs,
+            self._param_raw_values,
+            self._write_only_params,
+        ) = indexes
+
+    def _build_param_indexes(self):
+        param_ids = {}
+        param_specs = {}
+        param_raw_values = {}
+        for params in (self.params, self.write_params):
+            for index, param in params.items():
+                param_specs.setdefault(index, param)
+                if param[0] in param_ids:
+                    continue
+                param_ids[param[0]] = index
+                if param[1] is not None:
+                    raw_values = {}
+                    for raw, value in param[1].items():
+                        raw_values.setdefault(value, raw)
+                    param_raw_values[param[0]] = raw_values
+        return param_ids, param_specs, param_raw_values, frozenset(self.write_params)
 
     def _apply_device_profile(self):
         """Select parameter meanings after reading the model id."""
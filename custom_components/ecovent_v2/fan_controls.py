@@ -2,6 +2,7 @@
 
 import math
 
+
 class FanControlsMixin:
     def set_state_on(self):
         request = "0001"
@@ -22,14 +23,22 @@ class FanControlsMixin:
             self.do_func(self.func["write_return"], request, value)
 
     def set_man_speed_percent(self, speed):
+        value = self._man_speed_percent_value(speed)
+        if value is None:
+            return False
+        return self._record_written(
+            ("man_speed",), self.do_func(self.func["write_return"], "0044", value)
+        )
+
+    def _man_speed_percent_value(self, speed):
+        """Return the encoded manual speed row value for a HA percentage."""
         if speed >= 2 and speed <= 100:
-            request = "0044"
             if self.device_profile.speed_percent_scale == "percent":
                 value = speed
             else:
                 value = math.ceil(255 / 100 * speed)
-            value = hex(value).replace("0x", "").zfill(2)
-            self.do_func(self.func["write_return"], request, value)
+            return hex(value).replace("0x", "").zfill(2)
+        return None
 
     #            request = "0002"
     #            value = "ff"
@@ -76,15 +85,26 @@ class FanControlsMixin:
 
     def set_speed_setpoint_percent(self, percentage):
         """Set speed setpoints used by autonomous operating modes."""
+        for param, value in self._speed_setpoint_percent_values(percentage).items():
+            self.set_param(param, value)
+
+    def _speed_setpoint_percent_values(self, percentage):
+        """Return the ordered rows written for an operating-mode percentage."""
         target = max(30, min(100, int(percentage)))
         value = hex(target).replace("0x", "").zfill(2)
-        self.set_param("max_speed_setpoint", value)
-        self.set_param("interval_ventilation_speed_setpoint", value)
-        self.set_param("all_day_mode", "on")
-        self.set_param("silent_mode_state", "off")
+        return {
+            "max_speed_setpoint": value,
+            "interval_ventilation_speed_setpoint": value,
+            "all_day_mode": "on",
+            "silent_mode_state": "off",
+        }
 
     def set_operating_mode_preset(self, preset_mode):
         """Activate one autonomous operating mode and disable the others."""
+        return self.set_params(self._operating_mode_preset_values(preset_mode))
+
+    def _operating_mode_preset_values(self, preset_mode):
+        """Return the rows that select one autonomous operating mode."""
         reset = {
             "all_day_mode": "off",
             "humidity_sensor_state": "off",
@@ -111,4 +131,4 @@ class FanControlsMixin:
             raise ValueError(f"Invalid operating-mode preset: {preset_mode}")
 
         reset.update(target)
-        self.set_params(reset)
+        return reset
@@ -3,10 +3,13 @@
 from datetime import datetime
 import logging
 import socket
+import time
 
 try:
+    from . import protocol_codec
     from .schedule_helpers import WeeklyScheduleRecord
 except ImportError:
+    import protocol_codec
     from schedule_helpers import WeeklyScheduleRecord
 
 
@@ -14,6 +17,10 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class FanProtocolMixin:
+    PRESET_SPEED_SETTINGS_REQUEST = "003A003B003C003D003E003F"
+    RESPONSE_TIMEOUT = 0.4
+    RETRY_BUDGET = 20
+
     def search_devices(self, addr="0.0.0.0", port=4000):
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
@@ -24,11 +31,9 @@ class FanProtocolMixin:
             ips = []
             target_host = self._host or "<broadcast>"
             target_port = self._port or port
-            payload = bytes.fromhex(
-                self.build_packet(
-                    self.func["read"] + self.encode_params("007c"),
-                    fan_id="DEFAULT_DEVICEID",
-                )
+            payload = self.encode_frame(
+                bytes.fromhex(self.func["read"]) + protocol_codec.encode_param(0x007C),
+                fan_id="DEFAULT_DEVICEID",
             )
             i = 10
             while i > 1:
@@ -52,54 +57,132 @@ class FanProtocolMixin:
             sock.close()
 
     def connect(self):
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        self.socket.settimeout(0.4)
-        self._socket_connected = False
-        while not self._socket_connected:
-            try:
-                self.socket.connect((self._host, self._port))
-                return self.socket
-            except OSError:
-                self.socket.close()
-                return None
+        """Return the long-lived connected socket, creating it when needed."""
+        if self.socket is not None:
+            return self.socket
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.settimeout(self.RESPONSE_TIMEOUT)
+            sock.connect((self._host, self._port))
+        except (OSError, TypeError):
+            sock.close()
+            return None
+        self.socket = sock
+        return self.socket
+
+    def disconnect(self):
+        """Close the blocking socket; the next request opens a new one."""
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    def close(self):
+        """Release every socket held for this device."""
+        self.disconnect()
+        self.async_disconnect()
+
+    def _discard_pending(self):
+        """Drop stale datagrams, e.g. late replies to an abandoned request."""
+        if self.socket is None:
+            return
+        try:
+            self.socket.setblocking(False)
+            while True:
+                self.socket.recv(1024)
+        except OSError:
+            pass
+        finally:
+            self.socket.settimeout(self.RESPONSE_TIMEOUT)
+
+    def reset_retry_budget(self, budget=None):
+        """Allow ``budget`` retransmissions until the next reset (one poll cycle)."""
+        self._retry_budget = self.RETRY_BUDGET if budget is None else budget
+
+    def _consume_retry(self, data):
+        """Take one retransmission of ``data`` from the budget, if any is left.
+
+        Only reads draw on the per-cycle budget; writes the user asked for
+        keep all their attempts however badly the last poll went.
+        """
+        if self._retry_budget is not None and data[:1].hex() == self.func["read"]:
+            if self._retry_budget <= 0:
+                self._retry_budget_spent = True
+                return False
+            self._retry_budget -= 1
+        self._rtt.retries += 1
+        return True
+
+    def _request_wait(self, deadline, now):
+        """Return how long to wait for a reply, or ``0`` once ``deadline`` passed.
+
+        Backed-off waits never let one request take longer than the fixed
+        ``RESPONSE_TIMEOUT`` per attempt did.
+        """
+        return max(0, min(self._rtt.timeout, deadline - now))
+
+    @property
+    def transport_stats(self):
+        """Return round-trip, retry and traffic statistics for this device."""
+        stats = self._rtt.as_dict()
+        stats.update(self._metrics.as_dict())
+        stats["retry_budget"] = self._retry_budget
+        stats["bulk_read_supported"] = self._bulk_read_supported
+        return stats
+
+    def transport_value(self, name):
+        """Return one ``transport_stats`` entry without building the others."""
+        if name == "retry_budget":
+            return self._retry_budget
+        if name == "bulk_read_supported":
+            return self._bulk_read_supported
+        if name == "rtt_histogram":
+            return self._metrics.labelled_rtt_histogram()
+        if hasattr(self._metrics, name):
+            return getattr(self._metrics, name)
+        return getattr(self._rtt, name)
 
     def str2hex(self, str_msg):
-        return "".join("{:02x}".format(ord(c)) for c in str_msg)
+        return str_msg.encode("latin-1").hex()
 
     def hex2str(self, hex_msg):
-        return "".join(
-            chr(int("0x" + hex_msg[i : (i + 2)], 16)) for i in range(0, len(hex_msg), 2)
-        )
+        return bytes.fromhex(hex_msg).decode("latin-1")
 
     def hexstr2tuple(self, hex_msg):
-        return [int(hex_msg[i : (i + 2)], 16) for i in range(0, len(hex_msg), 2)]
+        return list(bytes.fromhex(hex_msg))
 
     def chksum(self, hex_msg):
-        checksum = sum(self.hexstr2tuple(hex_msg)) & 0xFFFF
-        return f"{checksum & 0xFF:02x}{checksum >> 8:02x}"
+        return protocol_codec.checksum(bytes.fromhex(hex_msg)).hex()
 
     def get_size(self, str):
         return hex(len(str)).replace("0x", "").zfill(2)
 
     def get_header(self, fan_id=None, password=None, packet_type=None):
-        fan_id = self._id if fan_id is None else fan_id
-        password = self._password if password is None else password
-        packet_type = self._type if packet_type is None else packet_type
-        id_size = self.get_size(fan_id)
-        pwd_size = self.get_size(password)
-        id = self.str2hex(fan_id)
-        password = self.str2hex(password)
-        str = f"{packet_type}{id_size}{id}{pwd_size}{password}"
-        return str
+        return self._encode_header(fan_id, password, packet_type).hex()
+
+    def _encode_header(self, fan_id=None, password=None, packet_type=None):
+        return protocol_codec.encode_header(
+            int(self._type if packet_type is None else packet_type, 16),
+            self._id if fan_id is None else fan_id,
+            self._password if password is None else password,
+        )
 
     def build_packet(self, data, fan_id=None, password=None, packet_type=None):
-        payload = (
-            self.get_header(fan_id=fan_id, password=password, packet_type=packet_type)
-            + data
+        frame = self.encode_frame(
+            bytes.fromhex(data),
+            fan_id=fan_id,
+            password=password,
+            packet_type=packet_type,
+        )
+        return self.HEADER + frame[2:].hex()
+
+    def encode_frame(self, data, fan_id=None, password=None, packet_type=None):
+        """Return the wire frame for an encoded function payload."""
+        return protocol_codec.encode_frame(
+            self._encode_header(fan_id, password, packet_type), data
         )
-        return self.HEADER + payload + self.chksum(payload)
 
     def validate_packet(self, data):
         if not isinstance(data, (bytes, bytearray)):
@@ -109,70 +192,43 @@ class FanProtocolMixin:
         if bytes(data[:2]) != self.HEADER_BYTES:
             return False
         checksum = int.from_bytes(data[-2:], byteorder="little", signed=False)
-        payload_sum = sum(data[2:-2]) & 0xFFFF
-        return checksum == payload_sum
+        if checksum != sum(data[2:-2]) & 0xFFFF:
+            self._metrics.checksum_failures += 1
+            return False
+        return True
 
     def get_params_index(self, value):
-        for params in (self.params, self.write_params):
-            for i in params:
-                if params[i][0] == value:
-                    return i
+        return self._param_ids.get(value)
 
     def get_params_values(self, idx, value):
-        # print ( "EcoventV2: " + idx,  file = sys.stderr )
-        index = self.get_params_index(idx)
-        if index is not None:
-            param = self.params.get(index) or self.write_params.get(index)
-            if param[1] is not None:
-                for i in param[1]:
-                    if param[1][i] == value:
-                        return [index, i]
-            return [index, None]
-        else:
+        index = self._param_ids.get(idx)
+        if index is None:
             return [None, None]
+        raw_values = self._param_raw_values.get(idx)
+        if raw_values is None:
+            return [index, None]
+        return [index, raw_values.get(value)]
 
     def encode_params(self, param, value=""):
-        parameter = ""
-        for i in range(0, len(param), 4):
-            n_out = ""
-            out = param[i : (i + 4)]
-            if out == "0077" and value == "":
-                value = "0101"
-            if value != "":
-                val_bytes = int(len(value) / 2)
-            else:
-                val_bytes = 0
-            if out[:2] != "00":
-                n_out = "ff" + out[:2]
-            if val_bytes > 1:
-                n_out += "fe" + hex(val_bytes).replace("0x", "").zfill(2) + out[2:4]
-            else:
-                n_out += out[2:4]
-            parameter += n_out + value
-            if out == "0077":
-                value = ""
-        return parameter
+        return protocol_codec.encode_params(param, bytes.fromhex(value)).hex()
 
     def send(self, data):
         # print ( "EcoventV2: " + data , file = sys.stderr )
+        if self.connect() is None:
+            return None
+        frame = self.encode_frame(data)
         try:
-            self.socket = self.connect()
-            if self.socket is None:
-                return None
-            payload = self.build_packet(data)
-            response = self.socket.sendall(bytes.fromhex(payload))
+            response = self.socket.sendall(frame)
         except socket.timeout:
             # print ( "EcoventV2: Connection timeout send to device: " + self._host , file = sys.stderr )
             return None
         except (
             OSError
         ):  # this shall include all connection errors like Aborted, Refused and Reset
+            self.disconnect()
             return None
-        except TypeError:
-            return (
-                None  # this can happen if the socket connection fails and returns None
-            )
         else:
+            self._metrics.sent(frame)
             return response
 
     def receive(self):
@@ -184,38 +240,127 @@ class FanProtocolMixin:
             # print ( "EcoventV2: Connection timeout receive from device: " + self._host , file = sys.stderr )
             return False
         except OSError:
+            self.disconnect()
             return False
         else:
+            self._metrics.received(response)
             return response
-        finally:
-            if self.socket is not None:
-                self.socket.close()
 
     def do_func(self, func, param, value="", retries=10):
         _LOGGER.debug(f"Executing function {func} with param {param} and value {value}")
-        data = func + self.encode_params(param, value)
-        response = False
-        i = 0
-        while not response:
-            i = i + 1
+        data = self._encode_request(func, param, value)
+        return self._do_request(data, self._request_param_ids(param), retries)
+
+    def _encode_request(self, func, param, value=""):
+        """Return the function byte and encoded parameters of one request."""
+        return bytes.fromhex(func) + protocol_codec.encode_params(
+            param, bytes.fromhex(value)
+        )
+
+    def _do_request(self, data, expected, retries=10):
+        """Send ``data`` until a reply with exactly the ``expected`` ids is applied.
+
+        Replies to earlier requests are skipped while waiting; a late reply to
+        a previous attempt of this request is as good as a fresh one.
+        """
+        self._discard_pending()
+        self._metrics.requests += 1
+        self._rtt.start_request()
+        deadline = time.monotonic() + self.RESPONSE_TIMEOUT * retries
+        for attempt in range(retries):
+            if attempt and not self._consume_retry(data):
+                break
+            wait = self._request_wait(deadline, time.monotonic())
+            if not wait:
+                break
             self.send(data)
+            sent_at = time.monotonic()
+            if self.socket is not None:
+                self.socket.settimeout(wait)
             response = self.receive()
-            if response:
-                if self.parse_response(response):
+            while response:
+                params = self._parse_frame(response)
+                if params is None:
+                    break
+                if self._matches_request(params, expected):
+                    if not attempt:
+                        rtt = time.monotonic() - sent_at
+                        self._rtt.sample(rtt)
+                        self._metrics.rtt(rtt)
+                    self._apply_params(params)
                     return True
-                response = False
-            if i >= retries:
-                # print ("EcoventV2: Timeout device: " + self._host + " bail out after " + str(i) + " retries" , file = sys.stderr )
-                return False
+                _LOGGER.debug("EcoVentV2: ignoring reply to an earlier request")
+                response = self.receive()
+            if not response:
+                self._rtt.expired()
+        # print ("EcoventV2: Timeout device: " + self._host + " bail out after " + str(i) + " retries" , file = sys.stderr )
+        return False
 
     def update(self):
-        request = ""
-        for param in self.params:
-            if param in self._write_only_params:
-                continue
-            request += hex(param).replace("0x", "").zfill(4)
-        success = self._read_params(request)
-        return success
+        return self._read_params(self._update_request())
+
+    def _update_request(self):
+        """Return the bulk read request for every readable profile parameter."""
+        if self._full_update_request is None:
+            self._full_update_request = "".join(
+                f"{param:04x}"
+                for param in self.params
+                if param not in self._write_only_params
+            )
+        return self._full_update_request
+
+    def update_tiers(self, tiers):
+        request = self._tier_request(tiers)
+        if not request:
+            return True
+        return self._read_params(request)
+
+    def param_tier(self, index):
+        """Return the polling tier of a readable parameter id."""
+        name = self.params[index][0]
+        profile = self.device_profile
+        if name in profile.static_params:
+            return "static"
+        if name in profile.fast_params or index in self._request_param_ids(
+            profile.quick_update_request
+        ):
+            return "fast"
+        return "slow"
+
+    def _tier_request(self, tiers):
+        """Return the bulk read request for the parameters in ``tiers``.
+
+        Requests are cached per tier combination until the profile changes.
+        """
+        tiers = frozenset(tiers)
+        request = self._tier_requests.get(tiers)
+        if request is None:
+            request = self._tier_requests[tiers] = "".join(
+                f"{param:04x}"
+                for param in self.params
+                if param not in self._write_only_params
+                and self.param_tier(param) in tiers
+            )
+        return request
+
+    def _compiled_read(self, request):
+        """Return ``(data, expected, frame)`` for a bulk read request.
+
+        The encoded frame embeds the device id and password, so it is rebuilt
+        when either changes; profile changes clear the cache.
+        """
+        identity = (self._id, self._password, self._type)
+        compiled = self._compiled_reads.get(request)
+        if compiled is None or compiled[0] != identity:
+            data = self._encode_request(self.func["read"], request)
+            compiled = (
+                identity,
+                data,
+                self._request_param_ids(request),
+                self.encode_frame(data),
+            )
+            self._compiled_reads[request] = compiled
+        return compiled[1:]
 
     def quick_update(self):
         # just update following states ...
@@ -234,17 +379,19 @@ class FanProtocolMixin:
         if not self.supports_preset_speed_settings:
             return True
 
-        request = "003A003B003C003D003E003F"
-        return self._read_params(request)
+        return self._read_params(self.PRESET_SPEED_SETTINGS_REQUEST)
 
     def _read_params(self, request):
-        if self._bulk_read_supported is not False and self.do_func(
-            self.func["read"], request, retries=3
-        ):
-            self._bulk_read_supported = True
-            return True
+        if self._bulk_read_supported is not False:
+            self._retry_budget_spent = False
+            if self.do_func(self.func["read"], request, retries=3):
+                self._bulk_read_supported = True
+                return True
+            if self._retry_budget_spent:
+                return False
 
         self._bulk_read_supported = False
+        self._metrics.bulk_read_fallbacks += 1
         success = False
         for i in range(0, len(request), 4):
             success = (
@@ -254,61 +401,125 @@ class FanProtocolMixin:
         return success
 
     def set_param(self, param, value):
+        request = self._param_write_request(param, value)
+        if request is None:
+            return False
+        return self._record_written(
+            (param,), self.do_func(self.func["write_return"], *request)
+        )
+
+    def _record_written(self, params, success):
+        """Remember echoed writes for the dependent read-back; return ``success``.
+
+        Writes the device did not acknowledge changed nothing, so their
+        dependents need no read.
+        """
+        if success:
+            self._written_params.update(
+                param
+                for param in params
+                if self.get_params_index(param) is not None
+            )
+        return success
+
+    def _param_write_request(self, param, value):
+        """Return the ``(param, value)`` hex pair used to write one parameter."""
         valpar = self.get_params_values(param, value)
         # print ( "EcoventV2: " + " " + param + "/" + value , file = sys.stderr )
-        if valpar[0] is not None:
-            if valpar[1] is not None:
-                return self.do_func(
-                    self.func["write_return"],
-                    hex(valpar[0]).replace("0x", "").zfill(4),
-                    hex(valpar[1]).replace("0x", "").zfill(2),
-                )
-            else:
-                return self.do_func(
-                    self.func["write_return"],
-                    hex(valpar[0]).replace("0x", "").zfill(4),
-                    value,
-                )
-        return False
+        if valpar[0] is None:
+            return None
+        if valpar[1] is not None:
+            return (
+                hex(valpar[0]).replace("0x", "").zfill(4),
+                hex(valpar[1]).replace("0x", "").zfill(2),
+            )
+        return (hex(valpar[0]).replace("0x", "").zfill(4), value)
 
     def set_params(self, values):
-        """Write several profile-mapped parameters in one command."""
-        request = ""
-        for param, value in values.items():
-            valpar = self.get_params_values(param, value)
-            if valpar[0] is None:
-                continue
+        """Write several profile-mapped parameters in one command.
 
-            request += hex(valpar[0]).replace("0x", "").zfill(4)
-            if valpar[1] is not None:
-                request += hex(valpar[1]).replace("0x", "").zfill(2)
-            else:
-                request += value
+        Return whether the device echoed the write.
+        """
+        request = self._params_write_frame(values)
+        if not request:
+            return False
+        return self._record_written(values, self._do_request(*request))
 
-        if request:
-            self.do_func(self.func["write_return"], request)
+    def _params_write_request(self, values):
+        """Return the ``(param, value)`` hex pairs for several parameters."""
+        request = []
+        for param, value in values.items():
+            pair = self._param_write_request(param, value)
+            if pair is not None:
+                request.append(pair)
+        return request
+
+    def _params_write_frame(self, values):
+        """Return the encoded multi-parameter write and the ids it answers."""
+        request = self._params_write_request(values)
+        if not request:
+            return None
+        data = bytes.fromhex(self.func["write_return"]) + b"".join(
+            protocol_codec.encode_params(param, bytes.fromhex(value))
+            for param, value in request
+        )
+        return data, frozenset(int(param, 16) for param, _ in request)
+
+    def write_dependencies_request(self):
+        """Return the read request for values derived from recent writes.
+
+        Written parameters are taken from the echo of the write itself, so only
+        the dependents declared in ``write_dependencies`` that were not written
+        are read back. The set of recent writes is cleared.
+        """
+        written, self._written_params = self._written_params, set()
+        indexes = set()
+        for param in written:
+            for dependent in self.write_dependencies.get(param, ()):
+                index = self.get_params_index(dependent)
+                if (
+                    index is not None
+                    and dependent not in written
+                    and index not in self._write_only_params
+                ):
+                    indexes.add(index)
+        return "".join(f"{index:04x}" for index in sorted(indexes))
 
     def get_param(self, param):
+        request = self._param_read_request(param)
+        if request is None:
+            return False
+        #  _LOGGER.debug(f"Getting parameter {param} with index {idx}")
+        return self.do_func(self.func["read"], request)
+
+    def _param_read_request(self, param):
+        """Return the read request for one named parameter."""
         idx = self.get_params_index(param)
-        if idx is not None:
-            #  _LOGGER.debug(f"Getting parameter {param} with index {idx}")
-            return self.do_func(self.func["read"], hex(idx).replace("0x", "").zfill(4))
-        return False
+        if idx is None:
+            return None
+        return hex(idx).replace("0x", "").zfill(4)
 
     def read_weekly_schedule_record(self, day, period):
         """Read one weekly schedule period via the special 0x0077 request."""
-        if not self.supports_parameter("weekly_schedule_setup"):
+        request_value = self._weekly_schedule_read_value(day, period)
+        if request_value is None:
             return None
 
-        if day < 1 or day > 7 or period < 1 or period > 4:
-            raise ValueError(f"Invalid weekly schedule slot: day={day}, period={period}")
-
         self._weekly_schedule_setup_record = None
-        request_value = bytes([day, period]).hex()
         if not self.do_func(self.func["read"], "0077", request_value):
             return None
         return self._weekly_schedule_setup_record
 
+    def _weekly_schedule_read_value(self, day, period):
+        """Return the 0x0077 read selector for one slot, if schedules exist."""
+        if not self.supports_parameter("weekly_schedule_setup"):
+            return None
+
+        if day < 1 or day > 7 or period < 1 or period > 4:
+            raise ValueError(f"Invalid weekly schedule slot: day={day}, period={period}")
+
+        return bytes([day, period]).hex()
+
     def read_weekly_schedule_day(self, day):
         """Read all four schedule periods for a day."""
         records = {}
@@ -326,19 +537,24 @@ class FanProtocolMixin:
 
     def set_rtc_datetime(self, value: datetime):
         """Write the device RTC using local calendar/time rows."""
+        values = self._rtc_datetime_values(value)
+        if values is None:
+            return False
+
+        return self.set_params(values)
+
+    def _rtc_datetime_values(self, value: datetime):
+        """Return RTC row values for a local datetime, if the profile has them."""
         if not (
             self.supports_parameter("rtc_time") and self.supports_parameter("rtc_date")
         ):
-            return False
+            return None
 
         time_hex = bytes([value.second, value.minute, value.hour]).hex()
         date_hex = bytes(
             [value.day, value.isoweekday(), value.month, value.year % 100]
         ).hex()
-        self.set_params(
-            {
-                "rtc_time": time_hex,
-                "rtc_date": date_hex,
-            }
-        )
-        return True
+        return {
+            "rtc_time": time_hex,
+            "rtc_date": date_hex,
+        }
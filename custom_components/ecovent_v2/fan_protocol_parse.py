@@ -1,86 +1,172 @@
 """EcoVent Fan mixin extracted from the vendored protocol client."""
 
+import time
+
+try:
+    from .protocol_state import freeze
+except ImportError:
+    from protocol_state import freeze
+
+
 class FanProtocolParseMixin:
-    def parse_response(self, data):
-        if not self.validate_packet(data):
-            return False
-        pointer = 2  # discard frame marker
-        length = len(data) - 2
-        if len(data) < pointer + 2:
-            return False
-        pointer += 1  # packet type
-        id_size = data[pointer]
-        pointer += 1
-        if len(data) < pointer + id_size + 3:
-            return False
-        pointer += id_size
-        pwd_size = data[pointer]
-        pointer += 1
-        if len(data) < pointer + pwd_size + 3:
+    def parse_response(self, data, expected=None):
+        """Apply a response frame, optionally only if it answers ``expected``.
+
+        ``expected`` is the set of parameter ids of the request in flight. A
+        frame carrying any other parameter, or missing one, is a late reply to
+        an earlier request and is rejected without touching the device state.
+        """
+        params = self._parse_frame(data)
+        if params is None or not self._matches_request(params, expected):
             return False
-        pointer += pwd_size
-        # function = data[pointer]  not used
+        self._apply_params(params)
+        return True
+
+    def _apply_params(self, params):
+        """Decode parameters into the device state, recording changed ids."""
+        decoders = self._decoders
+        store = self._store
+        changed = self._changed_params
+        now = time.monotonic()
+        for param_id, value in params:
+            if value is None:
+                continue
+            decoder = decoders.get(param_id)
+            if decoder is None:
+                self._store_unknown(param_id, value)
+                continue
+            setter, decode, argument, number = decoder
+            try:
+                if setter is None:
+                    decoded = decode(value, argument)
+                    if number is not None:
+                        number = number(value)
+                else:
+                    decode(self, value)
+                    decoded = getattr(self, setter)
+                    # A setter such as unit_type may switch the profile.
+                    decoders = self._decoders
+                    store = self._store
+                if store.set(param_id, value, decoded, now, number):
+                    changed.add(param_id)
+            except (AttributeError, KeyError, TypeError, ValueError, OverflowError):
+                self._store_unknown(param_id, value)
+
+    def _store_unknown(self, param_id, value):
+        value = value.hex()
+        if self._unknown_params.get(param_id) != value:
+            self._unknown_params[param_id] = value
+            self._changed_params.add(param_id)
+
+    def param_number(self, name):
+        """Return the numeric form of parameter ``name``, such as hours of a timer."""
+        return self._store.number(self._param_ids.get(name, name))
+
+    def param_age(self, name):
+        """Return seconds since parameter ``name`` was last received, or ``None``."""
+        return self._store.age(self._param_ids.get(name, name))
+
+    @property
+    def has_changed_params(self):
+        """Return whether any value changed since ``pop_changed_params``."""
+        return self._all_params_changed or bool(self._changed_params)
+
+    def snapshot(self):
+        """Return a read-only copy of the current device state."""
+        return freeze(self)
+
+    def pop_changed_params(self):
+        """Return the ids whose value changed since the last call, and reset.
+
+        ``None`` means every value must be treated as changed, after the
+        device profile switched.
+        """
+        changed = None if self._all_params_changed else self._changed_params
+        self._changed_params = set()
+        self._all_params_changed = False
+        return changed
+
+    def _parse_frame(self, data):
+        """Return ``(param_id, value)`` pairs of a valid frame, else ``None``.
+
+        Values are ``memoryview`` slices of ``data``, so nothing is copied
+        until a decoder reads them. Parameters the device marks as unsupported
+        (``0xFD``) are returned with a ``None`` value so they still count as
+        answered.
+        """
+        if not self.validate_packet(data):
+            return None
+        view = memoryview(data)
+        end = len(view) - 2  # checksum
+        pointer = 3  # discard frame marker and packet type
+        pointer += 1 + view[pointer]  # device id
+        if pointer >= end:
+            return None
+        pointer += 1 + view[pointer]  # password
+        # function = view[pointer]  not used
         pointer += 1
+        if pointer > end:
+            return None
         # from here parsing of parameters begin
-        payload = data[pointer:length]
-        response = bytearray()
+        params = []
         ext_function = 0
-        value_counter = 1
         high_byte_value = 0
-        parameter = 1
-        for p in payload:
-            if parameter and p == 0xFF:
-                ext_function = 0xFF
-                # print ( "def ext:" + hex(0xff) )
-            elif parameter and p == 0xFE:
-                ext_function = 0xFE
-                # print ( "def ext:" + hex(0xfe) )
-            elif parameter and p == 0xFD:
-                ext_function = 0xFD
-                # print ( "dev ext:" + hex(0xfd) )
+        value_size = 1
+        pending = False
+        while pointer < end:
+            p = view[pointer]
+            pointer += 1
+            if p == 0xFF or p == 0xFE or p == 0xFD:
+                ext_function = p
+            elif ext_function == 0xFF:
+                high_byte_value = p
+                ext_function = 0
+                pending = True
+            elif ext_function == 0xFE:
+                if not p:
+                    return None
+                value_size = p
+                ext_function = 0
+                pending = True
+            elif ext_function == 0xFD:
+                params.append(((high_byte_value << 8) | p, None))
+                ext_function = 0
+                pending = False
             else:
-                if ext_function == 0xFF:
-                    high_byte_value = p
-                    ext_function = 1
-                elif ext_function == 0xFE:
-                    value_counter = p
-                    ext_function = 2
-                elif ext_function == 0xFD:
-                    ext_function = 0
-                    response = bytearray()
-                else:
-                    if parameter == 1:
-                        # print ("appending: " + hex(high_byte_value))
-                        response.append(high_byte_value)
-                        parameter = 0
-                        ext_function = 0
-                    else:
-                        value_counter -= 1
-                    response.append(p)
-
-            if value_counter <= 0:
-                parameter = 1
-                value_counter = 1
+                if pointer + value_size > end:
+                    return None
+                params.append(
+                    (
+                        (high_byte_value << 8) | p,
+                        view[pointer : pointer + value_size],
+                    )
+                )
+                pointer += value_size
                 high_byte_value = 0
-                ext_function = 0
-                if len(response) < 2:
-                    return False
-                self._store_param(response)
-                response = bytearray()
-        return (
-            ext_function == 0 and parameter == 1 and value_counter == 1 and not response
-        )
-
-    def _store_param(self, response):
-        param_id = int(response[:2].hex(), 16)
-        value = response[2:].hex()
-        if param_id not in self.params:
-            self._unknown_params[param_id] = value
-            return
-        try:
-            setattr(self, self.params[param_id][0], value)
-        except (AttributeError, KeyError, TypeError, ValueError, OverflowError):
-            self._unknown_params[param_id] = value
+                value_size = 1
+                pending = False
+        if ext_function or pending or value_size != 1:
+            return None
+        return params
+
+    def _matches_request(self, params, expected):
+        """Return whether parsed parameters answer the request in flight.
+
+        The reply must cover every requested id, so a late answer to a smaller
+        request (a quick read ahead of a bulk read) is not taken for this one.
+        Unsupported (``0xFD``) entries count as answered.
+        """
+        if expected is None:
+            return True
+        return {param_id for param_id, _ in params} == expected
+
+    def _request_param_ids(self, param):
+        """Return the parameter ids named by a hex request string."""
+        return frozenset(int(param[i : i + 4], 16) for i in range(0, len(param), 4))
+
+    def _store_param(self, param_id, value):
+        """Decode one raw parameter value into the device state."""
+        self._apply_params(((param_id, value),))
 
     def _map_value(self, mapping, value, label):
         mapped_value = mapping.get(value)
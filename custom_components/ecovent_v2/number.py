@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
-import re
 
 from .ecoventv2 import Fan
 
@@ -462,9 +461,8 @@ class VentoNumber(CoordinatorEntity, NumberEntity):
         """Initialize the Vento Number entity."""
 
         coordinator: EcoVentCoordinator = hass.data[DOMAIN][config.entry_id]
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=coordinator.param_context(method))
 
-        self._fan: Fan = coordinator._fan
         self._attr_assumed_state = assumed_state
         self._attr_device_class = device_class
         self._attr_entity_category = entity_category
@@ -489,32 +487,30 @@ class VentoNumber(CoordinatorEntity, NumberEntity):
             name=self._fan.name,
         )
 
+    @property
+    def _fan(self) -> Fan:
+        """Return the read-only fan state of the last coordinator update."""
+        return self.coordinator.data
+
     @property
     def native_value(self) -> float | None:
-        """Return the numeric part of the current device value."""
+        """Return the numeric form of the current device value."""
+        number = self._fan.param_number(self._func)
+        if number is not None:
+            return number
         value = getattr(self._fan, self._func)
-        if value is None:
-            return None
         if isinstance(value, (int, float)):
             return value
-
-        match = re.match(r"(?P<value>\d+(?:\.\d+)?)", str(value))
-        if match is None:
-            return None
-
-        return float(match.group("value"))
+        return None
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         self._attr_native_value = value
 
         if self._write_mode == "manual_speed_percent":
-            await self.hass.async_add_executor_job(
-                self._fan.set_man_speed_percent,
-                int(value),
-            )
-            self.async_write_ha_state()
-            await self.coordinator.async_refresh()
+            value_hex = self._fan._man_speed_percent_value(int(value))
+            if value_hex is not None:
+                await self.coordinator.async_write_params({self._func: value_hex})
             return
 
         if self._write_mode == "speed_percent":
@@ -525,10 +521,4 @@ class VentoNumber(CoordinatorEntity, NumberEntity):
         else:
             value_hex = encode_raw_number(value, self._value_bytes)
 
-        await self.hass.async_add_executor_job(
-            self._fan.set_param,
-            self._func,
-            value_hex,
-        )
-        self.async_write_ha_state()
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_write_params({self._func: value_hex})
@@ -0,0 +1,118 @@
+"""Binary capture of EcoVent UDP traffic.
+
+A capture starts with ``MAGIC`` followed by one record per datagram: a
+17-byte little-endian header (direction, wall-clock time as a double, IPv4
+address, port, frame length) and the frame itself.
+"""
+
+import queue
+import socket
+import struct
+import threading
+import time
+from typing import NamedTuple
+
+
+MAGIC = b"EVCAP\x01"
+SENT = 0
+RECEIVED = 1
+
+_RECORD = struct.Struct("<BdIHH")
+_NO_ADDRESS = b"\x00\x00\x00\x00"
+
+
+class CaptureRecord(NamedTuple):
+    direction: int
+    timestamp: float
+    host: str
+    port: int
+    frame: bytes
+
+
+class CaptureWriter:
+    """Write sent and received frames to a capture file.
+
+    ``record`` only packs the datagram and queues it for a background thread,
+    so it is safe to call from the event loop. Opening and ``close``, which
+    waits for the queue to drain, block and belong in an executor.
+    """
+
+    def __init__(self, file):
+        self._file = file
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self.records = 0
+        self._queue.put(MAGIC)
+        self._thread = threading.Thread(
+            target=self._write_queued, name="ecovent_v2_capture", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def open(cls, path):
+        return cls(open(path, "wb"))
+
+    def _write_queued(self):
+        while (data := self._queue.get()) is not None:
+            self._file.write(data)
+        self._file.flush()
+
+    def record(self, direction, addr, frame, timestamp=None):
+        if self._closed:
+            return
+        try:
+            address = socket.inet_aton(addr[0])
+        except OSError:
+            address = _NO_ADDRESS
+        header = _RECORD.pack(
+            direction,
+            time.time() if timestamp is None else timestamp,
+            int.from_bytes(address, "big"),
+            addr[1],
+            len(frame),
+        )
+        self._queue.put(header + bytes(frame))
+        self.records += 1
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_capture(file):
+    """Yield the ``CaptureRecord`` entries of an open capture file.
+
+    Raises ``ValueError`` if the file is not a capture or is truncated.
+    """
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not an EcoVent capture")
+    while header := file.read(_RECORD.size):
+        if len(header) < _RECORD.size:
+            raise ValueError("truncated capture record")
+        direction, timestamp, address, port, size = _RECORD.unpack(header)
+        frame = file.read(size)
+        if len(frame) < size:
+            raise ValueError("truncated capture frame")
+        yield CaptureRecord(
+            direction,
+            timestamp,
+            socket.inet_ntoa(address.to_bytes(4, "big")),
+            port,
+            frame,
+        )
+
+
+def load_capture(path):
+    """Return every record of the capture at ``path``."""
+    with open(path, "rb") as file:
+        return list(read_capture(file))
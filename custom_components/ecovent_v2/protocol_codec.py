@@ -0,0 +1,78 @@
+"""Bytes-native encoder for EcoVent protocol frames.
+
+Frames are assembled in one ``bytearray`` and the checksum is summed over that
+buffer once. The hex-string helpers on ``Fan`` delegate here.
+"""
+
+import struct
+
+
+FRAME_MARKER = b"\xfd\xfd"
+SCHEDULE_PARAM = 0x0077
+SCHEDULE_DEFAULT_SELECTOR = b"\x01\x01"
+
+_CHECKSUM = struct.Struct("<H")
+
+
+def checksum(buffer):
+    """Return the little-endian 16-bit sum of ``buffer``."""
+    return _CHECKSUM.pack(sum(buffer) & 0xFFFF)
+
+
+def encode_header(packet_type, fan_id, password):
+    """Return packet type, device id and password with their size prefixes."""
+    fan_id = fan_id.encode("latin-1")
+    password = password.encode("latin-1")
+    return (
+        bytes((packet_type, len(fan_id)))
+        + fan_id
+        + bytes((len(password),))
+        + password
+    )
+
+
+def encode_frame(header, data):
+    """Return a complete frame for an encoded header and function payload."""
+    frame = bytearray(FRAME_MARKER)
+    frame += header
+    frame += data
+    frame += checksum(memoryview(frame)[2:])
+    return bytes(frame)
+
+
+def encode_param(param_id, value=b""):
+    """Return one parameter with its page and value-size prefixes."""
+    out = bytearray()
+    if param_id > 0xFF:
+        out += bytes((0xFF, param_id >> 8))
+    if len(value) > 1:
+        out += bytes((0xFE, len(value)))
+    out.append(param_id & 0xFF)
+    out += value
+    return bytes(out)
+
+
+def encode_params(param, value=b""):
+    """Encode a hex string of 16-bit ids, each followed by ``value``.
+
+    A bare 0x0077 read carries the default schedule selector, and the value is
+    not repeated for ids after it.
+    """
+    ids = bytes.fromhex(param)
+    out = bytearray()
+    for i in range(0, len(ids) - 1, 2):
+        high, low = ids[i], ids[i + 1]
+        schedule = not high and low == SCHEDULE_PARAM
+        if schedule and not value:
+            value = SCHEDULE_DEFAULT_SELECTOR
+        if high:
+            out += b"\xff"
+            out.append(high)
+        if len(value) > 1:
+            out += b"\xfe"
+            out.append(len(value))
+        out.append(low)
+        out += value
+        if schedule:
+            value = b""
+    return bytes(out)
@@ -0,0 +1,417 @@
+"""Declarative decoders for EcoVent parameter values.
+
+Each entry of ``PARAM_DECODERS`` names a pure decode function and how to
+resolve its argument (an enum map, a speed scale) for the active profile.
+``compile_decoders`` turns a profile's parameter map into a
+``{param_id: (setter, decode, argument, number)}`` table so a response
+is decoded by one dictionary lookup and one call per parameter. Parameters
+with side effects (model id, schedule records, RTC) keep their property
+setters, which the table calls directly.
+"""
+
+import time
+from typing import Any, Callable, NamedTuple
+
+
+def _uint(raw):
+    return int.from_bytes(raw, byteorder="big", signed=False)
+
+
+def _padded(raw, size):
+    if len(raw) > size:
+        return _uint(raw).to_bytes(size, "big")
+    return bytes(size - len(raw)) + bytes(raw)
+
+
+def decode_enum(raw, argument):
+    mapping, label = argument
+    value = _uint(raw)
+    mapped_value = mapping.get(value)
+    if mapped_value is None:
+        return f"Unknown {label} {value}"
+    return mapped_value
+
+
+def decode_int(raw, argument):
+    return _uint(raw)
+
+
+def decode_int_text(raw, argument):
+    return str(_uint(raw))
+
+
+def decode_uint_le(raw, argument):
+    return int.from_bytes(raw, byteorder="little", signed=False)
+
+
+def decode_signed_temperature(raw, argument):
+    value = int.from_bytes(raw, byteorder="little", signed=True)
+    if value in (-32768, 32767):
+        return None
+    return round(value / 10, 1)
+
+
+def decode_time_minutes_hours(raw, argument):
+    if len(raw) < 2:
+        return None
+    return f"{raw[1]:02d}:{raw[0]:02d}"
+
+
+def decode_hours_minutes_seconds(raw, argument):
+    val = _padded(raw, 3)
+    return str(val[2]) + "h " + str(val[1]) + "m " + str(val[0]) + "s "
+
+
+def hours_minutes_seconds_hours(raw):
+    val = _padded(raw, 3)
+    return round(val[2] + val[1] / 60 + val[0] / 3600, 3)
+
+
+def decode_hours_minutes_timer(raw, argument):
+    val = _padded(raw, 2)
+    return f"{val[1]:02d}h {val[0]:02d}m"
+
+
+def hours_minutes_timer_hours(raw):
+    val = _padded(raw, 2)
+    return round(val[1] + val[0] / 60, 2)
+
+
+def decode_days_hours_minutes(raw, argument):
+    val = _padded(raw, 4)
+    return f"{val[2]}d {val[1]}h {val[0]}m "
+
+
+def days_hours_minutes_hours(raw):
+    val = _padded(raw, 4)
+    return round(val[2] * 24 + val[1] + val[0] / 60, 1)
+
+
+def _filter_countdown(raw):
+    """Return ``(days, hours, minutes)`` of a 3 or 4 byte filter countdown."""
+    if len(raw) >= 4:
+        return raw[-1] * 256 + raw[-2], raw[-3], raw[-4]
+    val = _padded(raw, 3)
+    return val[2], val[1], val[0]
+
+
+def decode_filter_countdown(raw, argument):
+    days, hours, minutes = _filter_countdown(raw)
+    return f"{days}d {hours}h {minutes}m "
+
+
+def filter_countdown_hours(raw):
+    days, hours, minutes = _filter_countdown(raw)
+    return round(days * 24 + hours + minutes / 60, 1)
+
+
+def _uint_le(raw):
+    return int.from_bytes(raw, byteorder="little", signed=False)
+
+
+def decode_days(raw, argument):
+    return f"{_uint_le(raw)} d"
+
+
+def decode_minutes(raw, argument):
+    return f"{_uint(raw)} m"
+
+
+def _millivolts(raw):
+    return _uint_le(_padded(raw, 2))
+
+
+def decode_millivolts(raw, argument):
+    return f"{_millivolts(raw)} mV"
+
+
+def _rpm(raw):
+    return _uint_le(_padded(raw, 2))
+
+
+def decode_rpm(raw, argument):
+    return str(_rpm(raw))
+
+
+def decode_ipv4(raw, argument):
+    val = _padded(raw, 4)
+    return f"{val[0]}.{val[1]}.{val[2]}.{val[3]}"
+
+
+def decode_speed_percent(raw, scale):
+    val = _uint(raw)
+    if scale == "percent":
+        return val
+    if val >= 0 and val <= 255:
+        return int(val / 255 * 100)
+    return None
+
+
+class ParamDecoder(NamedTuple):
+    """Decode function plus a resolver for its profile-specific argument.
+
+    ``number`` optionally returns the numeric value behind a display string
+    (hours of a duration, a threshold sent as text), stored alongside it.
+    """
+
+    decode: Callable[[Any, Any], Any]
+    argument: Callable[[Any, str], Any] | None = None
+    number: Callable[[Any], Any] | None = None
+
+    def resolve(self, fan, name):
+        return None if self.argument is None else self.argument(fan, name)
+
+
+def param_enum(default_map):
+    """Map the value through the profile's map for the parameter, if it has one.
+
+    Parameters mapped without values fall back to the ``Fan`` enum attribute
+    ``default_map``.
+    """
+
+    def resolve(fan, name):
+        param = fan.params.get(fan.get_params_index(name))
+        if param and param[1] is not None:
+            return param[1], name
+        return getattr(fan, default_map), name
+
+    return ParamDecoder(decode_enum, resolve)
+
+
+def enum(map_name, label=None):
+    """Map the value through the ``Fan`` enum attribute ``map_name``."""
+    return ParamDecoder(
+        decode_enum, lambda fan, name: (getattr(fan, map_name), label or name)
+    )
+
+
+def profile_enum(field):
+    """Map the value through the enum named by a ``DeviceProfile`` field."""
+    return ParamDecoder(
+        decode_enum,
+        lambda fan, name: (
+            fan._profile_enum(getattr(fan.device_profile, field)),
+            name,
+        ),
+    )
+
+
+INT = ParamDecoder(decode_int)
+INT_TEXT = ParamDecoder(decode_int_text, number=_uint)
+UINT_LE = ParamDecoder(decode_uint_le)
+TEMPERATURE = ParamDecoder(decode_signed_temperature)
+HOURS_MINUTES = ParamDecoder(decode_time_minutes_hours)
+HOURS_MINUTES_SECONDS = ParamDecoder(
+    decode_hours_minutes_seconds, number=hours_minutes_seconds_hours
+)
+HOURS_MINUTES_TIMER = ParamDecoder(
+    decode_hours_minutes_timer, number=hours_minutes_timer_hours
+)
+DAYS_HOURS_MINUTES = ParamDecoder(
+    decode_days_hours_minutes, number=days_hours_minutes_hours
+)
+FILTER_COUNTDOWN = ParamDecoder(decode_filter_countdown, number=filter_countdown_hours)
+DAYS = ParamDecoder(decode_days, number=_uint_le)
+MINUTES = ParamDecoder(decode_minutes, number=_uint)
+MILLIVOLTS = ParamDecoder(decode_millivolts, number=_millivolts)
+RPM = ParamDecoder(decode_rpm, number=_rpm)
+IPV4 = ParamDecoder(decode_ipv4)
+SPEED_PERCENT = ParamDecoder(
+    decode_speed_percent, lambda fan, name: fan.device_profile.speed_percent_scale
+)
+
+
+PARAM_DECODERS = {
+    # Core state
+    "state": enum("states"),
+    "speed": enum("speeds"),
+    "boost_status": profile_enum("boost_statuses_name"),
+    "heater_status": enum("statuses"),
+    "timer_mode": enum("timer_modes"),
+    "timer_counter": HOURS_MINUTES_SECONDS,
+    "battery_status": enum("battery_statuses"),
+    "low_battery_status": enum("statuses"),
+    "all_day_mode": enum("states"),
+    "boost_timer_countdown": HOURS_MINUTES_SECONDS,
+    "timer_status": enum("statuses"),
+    "humidity_sensor_state": profile_enum("humidity_sensor_states_name"),
+    "relay_sensor_state": enum("states"),
+    "analogV_sensor_state": enum("states"),
+    "temperature_sensor_state": enum("states"),
+    "motion_sensor_state": enum("states"),
+    "light_sensor_state": enum("states"),
+    "air_quality_sensor_state": enum("humidity_permission_modes"),
+    "humidity_airflow": enum("arc_airflows_high"),
+    "motion_light_airflow": enum("arc_airflows_medium"),
+    "air_quality_airflow": enum("arc_airflows_high"),
+    "interval_ventilation_airflow": enum("arc_airflows_low"),
+    "all_day_airflow": enum("arc_airflows_low"),
+    "temperature_airflow": enum("arc_airflows_high"),
+    "humidity_treshold": INT_TEXT,
+    "temperature_treshold": INT_TEXT,
+    "battery_voltage": MILLIVOLTS,
+    "humidity": INT_TEXT,
+    "temperature": INT_TEXT,
+    "room_temperature": TEMPERATURE,
+    "air_quality": UINT_LE,
+    "air_quality_treshold": UINT_LE,
+    "analogV": INT_TEXT,
+    "relay_status": enum("statuses"),
+    "boost_switch_status": enum("statuses"),
+    "fire_alarm_status": enum("statuses"),
+    "temperature_status": enum("statuses"),
+    "motion_status": enum("statuses"),
+    "light_status": enum("statuses"),
+    "interval_ventilation_status": enum("statuses"),
+    "silent_mode_status": enum("statuses"),
+    # Device and network
+    "machine_hours": DAYS_HOURS_MINUTES,
+    "alarm_status": enum("alarms"),
+    "cloud_server_state": enum("states"),
+    "wifi_module_status": enum("statuses"),
+    "wifi_connection_status": enum("statuses"),
+    "filter_replacement_status": enum("statuses"),
+    "heater_blowing_status": enum("statuses"),
+    "wifi_operation_mode": enum("wifi_operation_modes"),
+    "wifi_enc_type": enum("wifi_enc_types"),
+    "wifi_freq_channel": INT_TEXT,
+    "wifi_dhcp": enum("wifi_dhcps"),
+    "wifi_assigned_ip": IPV4,
+    "wifi_assigned_netmask": IPV4,
+    "wifi_main_gateway": IPV4,
+    "current_wifi_ip": IPV4,
+    # Operating modes
+    "airflow": enum("airflows"),
+    "beeper": param_enum("bstatuses"),
+    "analogV_treshold": INT_TEXT,
+    "interval_ventilation_state": enum("states"),
+    "silent_mode_state": enum("states"),
+    "humidity_status": enum("statuses"),
+    "analogV_status": enum("statuses"),
+    "night_mode_timer": HOURS_MINUTES_TIMER,
+    "party_mode_timer": HOURS_MINUTES_TIMER,
+    # Speeds, timers and schedule
+    "supply_speed_low": SPEED_PERCENT,
+    "exhaust_speed_low": SPEED_PERCENT,
+    "supply_speed_medium": SPEED_PERCENT,
+    "exhaust_speed_medium": SPEED_PERCENT,
+    "supply_speed_high": SPEED_PERCENT,
+    "exhaust_speed_high": SPEED_PERCENT,
+    "supply_speed_4": SPEED_PERCENT,
+    "exhaust_speed_4": SPEED_PERCENT,
+    "supply_speed_5": SPEED_PERCENT,
+    "exhaust_speed_5": SPEED_PERCENT,
+    "man_speed": SPEED_PERCENT,
+    "fan1_speed": RPM,
+    "fan2_speed": RPM,
+    "filter_timer_setpoint": DAYS,
+    "filter_timer_countdown": FILTER_COUNTDOWN,
+    "boost_time": MINUTES,
+    "max_speed_setpoint": INT,
+    "silent_speed_setpoint": INT,
+    "interval_ventilation_speed_setpoint": INT,
+    "turn_on_delay_timer": INT_TEXT,
+    "silent_mode_start_time": HOURS_MINUTES_SECONDS,
+    "silent_mode_end_time": HOURS_MINUTES_SECONDS,
+    "weekly_schedule_state": enum("states"),
+    # Breezy / Freshpoint
+    "co2_sensor_state": enum("states"),
+    "co2_treshold": UINT_LE,
+    "co2": UINT_LE,
+    "outdoor_temperature": TEMPERATURE,
+    "supply_temperature": TEMPERATURE,
+    "exhaust_in_temperature": TEMPERATURE,
+    "exhaust_out_temperature": TEMPERATURE,
+    "heater_state": enum("states"),
+    "recovery_efficiency": INT,
+    "schedule_speed": enum("speeds"),
+    "frost_protection_status": enum("frost_protection_statuses"),
+    "voc_sensor_state": enum("states"),
+    "voc_treshold": UINT_LE,
+    "voc": UINT_LE,
+    "screen_brightness": INT,
+    "screen_backlight_mode": enum("screen_backlight_modes"),
+    "screen_temperature_source": enum("screen_temperature_sources"),
+    "screen_air_quality_source": enum("screen_air_quality_sources"),
+    "screen_display_mode": enum("screen_display_modes"),
+    "screen_standby_time_state": enum("screen_standby_time_states"),
+    "screen_display_state": enum("screen_display_states"),
+    "screen_off_start_time": HOURS_MINUTES,
+    "screen_off_end_time": HOURS_MINUTES,
+}
+
+
+def _decode_hex(raw, argument):
+    return raw.hex()
+
+
+_compiled_tables = {}
+
+
+def compile_decoders(fan, params):
+    """Return the ``{param_id: (setter, decode, argument, number)}`` table.
+
+    ``setter`` is ``None`` for declarative decoders: ``decode(raw, argument)``
+    returns the value stored under the parameter id and ``number``, when set,
+    its numeric form. Otherwise ``setter`` is the name of the property whose
+    setter ``decode(fan, raw)`` is, and the stored value is read back from
+    it. Tables only depend on class-level maps, so they are shared per class
+    and profile.
+    """
+    key = (type(fan), fan.profile_key)
+    table = _compiled_tables.get(key)
+    if table is None:
+        table = _compiled_tables[key] = _compile(fan, params)
+    return table
+
+
+def _compile(fan, params):
+    table = {}
+    fan_type = type(fan)
+    for param_id, (name, *_) in params.items():
+        decoder = PARAM_DECODERS.get(name)
+        if decoder is not None:
+            table[param_id] = (
+                None,
+                decoder.decode,
+                decoder.resolve(fan, name),
+                decoder.number,
+            )
+            continue
+        prop = getattr(fan_type, name, None)
+        if isinstance(prop, property) and prop.fset is not None:
+            table[param_id] = (name, prop.fset, None, None)
+        else:
+            table[param_id] = (None, _decode_hex, None, None)
+    return table
+
+
+def _raw_input(value):
+    """Return payload bytes for a manually assigned hex string or integer."""
+    if isinstance(value, str):
+        return bytes.fromhex(value)
+    if isinstance(value, int):
+        return value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big")
+    return value
+
+
+def decoded_property(name):
+    """Return a property reading ``name`` from the parameter store.
+
+    Values are keyed by the parameter's id in the active profile, or by
+    ``name`` when the profile does not map it. Assignments decode a hex string
+    or integer.
+    """
+    decoder = PARAM_DECODERS[name]
+
+    def fget(self):
+        return self._store.value(self._param_ids.get(name, name))
+
+    def fset(self, value):
+        param_id = self._param_ids.get(name, name)
+        raw = _raw_input(value)
+        decoded = decoder.decode(raw, decoder.resolve(self, name))
+        number = None if decoder.number is None else decoder.number(raw)
+        self._store.set(param_id, raw, decoded, time.monotonic(), number)
+
+    return property(fget, fset)
@@ -384,3 +384,36 @@ freshbox_write_params = {
 }
 
 arc_write_params = {}
+
+# Parameters the device recomputes after a write to the keyed parameter, or
+# that HA derives state from together with it. A write_return reply only
+# echoes the written rows, so these are read back.
+write_dependencies = {
+    "state": ("fan1_speed", "fan2_speed", "timer_counter", "boost_timer_countdown"),
+    "speed": (
+        "man_speed",
+        "fan1_speed",
+        "fan2_speed",
+        "supply_speed_low",
+        "exhaust_speed_low",
+        "supply_speed_medium",
+        "exhaust_speed_medium",
+        "supply_speed_high",
+        "exhaust_speed_high",
+    ),
+    "man_speed": ("speed", "fan1_speed", "fan2_speed"),
+    "airflow": ("fan1_speed", "fan2_speed"),
+    "timer_mode": ("speed", "timer_counter", "fan1_speed", "fan2_speed"),
+    "boost_status": ("boost_timer_countdown", "fan1_speed"),
+    "all_day_mode": ("fan1_speed",),
+    "humidity_sensor_state": ("humidity_status", "fan1_speed"),
+    "temperature_sensor_state": ("temperature_status", "fan1_speed"),
+    "motion_sensor_state": ("motion_status", "fan1_speed"),
+    "relay_sensor_state": ("relay_status", "fan1_speed"),
+    "interval_ventilation_state": ("interval_ventilation_status", "fan1_speed"),
+    "silent_mode_state": ("silent_mode_status", "fan1_speed"),
+    "max_speed_setpoint": ("fan1_speed",),
+    "weekly_schedule_state": ("speed", "schedule_speed", "fan1_speed", "fan2_speed"),
+    "filter_timer_reset": ("filter_timer_countdown", "filter_replacement_status"),
+    "reset_alarms": ("alarm_status",),
+}
@@ -16,6 +16,44 @@ OPERATING_MODE_PRESETS = (
 )
 
 
+# Polling tiers. Static rows describe the unit and its network setup and are
+# only read at init and after a failed poll; fast rows are live operating state
+# read every cycle, together with the profile's quick update request. Every
+# other readable row is polled on the slow tier.
+STATIC_PARAMS = frozenset(
+    {
+        "device_search",
+        "unit_type",
+        "firmware",
+        "wifi_assigned_ip",
+        "current_wifi_ip",
+        "filter_timer_setpoint",
+    }
+)
+
+FAST_PARAMS = frozenset(
+    {
+        "state",
+        "speed",
+        "man_speed",
+        "airflow",
+        "boost_status",
+        "timer_mode",
+        "timer_counter",
+        "fan1_speed",
+        "fan2_speed",
+        "humidity",
+        "alarm_status",
+    }
+)
+
+# Fast rows that drift by themselves (fan rpm, countdowns), so a change in
+# them does not mean the device became more active.
+ACTIVITY_NOISE_PARAMS = frozenset(
+    {"fan1_speed", "fan2_speed", "timer_counter", "boost_timer_countdown"}
+)
+
+
 VENTO_SMART_HOME_MANUAL_URL = (
     "https://blaubergventilatoren.net/download/vento-inhome-manual-14758.pdf"
 )
@@ -67,6 +105,8 @@ class DeviceProfile:
     uses_operating_mode_presets: bool = False
     speed_percent_scale: str = "byte"
     supports_percentage_control: bool = True
+    static_params: frozenset[str] = STATIC_PARAMS
+    fast_params: frozenset[str] = FAST_PARAMS
 
 
 @dataclass(frozen=True)
@@ -1,9 +1,20 @@
 """EcoVent protocol profile definitions."""
 
 try:
-    from .protocol_metadata import DeviceProfile, OPERATING_MODE_PRESETS
+    from .protocol_metadata import DeviceProfile, FAST_PARAMS, OPERATING_MODE_PRESETS
 except ImportError:
-    from protocol_metadata import DeviceProfile, OPERATING_MODE_PRESETS
+    from protocol_metadata import DeviceProfile, FAST_PARAMS, OPERATING_MODE_PRESETS
+
+
+# Temperature probes of the heat-recovery units change with the airflow.
+TEMPERATURE_PROBE_PARAMS = frozenset(
+    {
+        "outdoor_temperature",
+        "supply_temperature",
+        "exhaust_in_temperature",
+        "exhaust_out_temperature",
+    }
+)
 
 
 DEVICE_PROFILES = {
@@ -52,6 +63,19 @@ DEVICE_PROFILES = {
             }
         ),
         uses_operating_mode_presets=True,
+        # The active preset is derived from the operating mode switches.
+        fast_params=FAST_PARAMS
+        | frozenset(
+            {
+                "all_day_mode",
+                "humidity_sensor_state",
+                "temperature_sensor_state",
+                "motion_sensor_state",
+                "relay_sensor_state",
+                "interval_ventilation_state",
+                "silent_mode_state",
+            }
+        ),
     ),
     "breezy": DeviceProfile(
         key="breezy",
@@ -83,6 +107,7 @@ DEVICE_PROFILES = {
         supports_oscillation=True,
         supports_preset_speed_settings=True,
         speed_percent_scale="percent",
+        fast_params=FAST_PARAMS | TEMPERATURE_PROBE_PARAMS,
     ),
     "freshbox": DeviceProfile(
         key="freshbox",
@@ -102,6 +127,7 @@ DEVICE_PROFILES = {
         ),
         speed_percent_scale="percent",
         supports_percentage_control=False,
+        fast_params=FAST_PARAMS | TEMPERATURE_PROBE_PARAMS | {"timer_status"},
     ),
     "arc": DeviceProfile(
         key="arc",
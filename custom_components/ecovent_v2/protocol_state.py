@@ -0,0 +1,175 @@
+"""Compact per-device store of EcoVent parameter values.
+
+A profile's readable parameters get fixed positions in a layout shared by
+every device using that profile. Each device then only holds four lists:
+decoded values, their numeric form where the decoder defines one (hours of a
+duration string), the raw payload bytes they were decoded from and the
+monotonic time they were last received. Copying a store is four list copies.
+"""
+
+import time
+
+
+_layouts = {}
+# Most parameters are one byte wide; share those payloads between devices.
+_SINGLE_BYTES = tuple(bytes((value,)) for value in range(256))
+
+
+def _raw_copy(raw):
+    return _SINGLE_BYTES[raw[0]] if len(raw) == 1 else bytes(raw)
+
+
+def profile_layout(key, param_ids):
+    """Return the shared ``{param_id: position}`` layout cached under ``key``."""
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = _layouts[key] = {
+            param_id: position for position, param_id in enumerate(param_ids)
+        }
+    return layout
+
+
+class ParamStore:
+    """Decoded and raw parameter values with per-parameter timestamps.
+
+    Keys outside the layout (parameters the profile does not map, assigned by
+    name) are kept in a small side dictionary.
+    """
+
+    __slots__ = ("_layout", "_values", "_numbers", "_raw", "_updated", "_extra")
+
+    def __init__(self, layout=None):
+        self._layout = {} if layout is None else layout
+        size = len(self._layout)
+        self._values = [None] * size
+        self._numbers = [None] * size
+        self._raw = [None] * size
+        self._updated = [None] * size
+        self._extra = None
+
+    @property
+    def layout(self):
+        return self._layout
+
+    def __contains__(self, key):
+        position = self._layout.get(key)
+        if position is None:
+            return self._extra is not None and key in self._extra
+        return self._updated[position] is not None
+
+    def value(self, key, default=None):
+        position = self._layout.get(key)
+        if position is not None:
+            if self._updated[position] is None:
+                return default
+            return self._values[position]
+        if self._extra is None or key not in self._extra:
+            return default
+        return self._extra[key][0]
+
+    def number(self, key):
+        """Return the numeric form of ``key``'s value, or ``None``."""
+        position = self._layout.get(key)
+        if position is not None:
+            return self._numbers[position]
+        if self._extra is None or key not in self._extra:
+            return None
+        return self._extra[key][1]
+
+    def raw(self, key):
+        position = self._layout.get(key)
+        if position is not None:
+            return self._raw[position]
+        if self._extra is None or key not in self._extra:
+            return None
+        return self._extra[key][2]
+
+    def updated(self, key):
+        """Return the monotonic time ``key`` was last received, or ``None``."""
+        position = self._layout.get(key)
+        if position is not None:
+            return self._updated[position]
+        if self._extra is None or key not in self._extra:
+            return None
+        return self._extra[key][3]
+
+    def age(self, key, now=None):
+        """Return seconds since ``key`` was last received, or ``None``."""
+        updated = self.updated(key)
+        if updated is None:
+            return None
+        return (time.monotonic() if now is None else now) - updated
+
+    def set(self, key, raw, value, now, number=None):
+        """Store one received value and return whether the decoded value changed."""
+        position = self._layout.get(key)
+        if position is None:
+            if self._extra is None:
+                self._extra = {}
+            previous = self._extra.get(key)
+            self._extra[key] = (value, number, _raw_copy(raw), now)
+            return previous is None or previous[0] != value
+        changed = self._updated[position] is None or self._values[position] != value
+        self._values[position] = value
+        self._numbers[position] = number
+        self._raw[position] = _raw_copy(raw)
+        self._updated[position] = now
+        return changed
+
+    def rebind(self, layout, keep=()):
+        """Return a store for ``layout`` carrying over the values of ``keep``."""
+        store = ParamStore(layout)
+        for key in keep:
+            if key in self and key in layout:
+                position = layout[key]
+                store._values[position] = self.value(key)
+                store._numbers[position] = self.number(key)
+                store._raw[position] = self.raw(key)
+                store._updated[position] = self.updated(key)
+        return store
+
+    def copy(self):
+        store = ParamStore.__new__(ParamStore)
+        store._layout = self._layout
+        store._values = self._values.copy()
+        store._numbers = self._numbers.copy()
+        store._raw = self._raw.copy()
+        store._updated = self._updated.copy()
+        store._extra = None if self._extra is None else self._extra.copy()
+        return store
+
+
+def _read_only(self, *args):
+    raise AttributeError(f"{type(self).__name__} is a read-only snapshot")
+
+
+_snapshot_classes = {}
+
+
+def freeze(fan):
+    """Return a read-only copy of ``fan``'s current state.
+
+    The copy shares every attribute with ``fan`` except the containers the
+    parser updates in place (the parameter store and unknown values), so
+    later responses never show through. Assigning to the copy, including
+    through a property setter, raises ``AttributeError``.
+    """
+    cls = type(fan)
+    snapshot_class = _snapshot_classes.get(cls)
+    if snapshot_class is None:
+        snapshot_class = _snapshot_classes[cls] = type(
+            f"{cls.__name__}Snapshot",
+            (cls,),
+            {
+                "__module__": cls.__module__,
+                "__slots__": (),
+                "__setattr__": _read_only,
+                "__delattr__": _read_only,
+            },
+        )
+    snapshot = object.__new__(snapshot_class)
+    state = snapshot.__dict__
+    state.update(fan.__dict__)
+    state["_store"] = fan._store.copy()
+    state["_unknown_params"] = fan._unknown_params.copy()
+    return snapshot
@@ -0,0 +1,350 @@
+"""Asyncio UDP transport for the EcoVent protocol client.
+
+Every device polled from this process shares one bound UDP socket. Replies
+are routed back to the requesting ``Fan`` by source address and by the device
+id carried in the response header.
+"""
+
+import asyncio
+from bisect import bisect_left
+import logging
+import socket
+import weakref
+
+try:
+    from .protocol_capture import RECEIVED, SENT, CaptureWriter
+except ImportError:
+    from protocol_capture import RECEIVED, SENT, CaptureWriter
+
+
+_LOGGER = logging.getLogger(__name__)
+
+BROADCAST_HOST = "<broadcast>"
+BROADCAST_ADDRESS = "255.255.255.255"
+DEFAULT_DEVICE_ID = "DEFAULT_DEVICEID"
+
+MIN_RTO = 0.05
+MAX_RTO = 1.0
+# Upper bounds, in seconds, of the round-trip time histogram buckets.
+RTT_HISTOGRAM_BOUNDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0)
+
+_shared_endpoint = None
+_shared_endpoint_locks = weakref.WeakKeyDictionary()
+_capture = None
+
+
+def frame_device_id(data):
+    """Return the device id from a response header, or ``None`` if truncated."""
+    if len(data) < 4:
+        return None
+    id_size = data[3]
+    if len(data) < 4 + id_size:
+        return None
+    return bytes(data[4 : 4 + id_size]).decode("ascii", errors="replace")
+
+
+def start_capture(path):
+    """Record every frame sent or received by this process to ``path``.
+
+    Any capture already running is closed first. The file is opened here, so
+    call this from an executor when an event loop is running.
+    """
+    global _capture
+    stop_capture()
+    _capture = CaptureWriter.open(path)
+    return _capture
+
+
+def stop_capture():
+    """Close the running capture, if any, once its queued records are written.
+
+    This blocks until the writer thread finishes; call it from an executor.
+    """
+    global _capture
+    if _capture is not None:
+        _capture.close()
+        _capture = None
+
+
+class RttEstimator:
+    """Smoothed round-trip time and retransmission timeout (RFC 6298).
+
+    Only replies to a first transmission are sampled (Karn's algorithm); each
+    expired wait doubles the timeout until the next clean sample or the next
+    request.
+    """
+
+    ALPHA = 1 / 8
+    BETA = 1 / 4
+    K = 4
+
+    def __init__(self, initial_rto):
+        self.srtt = None
+        self.rttvar = None
+        self.rto = initial_rto
+        self.backoff = 0
+        self.samples = 0
+        self.timeouts = 0
+        self.retries = 0
+
+    @property
+    def timeout(self):
+        """Return how long to wait for the next reply."""
+        return min(self.rto * (1 << self.backoff), max(self.rto, MAX_RTO))
+
+    def sample(self, rtt):
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar += self.BETA * (abs(self.srtt - rtt) - self.rttvar)
+            self.srtt += self.ALPHA * (rtt - self.srtt)
+        self.rto = min(max(self.srtt + self.K * self.rttvar, MIN_RTO), MAX_RTO)
+        self.backoff = 0
+        self.samples += 1
+
+    def start_request(self):
+        """Drop the backoff of earlier requests before a new one is sent."""
+        self.backoff = 0
+
+    def expired(self):
+        self.timeouts += 1
+        if self.timeout < MAX_RTO:
+            self.backoff += 1
+
+    def as_dict(self):
+        return {
+            "srtt": self.srtt,
+            "rttvar": self.rttvar,
+            "rto": self.rto,
+            "timeout": self.timeout,
+            "samples": self.samples,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+        }
+
+
+class TransportMetrics:
+    """Request, traffic and round-trip counters of one device.
+
+    Timeouts and retries are counted by ``RttEstimator``, which drives them.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.responses = 0
+        self.checksum_failures = 0
+        self.bulk_read_fallbacks = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.rtt_histogram = [0] * (len(RTT_HISTOGRAM_BOUNDS) + 1)
+
+    def sent(self, frame):
+        self.bytes_out += len(frame)
+
+    def received(self, frame):
+        self.responses += 1
+        self.bytes_in += len(frame)
+
+    def rtt(self, seconds):
+        self.rtt_histogram[bisect_left(RTT_HISTOGRAM_BOUNDS, seconds)] += 1
+
+    def labelled_rtt_histogram(self):
+        """Return the round-trip histogram keyed by bucket label."""
+        labels = [f"<={bound * 1000:g}ms" for bound in RTT_HISTOGRAM_BOUNDS]
+        labels.append(f">{RTT_HISTOGRAM_BOUNDS[-1] * 1000:g}ms")
+        return dict(zip(labels, self.rtt_histogram))
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "responses": self.responses,
+            "checksum_failures": self.checksum_failures,
+            "bulk_read_fallbacks": self.bulk_read_fallbacks,
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "rtt_histogram": self.labelled_rtt_histogram(),
+        }
+
+
+class DeviceRoute:
+    """One device's view of the shared endpoint."""
+
+    def __init__(self, endpoint, host, port, broadcast=False):
+        self.endpoint = endpoint
+        self.addr = (host, port)
+        self.broadcast = broadcast
+        self.device_id = None
+        self._responses = asyncio.Queue()
+
+    @property
+    def is_open(self):
+        """Return whether the route can still send datagrams."""
+        return self.endpoint is not None and self.endpoint.is_open
+
+    def accepts(self, device_id):
+        """Return whether a frame from ``device_id`` is meant for this route."""
+        return self.device_id in (None, DEFAULT_DEVICE_ID, device_id)
+
+    def deliver(self, data):
+        self._responses.put_nowait(data)
+
+    def send(self, frame):
+        """Send one encoded frame, returning whether it was handed to the OS."""
+        if not self.is_open:
+            return False
+        return self.endpoint.sendto(frame, self.addr)
+
+    async def receive(self, timeout):
+        """Return the next routed datagram, or ``None`` after ``timeout`` seconds."""
+        if not self._responses.empty():
+            return self._responses.get_nowait()
+        if timeout <= 0:
+            return None
+        try:
+            return await asyncio.wait_for(self._responses.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def discard_pending(self):
+        """Drop datagrams that arrived while no request was waiting."""
+        while not self._responses.empty():
+            self._responses.get_nowait()
+
+    def close(self):
+        if self.endpoint is not None:
+            self.endpoint.unregister(self)
+            self.endpoint = None
+
+
+class SharedEndpoint(asyncio.DatagramProtocol):
+    """Single bound UDP socket multiplexing requests for many devices."""
+
+    def __init__(self):
+        self.transport = None
+        self.loop = None
+        self._routes = {}
+        self._broadcast_routes = set()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.loop = asyncio.get_running_loop()
+
+    def datagram_received(self, data, addr):
+        if _capture is not None:
+            _capture.record(RECEIVED, addr, data)
+        device_id = frame_device_id(data)
+        if device_id is None:
+            return
+        candidates = (*self._routes.get(addr[:2], ()), *self._broadcast_routes)
+        for route in candidates:
+            if route.device_id == device_id:
+                route.deliver(data)
+                return
+        for route in candidates:
+            if route.accepts(device_id):
+                route.deliver(data)
+                return
+        _LOGGER.debug(
+            "EcoVentV2: dropping datagram from %s for unknown device %s",
+            addr[0],
+            device_id,
+        )
+
+    def error_received(self, exc):
+        # ICMP errors such as port unreachable are reported here; the request
+        # simply times out and is retried by the caller.
+        _LOGGER.debug("EcoVentV2: UDP error received: %s", exc)
+
+    def connection_lost(self, exc):
+        self.transport = None
+
+    @property
+    def is_open(self):
+        """Return whether the shared socket is still usable."""
+        return self.transport is not None and not self.transport.is_closing()
+
+    @property
+    def route_count(self):
+        """Return how many device routes share this socket."""
+        return sum(len(routes) for routes in self._routes.values()) + len(
+            self._broadcast_routes
+        )
+
+    def register(self, host, port):
+        """Create a route for replies coming from ``host``/``port``."""
+        if host == BROADCAST_ADDRESS:
+            route = DeviceRoute(self, host, port, broadcast=True)
+            self._broadcast_routes.add(route)
+            return route
+        route = DeviceRoute(self, host, port)
+        self._routes.setdefault(route.addr, set()).add(route)
+        return route
+
+    def unregister(self, route):
+        if route.broadcast:
+            self._broadcast_routes.discard(route)
+        else:
+            routes = self._routes.get(route.addr, set())
+            routes.discard(route)
+            if not routes:
+                self._routes.pop(route.addr, None)
+        if not self.route_count:
+            self.close()
+
+    def sendto(self, frame, addr):
+        try:
+            self.transport.sendto(frame, addr)
+        except OSError:
+            return False
+        if _capture is not None:
+            _capture.record(SENT, addr, frame)
+        return True
+
+    def close(self):
+        global _shared_endpoint
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+        if _shared_endpoint is self:
+            _shared_endpoint = None
+
+
+async def async_get_shared_endpoint():
+    """Return the process-wide endpoint for the running loop, binding it once."""
+    global _shared_endpoint
+    loop = asyncio.get_running_loop()
+    lock = _shared_endpoint_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        if (
+            _shared_endpoint is not None
+            and _shared_endpoint.is_open
+            and _shared_endpoint.loop is loop
+        ):
+            return _shared_endpoint
+        _, endpoint = await loop.create_datagram_endpoint(
+            SharedEndpoint,
+            local_addr=("0.0.0.0", 0),
+            family=socket.AF_INET,
+            allow_broadcast=True,
+        )
+        _shared_endpoint = endpoint
+        return endpoint
+
+
+async def async_open_endpoint(host, port):
+    """Register a device on the shared endpoint, or return ``None`` on error."""
+    loop = asyncio.get_running_loop()
+    try:
+        if host == BROADCAST_HOST:
+            address = BROADCAST_ADDRESS
+        else:
+            infos = await loop.getaddrinfo(
+                host, port, family=socket.AF_INET, type=socket.SOCK_DGRAM
+            )
+            address = infos[0][4][0]
+        endpoint = await async_get_shared_endpoint()
+    except (OSError, TypeError) as err:
+        _LOGGER.debug("EcoVentV2: cannot open UDP endpoint to %s: %s", host, err)
+        return None
+    return endpoint.register(address, port)
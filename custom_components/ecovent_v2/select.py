@@ -175,8 +175,7 @@ class VentoSelect(CoordinatorEntity, SelectEntity):
     ) -> None:
         """Initialize a writable enum select."""
         coordinator: EcoVentCoordinator = hass.data[DOMAIN][config.entry_id]
-        super().__init__(coordinator)
-        self._fan: Fan = coordinator._fan
+        super().__init__(coordinator, context=coordinator.param_context(spec.method))
         self._method = spec.method
         self._attr_name = spec.name
         self._attr_unique_id = self._fan.id + spec.key
@@ -190,6 +189,11 @@ class VentoSelect(CoordinatorEntity, SelectEntity):
             name=self._fan.name,
         )
 
+    @property
+    def _fan(self) -> Fan:
+        """Return the read-only fan state of the last coordinator update."""
+        return self.coordinator.data
+
     @property
     def current_option(self) -> str | None:
         """Return the current enum option."""
@@ -200,5 +204,4 @@ class VentoSelect(CoordinatorEntity, SelectEntity):
         if option not in self.options:
             raise ValueError(f"Invalid {self._method} option: {option}")
 
-        await self.hass.async_add_executor_job(self._fan.set_param, self._method, option)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_write_params({self._method: option})
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import re
 
 import voluptuous as vol
 
@@ -22,48 +21,14 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import EcoVentCoordinator
+from .coordinator_helpers import SCHEDULE, TRANSPORT_CONTEXT
 from .schedule_helpers import SCHEDULE_DAY_OPTIONS, SCHEDULE_SPEED_OPTIONS
-from .sensor_helpers import enum_options_with_value
-from .sensor_specs import SENSOR_SPECS
+from .sensor_helpers import EnumOptions
+from .sensor_specs import SENSOR_SPECS, TRANSPORT_SENSOR_SPECS
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _parse_hours(
-    value: str | None, pattern: str, precision: int | None = None
-) -> float | None:
-    """Parse device duration strings and expose them as hours."""
-    if value is None:
-        return None
-
-    match = re.match(pattern, value)
-    if not match:
-        return None
-
-    parts = {key: int(val) for key, val in match.groupdict().items() if val is not None}
-    total_hours = (
-        parts.get("days", 0) * 24
-        + parts.get("hours", 0)
-        + parts.get("minutes", 0) / 60
-        + parts.get("seconds", 0) / 3600
-    )
-    if precision is not None:
-        return round(total_hours, precision)
-    return total_hours
-
-
-def _parse_days(value: str | None) -> int | None:
-    """Parse simple device duration strings formatted as days."""
-    if value is None:
-        return None
-
-    match = re.match(r"(?P<days>\d+) d", value)
-    if not match:
-        return None
-
-    return int(match.group("days"))
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     config: ConfigEntry,
@@ -95,6 +60,7 @@ async def async_setup_entry(
             excluded_capabilities=spec.excluded_capabilities,
         )
     ]
+    entities += [TransportSensor(hass, config, spec) for spec in TRANSPORT_SENSOR_SPECS]
 
     supports_schedule = coordinator._fan.supports_parameter("weekly_schedule_setup")
     if supports_schedule:
@@ -155,8 +121,7 @@ class VentoSensor(CoordinatorEntity, SensorEntity):
     ) -> None:
         """Initialize fan sensors."""
         coordinator: EcoVentCoordinator = hass.data[DOMAIN][config.entry_id]
-        super().__init__(coordinator)
-        self._fan: Fan = coordinator._fan
+        super().__init__(coordinator, context=coordinator.param_context(method))
         self._attr_native_unit_of_measurement = native_unit_of_measurement
         self._attr_device_class = device_class
         self._attr_state_class = state_class
@@ -167,9 +132,10 @@ class VentoSensor(CoordinatorEntity, SensorEntity):
         self._method = getattr(self, method)
         self._attr_icon = icon
         if method == "schedule_speed":
-            self._attr_options = list(self._fan.device_profile.schedule_speed_modes)
+            options = self._fan.device_profile.schedule_speed_modes
         else:
-            self._attr_options = options or self._fan.parameter_options(method)
+            options = options or self._fan.parameter_options(method)
+        self._enum_options = EnumOptions(options)
         self._attr_translation_key = translation_key
         if suggested_display_precision is not None:
             self._attr_suggested_display_precision = suggested_display_precision
@@ -178,23 +144,26 @@ class VentoSensor(CoordinatorEntity, SensorEntity):
             name=self._fan.name,
         )
 
+    @property
+    def _fan(self) -> Fan:
+        """Return the read-only fan state of the last coordinator update."""
+        return self.coordinator.data
+
     @property
     def native_value(self):
         """Get native value property from method."""
         self._attr_native_value = self._method()
         if self._attr_device_class == SensorDeviceClass.ENUM:
-            self._attr_options = enum_options_with_value(
-                self._attr_options,
-                self._attr_native_value,
-            )
+            self._enum_options.include(self._attr_native_value)
         return self._attr_native_value
 
     @property
     def options(self):
-        """Return enum options, including any currently reported unknown value."""
-        if self._attr_device_class != SensorDeviceClass.ENUM:
-            return self._attr_options
-        return enum_options_with_value(self._attr_options, self._method())
+        """Return enum options, including unknown values reported so far.
+
+        Only ``native_value`` extends them, when the device reports a new value.
+        """
+        return self._enum_options.options
 
     def get_native_value(self):
         """Get native value method."""
@@ -313,40 +282,24 @@ class VentoSensor(CoordinatorEntity, SensorEntity):
         """Get battery used percentage."""
         high = 3300
         low = 2500
-        value = self._fan.battery_voltage
-        if value is None:
+        voltage = self._fan.param_number("battery_voltage")
+        if voltage is None:
             return None
-
-        if isinstance(value, (int, float)):
-            voltage = int(value)
-        else:
-            match = re.match(r"(?P<voltage>\d+)", str(value))
-            if match is None:
-                return None
-            voltage = int(match.group("voltage"))
         voltage = round(((voltage - low) / (high - low)) * 100)
         return min(100, max(0, voltage))
 
     def timer_counter(self):
         """Get timer counter value as total hours."""
-        return _parse_hours(
-            self._fan.timer_counter,
-            r"(?P<hours>\d+)h (?P<minutes>\d+)m (?P<seconds>\d+)s",
-            3,
-        )
+        return self._fan.param_number("timer_counter")
 
     def filter_timer_countdown(self):
         """Get filter time countdown as total hours."""
-        return _parse_hours(
-            self._fan.filter_timer_countdown,
-            r"(?P<days>\d+)d (?P<hours>\d+)h (?P<minutes>\d+)m",
-            1,
-        )
+        return self._fan.param_number("filter_timer_countdown")
 
     def filter_remaining(self):
         """Get filter lifetime remaining as a percentage."""
         remaining_hours = self.filter_timer_countdown()
-        setpoint_days = _parse_days(self._fan.filter_timer_setpoint)
+        setpoint_days = self._fan.param_number("filter_timer_setpoint")
         if remaining_hours is None or not setpoint_days:
             return None
 
@@ -355,27 +308,15 @@ class VentoSensor(CoordinatorEntity, SensorEntity):
 
     def night_mode_timer(self):
         """Get night mode timer value as total hours."""
-        return _parse_hours(
-            self._fan.night_mode_timer,
-            r"(?P<hours>\d+)h (?P<minutes>\d+)m",
-            2,
-        )
+        return self._fan.param_number("night_mode_timer")
 
     def party_mode_timer(self):
         """Get party mode timer value as total hours."""
-        return _parse_hours(
-            self._fan.party_mode_timer,
-            r"(?P<hours>\d+)h (?P<minutes>\d+)m",
-            2,
-        )
+        return self._fan.param_number("party_mode_timer")
 
     def machine_hours(self):
         """Get machine hours value as total hours."""
-        return _parse_hours(
-            self._fan.machine_hours,
-            r"(?P<days>\d+)d (?P<hours>\d+)h (?P<minutes>\d+)m",
-            1,
-        )
+        return self._fan.param_number("machine_hours")
 
     def screen_off_start_time(self):
         """Get screen display off interval start."""
@@ -402,6 +343,50 @@ class VentoSensor(CoordinatorEntity, SensorEntity):
         return self._fan.current_wifi_ip
 
 
+class TransportSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic counter of the UDP client talking to the fan."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, hass: HomeAssistant, config: ConfigEntry, spec) -> None:
+        """Initialize the transport sensor."""
+        coordinator: EcoVentCoordinator = hass.data[DOMAIN][config.entry_id]
+        super().__init__(coordinator, context=TRANSPORT_CONTEXT)
+        self._stat = spec.method
+        self._attr_name = spec.name
+        self._attr_unique_id = coordinator.data.id + spec.key
+        self._attr_native_unit_of_measurement = spec.native_unit_of_measurement
+        self._attr_device_class = spec.device_class
+        self._attr_state_class = spec.state_class
+        self._attr_entity_category = spec.entity_category
+        self._attr_entity_registry_enabled_default = spec.enable_by_default
+        self._attr_icon = spec.icon
+        if spec.suggested_display_precision is not None:
+            self._attr_suggested_display_precision = spec.suggested_display_precision
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.data.id)},
+            name=coordinator.data.name,
+        )
+
+    @property
+    def native_value(self):
+        """Return the counter from the live client, not the published snapshot."""
+        return self.coordinator.transport_value(self._stat)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, object] | None:
+        """Expose the round-trip histogram next to the smoothed round-trip time."""
+        if self._stat != "srtt":
+            return None
+        value = self.coordinator.transport_value
+        return {
+            "rto": value("rto"),
+            "samples": value("samples"),
+            "histogram": value("rtt_histogram"),
+        }
+
+
 class WeeklyScheduleSummarySensor(CoordinatorEntity, SensorEntity):
     """Single visible entity exposing the full weekly schedule summary."""
 
@@ -411,8 +396,8 @@ class WeeklyScheduleSummarySensor(CoordinatorEntity, SensorEntity):
     def __init__(self, hass: HomeAssistant, config: ConfigEntry) -> None:
         """Initialize the schedule summary sensor."""
         coordinator: EcoVentCoordinator = hass.data[DOMAIN][config.entry_id]
-        super().__init__(coordinator)
-        self._fan: Fan = coordinator._fan
+        context = coordinator.param_context("weekly_schedule_state") or frozenset()
+        super().__init__(coordinator, context=context | {SCHEDULE})
         self._attr_name = "Schedule"
         self._attr_unique_id = self._fan.id + "_schedule"
         self._attr_icon = "mdi:calendar-clock"
@@ -421,6 +406,11 @@ class WeeklyScheduleSummarySensor(CoordinatorEntity, SensorEntity):
             name=self._fan.name,
         )
 
+    @property
+    def _fan(self) -> Fan:
+        """Return the read-only fan state of the last coordinator update."""
+        return self.coordinator.data
+
     @property
     def native_value(self) -> str:
         """Return a compact summary state for the schedule entity."""
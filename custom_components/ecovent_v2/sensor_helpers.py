@@ -22,3 +22,22 @@ def enum_options_with_value(
     if native_value is not None and native_value not in result:
         result.append(native_value)
     return result
+
+
+class EnumOptions:
+    """Enum sensor options, extended the first time a value is reported.
+
+    The options list keeps its identity while every reported value is known,
+    so HA sees an unchanged capability on ordinary state writes.
+    """
+
+    def __init__(self, options: Sequence[str] | None) -> None:
+        self.options = None if options is None else list(options)
+        self._known = frozenset(self.options or ())
+
+    def include(self, value: str | None) -> list[str] | None:
+        """Return the options, adding ``value`` if it is new."""
+        if value is not None and value not in self._known:
+            self.options = enum_options_with_value(self.options, value)
+            self._known = frozenset(self.options or ())
+        return self.options
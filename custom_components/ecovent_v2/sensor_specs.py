@@ -7,7 +7,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import PERCENTAGE, REVOLUTIONS_PER_MINUTE, EntityCategory
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import UnitOfInformation, UnitOfTemperature, UnitOfTime
 
 @dataclass(frozen=True)
 class SensorSpec:
@@ -453,3 +453,97 @@ SENSOR_SPECS = (
         icon="mdi:ip-network",
     ),
 )
+
+
+# Transport counters of the UDP client; ``method`` names a key of
+# ``Fan.transport_stats``.
+TRANSPORT_SENSOR_SPECS = (
+    SensorSpec(
+        "_transport_requests",
+        "Requests",
+        "requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enable_by_default=False,
+        icon="mdi:upload-network-outline",
+    ),
+    SensorSpec(
+        "_transport_responses",
+        "Responses",
+        "responses",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enable_by_default=False,
+        icon="mdi:download-network-outline",
+    ),
+    SensorSpec(
+        "_transport_timeouts",
+        "Timeouts",
+        "timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enable_by_default=False,
+        icon="mdi:timer-alert-outline",
+    ),
+    SensorSpec(
+        "_transport_retries",
+        "Retries",
+        "retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enable_by_default=False,
+        icon="mdi:restart",
+    ),
+    SensorSpec(
+        "_transport_checksum_failures",
+        "Checksum failures",
+        "checksum_failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enable_by_default=False,
+        icon="mdi:alert-circle-outline",
+    ),
+    SensorSpec(
+        "_transport_bulk_read_fallbacks",
+        "Bulk read fallbacks",
+        "bulk_read_fallbacks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enable_by_default=False,
+        icon="mdi:call-split",
+    ),
+    SensorSpec(
+        "_transport_bytes_sent",
+        "Bytes sent",
+        "bytes_out",
+        UnitOfInformation.BYTES,
+        SensorDeviceClass.DATA_SIZE,
+        SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enable_by_default=False,
+        icon="mdi:upload",
+    ),
+    SensorSpec(
+        "_transport_bytes_received",
+        "Bytes received",
+        "bytes_in",
+        UnitOfInformation.BYTES,
+        SensorDeviceClass.DATA_SIZE,
+        SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enable_by_default=False,
+        icon="mdi:download",
+    ),
+    SensorSpec(
+        "_transport_round_trip_time",
+        "Round-trip time",
+        "srtt",
+        UnitOfTime.SECONDS,
+        SensorDeviceClass.DURATION,
+        SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enable_by_default=False,
+        icon="mdi:timer-sync-outline",
+        suggested_display_precision=3,
+    ),
+)
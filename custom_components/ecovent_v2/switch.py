@@ -270,8 +270,7 @@ class VentoSwitch(CoordinatorEntity, SwitchEntity):
     ) -> None:
         """Init switches."""
         coordinator: EcoVentCoordinator = hass.data[DOMAIN][config.entry_id]
-        super().__init__(coordinator)
-        self._fan: Fan = coordinator._fan
+        super().__init__(coordinator, context=coordinator.param_context(method))
         self._attr_device_class = device_class
         self._attr_entity_category = entity_category
         self._attr_name = name
@@ -287,21 +286,18 @@ class VentoSwitch(CoordinatorEntity, SwitchEntity):
             name=self._fan.name,
         )
 
+    @property
+    def _fan(self) -> Fan:
+        """Return the read-only fan state of the last coordinator update."""
+        return self.coordinator.data
+
     async def async_turn_on(self, **kwargs):
         """Turn the switch on."""
-        self._attr_is_on = True
-        await self.hass.async_add_executor_job(self._fan.set_param, self._func, "on")
-        # self._fan.set_param(self._func, "on")
-        # self.schedule_update_ha_state()
-        self.async_write_ha_state()
+        await self.coordinator.async_write_params({self._func: "on"})
 
     async def async_turn_off(self, **kwargs):
         """Turn the device off."""
-        self._attr_is_on = False
-        await self.hass.async_add_executor_job(self._fan.set_param, self._func, "off")
-        # self._fan.set_param(self._func, "off")
-        # self.schedule_update_ha_state()
-        self.async_write_ha_state()
+        await self.coordinator.async_write_params({self._func: "off"})
 
     def humidity_sensor_state(self):
         """Humidity sensor state."""
@@ -0,0 +1,157 @@
+"""Encode and decode micro-benchmarks of the EcoVent codec for every profile.
+
+Times ``build_packet``, ``encode_params``, the byte request path used by
+``do_func``, ``validate_packet``, ``parse_response`` and the property setters
+against a realistic full-update exchange, and counts allocations per call with
+``tracemalloc``: ``blocks`` and ``bytes`` are what a call leaves allocated (its
+result and any state growth), ``peak`` is its transient high-water mark.
+Run with ``python tests/bench_ecovent_codec.py --json codec.json`` and compare
+a later run with ``--compare codec.json``; it exits non-zero on regressions.
+"""
+
+import asyncio  # noqa: F401  (import before the component's select.py shadows it)
+import argparse
+import json
+from pathlib import Path
+import sys
+import timeit
+import tracemalloc
+
+from ecovent_test_helpers import Fan, full_update_payload, packet_with_payload
+
+
+PROFILES = ("vento", "extract_fan", "breezy", "freshbox", "arc")
+
+
+def _setattr_dispatch(fan, params):
+    for param_id, value in params:
+        setattr(fan, fan.params[param_id][0], value)
+
+
+def _operations(fan):
+    """Return ``{name: callable}`` for one profile's full-update exchange."""
+    request = fan._update_request()
+    read = fan.func["read"]
+    packet = packet_with_payload(full_update_payload(fan), fan._id.encode("ascii"))
+    params = [
+        (param_id, bytes(value))
+        for param_id, value in fan._parse_frame(packet)
+        if value is not None
+    ]
+    return {
+        "build_packet": lambda: fan.build_packet(read + fan.encode_params(request)),
+        "encode_params": lambda: fan.encode_params(request),
+        "encode_request": lambda: fan.encode_frame(fan._encode_request(read, request)),
+        "validate_packet": lambda: fan.validate_packet(packet),
+        "parse_response": lambda: fan.parse_response(packet),
+        "setters": lambda: _setattr_dispatch(fan, params),
+    }
+
+
+def allocations(call, calls=200):
+    """Return ``(blocks, bytes, peak)`` allocated per call of ``call``."""
+    call()
+    results = []
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(calls):
+            results.append(call())
+        after = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        call()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    # The list holding the results grows too; leave it out of the count.
+    stats = [stat for stat in stats if stat.traceback[0].filename != __file__]
+    return (
+        sum(stat.count_diff for stat in stats) / calls,
+        sum(stat.size_diff for stat in stats) / calls,
+        peak,
+    )
+
+
+def bench_profile(profile_key, number=2000):
+    fan = Fan("192.0.2.1")
+    fan._set_device_profile(profile_key)
+    results = []
+    for operation, call in _operations(fan).items():
+        seconds = min(timeit.repeat(call, number=number, repeat=5))
+        blocks, size, peak = allocations(call)
+        results.append(
+            {
+                "profile": profile_key,
+                "operation": operation,
+                "params": len(fan._request_param_ids(fan._update_request())),
+                "us": seconds / number * 1e6,
+                "blocks": blocks,
+                "bytes": size,
+                "peak": peak,
+            }
+        )
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """Return descriptions of results slower or allocating more than ``baseline``."""
+    previous = {
+        (result["profile"], result["operation"]): result
+        for result in baseline["results"]
+    }
+    found = []
+    for result in results:
+        old = previous.get((result["profile"], result["operation"]))
+        if old is None:
+            continue
+        if result["us"] > old["us"] * (1 + tolerance):
+            found.append(
+                f"{result['profile']} {result['operation']}: "
+                f"{old['us']:.2f} us -> {result['us']:.2f} us"
+            )
+        if result["blocks"] > old["blocks"] + 0.5:
+            found.append(
+                f"{result['profile']} {result['operation']}: "
+                f"{old['blocks']:.1f} -> {result['blocks']:.1f} blocks per call"
+            )
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", nargs="+", default=PROFILES, choices=PROFILES)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--json", type=Path, help="also write results to this file")
+    parser.add_argument("--compare", type=Path, help="baseline written by --json")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = []
+    for profile_key in args.profiles:
+        results += bench_profile(profile_key, args.number)
+    print(
+        f"{'profile':<12} {'operation':<16} {'params':>6} {'us':>8} "
+        f"{'blocks':>7} {'bytes':>8} {'peak':>8}"
+    )
+    for result in results:
+        print(
+            f"{result['profile']:<12} {result['operation']:<16} "
+            f"{result['params']:>6} {result['us']:>8.2f} {result['blocks']:>7.1f} "
+            f"{result['bytes']:>8.0f} {result['peak']:>8}"
+        )
+    if args.json is not None:
+        args.json.write_text(json.dumps({"results": results}, indent=2) + "\n")
+    if args.compare is not None:
+        found = regressions(
+            results, json.loads(args.compare.read_text()), args.tolerance
+        )
+        for line in found:
+            print(f"regression: {line}")
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Decode-time benchmark for full EcoVent update responses.
+
+Compares the compiled decoder table with dispatching every parameter through
+``setattr`` and its property setter. Run with
+``python tests/bench_ecovent_decoders.py``.
+"""
+
+import asyncio  # noqa: F401  (import before the component's select.py shadows it)
+import timeit
+
+from ecovent_test_helpers import Fan, full_update_payload, packet_with_payload
+
+
+PROFILES = ("vento", "breezy")
+
+
+def _setattr_dispatch(fan, params):
+    for param_id, value in params:
+        setattr(fan, fan.params[param_id][0], value)
+
+
+def bench_profile(profile_key, number=2000):
+    fan = Fan("192.0.2.1")
+    fan._set_device_profile(profile_key)
+    packet = packet_with_payload(full_update_payload(fan))
+    params = [item for item in fan._parse_frame(packet) if item[1] is not None]
+
+    table = min(timeit.repeat(lambda: fan._apply_params(params), number=number))
+    dispatch = min(
+        timeit.repeat(lambda: _setattr_dispatch(fan, params), number=number)
+    )
+    return {
+        "profile": profile_key,
+        "params": len(params),
+        "table_us": table / number * 1e6,
+        "setattr_us": dispatch / number * 1e6,
+    }
+
+
+def main():
+    print(f"{'profile':<8} {'params':>6} {'table us':>9} {'setattr us':>11} {'speedup':>8}")
+    for profile_key in PROFILES:
+        result = bench_profile(profile_key)
+        print(
+            f"{result['profile']:<8} {result['params']:>6} "
+            f"{result['table_us']:>9.1f} {result['setattr_us']:>11.1f} "
+            f"{result['setattr_us'] / result['table_us']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Fleet-scale polling benchmark against emulated EcoVent devices.
+
+Starts ``tests/ecovent_emulator.py`` in a subprocess, so the measured CPU time
+is the client's alone, and polls N devices concurrently from one event loop as
+the coordinator does. For each fleet size it reports throughput, p50/p99
+latency, client CPU time per call and the sockets the client holds for
+``async_update``, ``async_quick_update``, ``async_set_param`` and
+``async_read_weekly_schedule_day``. Run with
+``python tests/bench_ecovent_fleet.py --sizes 1 10 100 500 --json fleet.json``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+from ecovent_test_helpers import Fan
+
+
+EMULATOR_PATH = Path(__file__).with_name("ecovent_emulator.py")
+DEFAULT_SIZES = (1, 10, 50, 100, 250, 500)
+OPERATIONS = {
+    "update": lambda fan: fan.async_update(),
+    "quick_update": lambda fan: fan.async_quick_update(),
+    "set_param": lambda fan: fan.async_set_param("state", "on"),
+    "read_weekly_schedule_day": lambda fan: fan.async_read_weekly_schedule_day(1),
+}
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def socket_count():
+    """Return how many sockets this process holds, or ``None`` without /proc."""
+    try:
+        fds = os.listdir("/proc/self/fd")
+    except OSError:
+        return None
+    count = 0
+    for fd in fds:
+        try:
+            count += os.readlink(f"/proc/self/fd/{fd}").startswith("socket:")
+        except OSError:
+            pass
+    return count
+
+
+def start_emulator(count, profile_key, latency, jitter, loss):
+    """Start ``count`` emulated devices and return the process and addresses."""
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(EMULATOR_PATH),
+            f"--count={count}",
+            f"--profile={profile_key}",
+            "--port=0",
+            f"--latency={latency}",
+            f"--jitter={jitter}",
+            f"--loss={loss}",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    addresses = []
+    for _ in range(count):
+        line = process.stdout.readline()
+        if not line:
+            process.kill()
+            raise RuntimeError("emulator exited before serving every device")
+        host, port = line.split()[-1].rsplit(":", 1)
+        addresses.append((host, int(port)))
+    return process, addresses
+
+
+async def run_operation(fans, operation, rounds):
+    call = OPERATIONS[operation]
+    latencies = []
+    failures = 0
+
+    async def timed(fan):
+        nonlocal failures
+        started = time.perf_counter()
+        result = await call(fan)
+        latencies.append(time.perf_counter() - started)
+        if result is False or result is None:
+            failures += 1
+
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(timed(fan) for fan in fans))
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    calls = len(latencies)
+    return {
+        "devices": len(fans),
+        "operation": operation,
+        "calls": calls,
+        "failures": failures,
+        "throughput_per_s": calls / wall,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "cpu_ms_per_call": cpu / calls * 1000,
+        "client_sockets": socket_count(),
+    }
+
+
+async def bench_fleet(addresses, rounds):
+    baseline_sockets = socket_count()
+    fans = [Fan(host, port=port) for host, port in addresses]
+    try:
+        await asyncio.gather(*(fan.async_init_device() for fan in fans))
+        results = []
+        for operation in OPERATIONS:
+            if operation == "read_weekly_schedule_day" and not fans[
+                0
+            ].supports_parameter("weekly_schedule_setup"):
+                continue
+            result = await run_operation(fans, operation, rounds)
+            if baseline_sockets is not None:
+                result["client_sockets"] -= baseline_sockets
+            results.append(result)
+        return results
+    finally:
+        for fan in fans:
+            fan.async_disconnect()
+
+
+def bench(sizes, profile_key, rounds, latency=0.0, jitter=0.0, loss=0.0):
+    results = []
+    for size in sizes:
+        process, addresses = start_emulator(size, profile_key, latency, jitter, loss)
+        try:
+            results += asyncio.run(bench_fleet(addresses, rounds))
+        finally:
+            process.kill()
+            process.wait()
+    return {
+        "profile": profile_key,
+        "rounds": rounds,
+        "latency_s": latency,
+        "jitter_s": jitter,
+        "loss": loss,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--profile", default="vento", choices=Fan.device_profiles)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--json", type=Path, help="also write results to this file")
+    args = parser.parse_args()
+
+    report = bench(
+        args.sizes, args.profile, args.rounds, args.latency, args.jitter, args.loss
+    )
+    print(
+        f"{'devices':>7} {'operation':<25} {'calls/s':>9} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'cpu ms':>7} {'sockets':>7} {'failed':>6}"
+    )
+    for result in report["results"]:
+        print(
+            f"{result['devices']:>7} {result['operation']:<25} "
+            f"{result['throughput_per_s']:>9.0f} {result['p50_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {result['cpu_ms_per_call']:>7.3f} "
+            f"{result['client_sockets']!s:>7} {result['failures']:>6}"
+        )
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Asyncio UDP emulator of EcoVent devices for load and latency testing.
+
+Each ``EmulatedDevice`` answers the full frame format (``FDFD`` marker, id and
+password header, ``0xFF`` page, ``0xFE`` size and ``0xFD`` unsupported
+markers, 16-bit checksum) for one ``DeviceProfile``, with values seeded from
+the profile's ``params`` table. Replies can be delayed, jittered and dropped.
+Run ``python tests/ecovent_emulator.py --profile breezy --count 3`` to serve
+devices on localhost until interrupted.
+"""
+
+import argparse
+import asyncio
+import random
+
+from ecovent_test_helpers import SAMPLE_VALUE_SIZES, Fan, encode_response_param
+
+
+FRAME_MARKER = b"\xfd\xfd"
+PACKET_TYPE = 0x02
+DEFAULT_DEVICE_ID = "DEFAULT_DEVICEID"
+SCHEDULE_PARAM = 0x0077
+TEXT_VALUES = {"wifi_name": b"emulated", "wifi_pasword": b"password"}
+
+FUNC_READ = int(Fan.func["read"], 16)
+FUNC_WRITE = int(Fan.func["write"], 16)
+FUNC_WRITE_RETURN = int(Fan.func["write_return"], 16)
+FUNC_INC = int(Fan.func["inc"], 16)
+FUNC_DEC = int(Fan.func["dec"], 16)
+FUNC_RESPONSE = int(Fan.func["resp"], 16)
+
+
+def checksum(body):
+    return (sum(body) & 0xFFFF).to_bytes(2, "little")
+
+
+def encode_frame(device_id, password, func, payload):
+    """Return a device frame carrying ``payload`` for function ``func``."""
+    device_id = device_id.encode("ascii")
+    password = password.encode("ascii")
+    body = (
+        bytes((PACKET_TYPE, len(device_id)))
+        + device_id
+        + bytes((len(password),))
+        + password
+        + bytes((func,))
+        + bytes(payload)
+    )
+    return FRAME_MARKER + body + checksum(body)
+
+
+def parse_request(frame):
+    """Return ``(device_id, password, func, params)`` of a request, else ``None``.
+
+    ``params`` lists ``(param_id, value)`` pairs. Reads carry no value unless
+    a ``0xFE`` size precedes the id (the schedule selector); writes carry one
+    byte unless a size is given.
+    """
+    if len(frame) < 8 or frame[:2] != FRAME_MARKER:
+        return None
+    if checksum(frame[2:-2]) != frame[-2:]:
+        return None
+    end = len(frame) - 2
+    pointer = 3
+    id_size = frame[pointer]
+    device_id = frame[pointer + 1 : pointer + 1 + id_size].decode("ascii", "replace")
+    pointer += 1 + id_size
+    if pointer >= end:
+        return None
+    password_size = frame[pointer]
+    password = frame[pointer + 1 : pointer + 1 + password_size].decode(
+        "ascii", "replace"
+    )
+    pointer += 1 + password_size
+    if pointer >= end:
+        return None
+    func = frame[pointer]
+    pointer += 1
+    default_size = 0 if func == FUNC_READ else 1
+    params = []
+    page = 0
+    size = default_size
+    while pointer < end:
+        byte = frame[pointer]
+        pointer += 1
+        if byte == 0xFF:
+            page = frame[pointer]
+            pointer += 1
+        elif byte == 0xFE:
+            size = frame[pointer]
+            pointer += 1
+        elif byte == 0xFD:
+            pointer += 1
+        else:
+            if pointer + size > end:
+                return None
+            params.append(((page << 8) | byte, frame[pointer : pointer + size]))
+            pointer += size
+            page = 0
+            size = default_size
+    return device_id, password, func, params
+
+
+def default_value(profile_key, name):
+    """Return the initial raw value of parameter ``name``."""
+    if name == "unit_type":
+        model_id = next(
+            model_id
+            for model_id, model in Fan.device_models.items()
+            if model.profile_key == profile_key
+        )
+        return model_id.to_bytes(2, "big")
+    if name in TEXT_VALUES:
+        return TEXT_VALUES[name]
+    return bytes(range(1, SAMPLE_VALUE_SIZES.get(name, 1) + 1))
+
+
+class EmulatedDevice:
+    """Parameter memory and request handling of one EcoVent device."""
+
+    def __init__(
+        self,
+        device_id,
+        profile_key="vento",
+        password="1111",
+        *,
+        latency=0.0,
+        jitter=0.0,
+        loss=0.0,
+        seed=None,
+    ):
+        profile = Fan.device_profiles[profile_key]
+        self.device_id = device_id
+        self.profile_key = profile_key
+        self.password = password
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.random = random.Random(seed)
+        params = getattr(Fan, profile.params_name)
+        self.values = {
+            param_id: default_value(profile_key, name)
+            for param_id, (name, *_) in params.items()
+        }
+        if 0x007C in self.values:
+            self.values[0x007C] = device_id.encode("ascii")
+        self.schedule = {
+            (day, period): bytes((day, period, 1, 0, 0, period * 6 % 24))
+            for day in range(1, 8)
+            for period in range(1, 5)
+        }
+        self.requests = 0
+        self.replies = 0
+        self.dropped = 0
+
+    def handle(self, frame):
+        """Apply a request frame and return the reply frame, or ``None``."""
+        request = parse_request(frame)
+        if request is None:
+            return None
+        device_id, password, func, params = request
+        if device_id not in (self.device_id, DEFAULT_DEVICE_ID):
+            return None
+        if password != self.password:
+            return None
+        self.requests += 1
+        if func in (FUNC_WRITE, FUNC_WRITE_RETURN):
+            for param_id, value in params:
+                self._write(param_id, value)
+            if func == FUNC_WRITE:
+                return None
+        elif func in (FUNC_INC, FUNC_DEC):
+            for param_id, _ in params:
+                self._step(param_id, 1 if func == FUNC_INC else -1)
+        elif func != FUNC_READ:
+            return None
+        payload = []
+        for param_id, value in params:
+            payload += self._read(param_id, value)
+        return encode_frame(self.device_id, self.password, FUNC_RESPONSE, payload)
+
+    def _write(self, param_id, value):
+        if param_id == SCHEDULE_PARAM and len(value) == 6:
+            self.schedule[(value[0], value[1])] = bytes(value)
+        elif param_id in self.values:
+            self.values[param_id] = bytes(value)
+
+    def _step(self, param_id, step):
+        value = self.values.get(param_id)
+        if value is not None:
+            number = (int.from_bytes(value, "big") + step) % (1 << (8 * len(value)))
+            self.values[param_id] = number.to_bytes(len(value), "big")
+
+    def _read(self, param_id, value):
+        if param_id == SCHEDULE_PARAM:
+            selector = tuple(value[:2]) if len(value) >= 2 else (1, 1)
+            record = self.schedule.get(selector)
+            if record is not None:
+                return encode_response_param(param_id, record)
+        elif param_id in self.values:
+            return encode_response_param(param_id, self.values[param_id])
+        unsupported = [0xFD, param_id & 0xFF]
+        return unsupported if param_id <= 0xFF else [0xFF, param_id >> 8, *unsupported]
+
+    def reply_delay(self):
+        """Return how long to hold the next reply, or ``None`` to drop it."""
+        if self.loss and self.random.random() < self.loss:
+            return None
+        jitter = self.random.uniform(-self.jitter, self.jitter) if self.jitter else 0
+        return max(0.0, self.latency + jitter)
+
+
+class DeviceProtocol(asyncio.DatagramProtocol):
+    """Serve one ``EmulatedDevice`` on its own UDP socket."""
+
+    def __init__(self, device):
+        self.device = device
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        reply = self.device.handle(data)
+        if reply is None:
+            return
+        delay = self.device.reply_delay()
+        if delay is None:
+            self.device.dropped += 1
+            return
+        self.device.replies += 1
+        if delay:
+            asyncio.get_running_loop().call_later(delay, self._send, reply, addr)
+        else:
+            self._send(reply, addr)
+
+    def _send(self, reply, addr):
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.sendto(reply, addr)
+
+
+class DeviceEmulator:
+    """A set of emulated devices listening on localhost UDP ports.
+
+    Use as an async context manager; ``addresses`` lists ``(host, port)`` of
+    each started device in order.
+    """
+
+    def __init__(self, host="127.0.0.1"):
+        self.host = host
+        self.devices = []
+        self.addresses = []
+        self._transports = []
+
+    async def start(self, count=1, profile_key="vento", port=0, **options):
+        """Start ``count`` devices; ``port`` > 0 serves them on consecutive ports."""
+        loop = asyncio.get_running_loop()
+        seed = options.pop("seed", None)
+        for _ in range(count):
+            index = len(self.devices)
+            device = EmulatedDevice(
+                f"EMU{index:013d}",
+                profile_key,
+                seed=None if seed is None else seed + index,
+                **options,
+            )
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda device=device: DeviceProtocol(device),
+                local_addr=(self.host, port + index if port else 0),
+            )
+            self.devices.append(device)
+            self.addresses.append(transport.get_extra_info("sockname")[:2])
+            self._transports.append(transport)
+        return self.devices[-count:]
+
+    def close(self):
+        for transport in self._transports:
+            transport.close()
+        self._transports = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+async def _serve(args):
+    async with DeviceEmulator(args.host) as emulator:
+        await emulator.start(
+            args.count,
+            args.profile,
+            args.port,
+            latency=args.latency,
+            jitter=args.jitter,
+            loss=args.loss,
+        )
+        for device, (host, port) in zip(emulator.devices, emulator.addresses):
+            print(
+                f"{device.device_id} {device.profile_key} {host}:{port}", flush=True
+            )
+        await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", default="vento", choices=Fan.device_profiles)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
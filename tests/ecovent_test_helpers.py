@@ -15,9 +15,53 @@ SPEC.loader.exec_module(ecoventv2)
 Fan = ecoventv2.Fan
 
 
-def packet_with_payload(payload):
+def packet_with_payload(payload, fan_id=b"DEFAULT_DEVICEID"):
     body = (
-        bytes([0x02, 0x10]) + b"DEFAULT_DEVICEID" + bytes([0x00, 0x06]) + bytes(payload)
+        bytes([0x02, len(fan_id)]) + fan_id + bytes([0x00, 0x06]) + bytes(payload)
     )
     checksum = sum(body) & 0xFFFF
     return b"\xfd\xfd" + body + checksum.to_bytes(2, byteorder="little")
+
+
+SAMPLE_VALUE_SIZES = {
+    "unit_type": 2,
+    "fan1_speed": 2,
+    "fan2_speed": 2,
+    "battery_voltage": 2,
+    "timer_counter": 3,
+    "machine_hours": 4,
+    "filter_timer_countdown": 4,
+    "wifi_assigned_ip": 4,
+    "wifi_assigned_netmask": 4,
+    "wifi_main_gateway": 4,
+    "current_wifi_ip": 4,
+    "firmware": 6,
+    "weekly_schedule_setup": 6,
+}
+
+
+def encode_response_param(param_id, value):
+    payload = []
+    if param_id > 0xFF:
+        payload += [0xFF, param_id >> 8]
+    if len(value) > 1:
+        payload += [0xFE, len(value)]
+    return payload + [param_id & 0xFF, *value]
+
+
+def full_update_payload(fan):
+    """Return a response payload answering ``fan``'s full update request."""
+    unit_type_id = next(
+        model_id
+        for model_id, model in fan.device_models.items()
+        if model.profile_key == fan.profile_key
+    )
+    payload = []
+    for param_id in fan._request_param_ids(fan._update_request()):
+        name = fan.params[param_id][0]
+        if name == "unit_type":
+            value = unit_type_id.to_bytes(2, "big")
+        else:
+            value = bytes(range(1, SAMPLE_VALUE_SIZES.get(name, 1) + 1))
+        payload += encode_response_param(param_id, value)
+    return payload
@@ -0,0 +1,206 @@
+"""Replay a recorded EcoVent capture at full speed.
+
+Every device in the capture gets a fresh ``Fan``. The decode pass feeds each
+received frame through ``parse_response``. The session pass resends each
+recorded request through the client's request path against a
+``ReplayRoute``, then takes a snapshot when values changed, as the
+coordinator does after a poll. Record a capture with
+the ``ecovent_v2.start_capture`` service (or
+``protocol_transport.start_capture(path)``) and run
+``python tests/replay_ecovent_capture.py capture.evcap``.
+"""
+
+import asyncio
+import argparse
+from collections import defaultdict, deque
+import json
+from pathlib import Path
+import time
+
+from ecovent_test_helpers import Fan
+from protocol_capture import RECEIVED, SENT, load_capture
+
+
+FRAME_MARKER = b"\xfd\xfd"
+READ_FUNCTION = int(Fan.func["read"], 16)
+
+
+def request_param_ids(frame):
+    """Return the parameter ids of a request frame, or ``None`` if malformed."""
+    end = len(frame) - 2
+    if end < 4 or frame[:2] != FRAME_MARKER:
+        return None
+    pointer = 4 + frame[3]  # frame marker, packet type and device id
+    if pointer >= end:
+        return None
+    pointer += 1 + frame[pointer]  # password
+    if pointer >= end:
+        return None
+    default_size = 0 if frame[pointer] == READ_FUNCTION else 1
+    pointer += 1
+    ids = set()
+    page = 0
+    size = default_size
+    while pointer < end:
+        byte = frame[pointer]
+        if byte in (0xFF, 0xFE, 0xFD):
+            if pointer + 1 >= end:
+                return None
+            if byte == 0xFF:
+                page = frame[pointer + 1]
+            elif byte == 0xFE:
+                size = frame[pointer + 1]
+            pointer += 2
+            continue
+        ids.add((page << 8) | byte)
+        pointer += 1 + size
+        page = 0
+        size = default_size
+    return frozenset(ids)
+
+
+def device_sessions(records):
+    """Group records by device address, keeping capture order."""
+    sessions = defaultdict(list)
+    for record in records:
+        sessions[(record.host, record.port)].append(record)
+    return dict(sessions)
+
+
+class ReplayRoute:
+    """A device route answering requests from a recorded session.
+
+    Each sent frame is answered with the frames received after its recorded
+    counterpart and before the next request. Waiting never blocks: a request
+    the capture has no reply for times out immediately.
+    """
+
+    def __init__(self, records):
+        self.device_id = None
+        self.addr = None
+        self.unanswered = 0
+        self._replies = defaultdict(deque)
+        self._responses = deque()
+        replies = None
+        for record in records:
+            if record.direction == SENT:
+                self.addr = (record.host, record.port)
+                replies = []
+                self._replies[record.frame].append(replies)
+            elif replies is not None:
+                replies.append(record.frame)
+
+    @property
+    def is_open(self):
+        return True
+
+    def send(self, frame):
+        recorded = self._replies.get(bytes(frame))
+        if recorded:
+            self._responses.extend(recorded.popleft())
+        else:
+            self.unanswered += 1
+        return True
+
+    async def receive(self, timeout):
+        return self._responses.popleft() if self._responses else None
+
+    def discard_pending(self):
+        self._responses.clear()
+
+    def close(self):
+        pass
+
+
+def replay_decode(records, repeat=1):
+    """Feed every received frame through ``parse_response``."""
+    frames = [record.frame for record in records if record.direction == RECEIVED]
+    fan = Fan("192.0.2.1")
+    accepted = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for frame in frames:
+            accepted += fan.parse_response(frame)
+    elapsed = time.perf_counter() - started
+    calls = len(frames) * repeat
+    return fan, {
+        "frames": len(frames),
+        "accepted": accepted // repeat,
+        "us_per_frame": elapsed / calls * 1e6 if calls else 0.0,
+    }
+
+
+async def replay_session(records):
+    """Drive a ``Fan`` through the recorded requests of one device."""
+    route = ReplayRoute(records)
+    host, port = route.addr or ("192.0.2.1", 4000)
+    fan = Fan(host, port=port)
+    fan._endpoint = route
+    requests = [record.frame for record in records if record.direction == SENT]
+    answered = 0
+    snapshots = 0
+    started = time.perf_counter()
+    for frame in requests:
+        expected = request_param_ids(frame)
+        answered += await fan._async_do_request(None, expected, 1, frame=frame)
+        if fan.has_changed_params:
+            fan.snapshot()
+            fan.pop_changed_params()
+            snapshots += 1
+    elapsed = time.perf_counter() - started
+    return fan, {
+        "requests": len(requests),
+        "answered": answered,
+        "unanswered": route.unanswered,
+        "snapshots": snapshots,
+        "us_per_request": elapsed / len(requests) * 1e6 if requests else 0.0,
+    }
+
+
+def replay(records, repeat=1):
+    results = []
+    for (host, port), session in device_sessions(records).items():
+        _, decode = replay_decode(session, repeat)
+        fan, exchange = asyncio.run(replay_session(session))
+        results.append(
+            {
+                "host": host,
+                "port": port,
+                "device_id": fan.device_search or fan.id,
+                "profile": fan.profile_key,
+                **decode,
+                **exchange,
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path)
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--json", type=Path, help="also write results to this file")
+    args = parser.parse_args()
+
+    records = load_capture(args.capture)
+    if records:
+        print(
+            f"{len(records)} frames over "
+            f"{records[-1].timestamp - records[0].timestamp:.1f} s"
+        )
+    results = replay(records, args.repeat)
+    for result in results:
+        print(
+            f"{result['host']}:{result['port']} {result['device_id']} "
+            f"({result['profile']}): {result['frames']} frames, "
+            f"{result['accepted']} accepted, {result['us_per_frame']:.1f} us/frame; "
+            f"{result['answered']}/{result['requests']} requests answered, "
+            f"{result['snapshots']} snapshots, "
+            f"{result['us_per_request']:.1f} us/request"
+        )
+    if args.json is not None:
+        args.json.write_text(json.dumps({"results": results}, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Tests for EcoVent traffic capture and replay."""
+
+import ast
+import asyncio
+import io
+from pathlib import Path
+import tempfile
+import unittest
+
+from ecovent_emulator import DeviceEmulator
+from ecovent_test_helpers import COMPONENT_PATH, Fan, packet_with_payload
+from protocol_capture import RECEIVED, SENT, CaptureWriter, load_capture, read_capture
+import protocol_transport
+from replay_ecovent_capture import replay, replay_session, request_param_ids
+
+
+class CaptureFormatTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "capture.evcap"
+
+    def test_records_round_trip(self):
+        with CaptureWriter.open(self.path) as writer:
+            writer.record(SENT, ("192.0.2.7", 4000), b"\xfd\xfd\x02", timestamp=12.5)
+            writer.record(RECEIVED, ("192.0.2.7", 4000), b"reply", timestamp=12.75)
+
+        self.assertEqual(
+            [tuple(record) for record in load_capture(self.path)],
+            [
+                (SENT, 12.5, "192.0.2.7", 4000, b"\xfd\xfd\x02"),
+                (RECEIVED, 12.75, "192.0.2.7", 4000, b"reply"),
+            ],
+        )
+
+    def test_records_after_close_are_dropped(self):
+        writer = CaptureWriter.open(self.path)
+        writer.record(SENT, ("192.0.2.7", 4000), b"frame")
+        writer.close()
+        writer.record(SENT, ("192.0.2.7", 4000), b"late")
+        writer.close()
+
+        self.assertEqual([record.frame for record in load_capture(self.path)], [b"frame"])
+
+    def test_rejects_foreign_and_truncated_files(self):
+        with self.assertRaises(ValueError):
+            list(read_capture(io.BytesIO(b"not a capture")))
+        with CaptureWriter.open(self.path) as writer:
+            writer.record(SENT, ("192.0.2.7", 4000), b"frame")
+        with self.assertRaises(ValueError):
+            list(read_capture(io.BytesIO(self.path.read_bytes()[:-1])))
+
+    def test_request_param_ids_follows_pages_and_sizes(self):
+        fan = Fan("192.0.2.1")
+        read = fan.encode_frame(fan._encode_request(fan.func["read"], "000100770302"))
+        write = fan.encode_frame(
+            fan._encode_request(fan.func["write_return"], "0302", "05")
+        )
+
+        self.assertEqual(request_param_ids(read), {0x0001, 0x0077, 0x0302})
+        self.assertEqual(request_param_ids(write), {0x0302})
+        self.assertIsNone(request_param_ids(packet_with_payload([])[:4]))
+
+
+class CaptureReplayTest(unittest.TestCase):
+    def test_replayed_session_reproduces_live_state(self):
+        async def run(path):
+            async with DeviceEmulator() as emulator:
+                await emulator.start(1, "breezy")
+                host, port = emulator.addresses[0]
+                fan = Fan(host, port=port)
+                protocol_transport.start_capture(path)
+                try:
+                    self.assertTrue(await fan.async_init_device())
+                    await fan.async_set_param("state", "off")
+                finally:
+                    protocol_transport.stop_capture()
+                    fan.async_disconnect()
+            return fan
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "capture.evcap"
+            live = asyncio.run(run(path))
+            records = load_capture(path)
+
+        replayed, result = asyncio.run(replay_session(records))
+        self.assertEqual(result["answered"], result["requests"])
+        self.assertEqual(result["unanswered"], 0)
+        self.assertEqual(replayed.profile_key, "breezy")
+        for param_id, (name, *_) in live.params.items():
+            self.assertEqual(getattr(replayed, name), getattr(live, name), name)
+
+        [summary] = replay(records)
+        self.assertEqual(summary["accepted"], summary["frames"])
+        self.assertEqual(summary["device_id"], live.id)
+
+
+class CaptureServiceTest(unittest.TestCase):
+    def test_services_open_and_close_capture_in_executor(self):
+        tree = ast.parse((COMPONENT_PATH / "__init__.py").read_text())
+        executor_jobs = {
+            node.args[0].attr
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "async_add_executor_job"
+            and isinstance(node.args[0], ast.Attribute)
+        }
+        services = (COMPONENT_PATH / "services.yaml").read_text()
+
+        self.assertLessEqual({"start_capture", "stop_capture"}, executor_jobs)
+        self.assertIn("\nstart_capture:", services)
+        self.assertIn("\nstop_capture:", services)
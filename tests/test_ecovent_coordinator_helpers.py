@@ -0,0 +1,89 @@
+"""Regression tests for Home Assistant independent coordinator helpers."""
+
+from datetime import timedelta
+import unittest
+
+from ecovent_test_helpers import COMPONENT_PATH  # noqa: F401  Ensures sys.path setup.
+from coordinator_helpers import (
+    SCHEDULE,
+    TRANSPORT_CONTEXT,
+    ListenerChanges,
+    listener_should_update,
+    next_update_interval,
+    polling_bounds,
+)
+
+
+def _notified(contexts, changed):
+    return [
+        name for name, context in contexts.items()
+        if listener_should_update(context, changed)
+    ]
+
+
+class ListenerChangesTest(unittest.TestCase):
+    CONTEXTS = {
+        "state": frozenset({0x0001}),
+        "schedule": frozenset({0x0072, SCHEDULE}),
+        "transport": TRANSPORT_CONTEXT,
+        "no_context": None,
+    }
+
+    def test_selected_day_change_notifies_schedule_listeners(self):
+        changes = ListenerChanges()
+        changes.mark(SCHEDULE)
+
+        changed = changes.pop(set())
+        self.assertEqual(
+            _notified(self.CONTEXTS, changed), ["schedule", "transport", "no_context"]
+        )
+        self.assertEqual(changes.pop(set()), set())
+
+    def test_quiet_update_notifies_only_transport_listeners(self):
+        changed = ListenerChanges().pop(set())
+        self.assertEqual(_notified(self.CONTEXTS, changed), ["transport"])
+
+    def test_parameter_change_notifies_its_listeners(self):
+        changed = ListenerChanges().pop({0x0001})
+        self.assertEqual(
+            _notified(self.CONTEXTS, changed), ["state", "transport", "no_context"]
+        )
+
+    def test_profile_switch_still_means_every_listener(self):
+        changes = ListenerChanges()
+        changes.mark(SCHEDULE)
+        self.assertIsNone(changes.pop(None))
+        self.assertEqual(changes.pop(set()), set())
+
+
+class AdaptivePollingTest(unittest.TestCase):
+    MINIMUM = timedelta(seconds=5)
+    MAXIMUM = timedelta(seconds=120)
+
+    def _next(self, current, active=False, off=False):
+        return next_update_interval(
+            timedelta(seconds=current), self.MINIMUM, self.MAXIMUM, active, off
+        )
+
+    def test_activity_shrinks_to_minimum(self):
+        self.assertEqual(self._next(80, active=True), self.MINIMUM)
+        self.assertEqual(self._next(80, active=True, off=True), self.MINIMUM)
+
+    def test_steady_device_grows_until_maximum(self):
+        self.assertEqual(self._next(5), timedelta(seconds=10))
+        self.assertEqual(self._next(40), timedelta(seconds=80))
+        self.assertEqual(self._next(80), self.MAXIMUM)
+        self.assertEqual(self._next(120), self.MAXIMUM)
+        self.assertEqual(self._next(5, off=True), self.MAXIMUM)
+
+    def test_bounds_default_to_configured_update_interval(self):
+        self.assertEqual(polling_bounds(5, None, 120), (5, 120))
+        self.assertEqual(polling_bounds(30, 10, 120), (10, 120))
+
+    def test_bounds_clamp_maximum_to_minimum(self):
+        self.assertEqual(polling_bounds(200, None, 120), (200, 200))
+        self.assertEqual(polling_bounds(30, 60, 20), (60, 60))
+
+
+if __name__ == "__main__":
+    unittest.main()
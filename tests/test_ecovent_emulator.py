@@ -0,0 +1,82 @@
+"""Tests for the local EcoVent device emulator."""
+
+import asyncio
+import unittest
+
+from ecovent_emulator import DeviceEmulator, EmulatedDevice, parse_request
+from ecovent_test_helpers import Fan
+
+
+class EmulatedDeviceTest(unittest.TestCase):
+    def test_parses_client_frames_with_pages_and_selector(self):
+        fan = Fan("192.0.2.1")
+        device_id, password, func, params = parse_request(
+            fan.encode_frame(fan._encode_request(fan.func["read"], "000100770302"))
+        )
+
+        self.assertEqual((device_id, password, func), ("DEFAULT_DEVICEID", "1111", 1))
+        self.assertEqual(
+            [(param_id, bytes(value)) for param_id, value in params],
+            [(0x0001, b""), (0x0077, b"\x01\x01"), (0x0302, b"")],
+        )
+
+    def test_ignores_other_devices_and_wrong_password(self):
+        device = EmulatedDevice("EMU0000000000000")
+        fan = Fan("192.0.2.1", password="2222")
+        request = fan._encode_request(fan.func["read"], "0001")
+
+        self.assertIsNone(device.handle(fan.encode_frame(request)))
+        self.assertIsNone(
+            device.handle(
+                fan.encode_frame(request, fan_id="EMU0000000000009", password="1111")
+            )
+        )
+        self.assertIsNotNone(device.handle(fan.encode_frame(request, password="1111")))
+
+    def test_reply_delay_applies_latency_jitter_and_loss(self):
+        device = EmulatedDevice("EMU0000000000000", latency=0.02, jitter=0.01, seed=1)
+        delays = [device.reply_delay() for _ in range(100)]
+        self.assertTrue(all(0.01 <= delay <= 0.03 for delay in delays))
+
+        device.loss = 1.0
+        self.assertIsNone(device.reply_delay())
+
+
+class EmulatorRoundTripTest(unittest.TestCase):
+    def test_fan_initializes_against_every_profile(self):
+        async def run():
+            async with DeviceEmulator() as emulator:
+                for profile_key in Fan.device_profiles:
+                    with self.subTest(profile_key=profile_key):
+                        [device] = await emulator.start(1, profile_key)
+                        host, port = emulator.addresses[-1]
+                        fan = Fan(host, port=port)
+                        try:
+                            self.assertTrue(await fan.async_init_device())
+                        finally:
+                            fan.async_disconnect()
+                        self.assertEqual(fan.id, device.device_id)
+                        self.assertEqual(fan.profile_key, profile_key)
+                        self.assertEqual(fan.unknown_params, {})
+
+        asyncio.run(run())
+
+    def test_write_return_updates_device_and_echo(self):
+        async def run():
+            async with DeviceEmulator() as emulator:
+                [device] = await emulator.start(1, "vento")
+                host, port = emulator.addresses[0]
+                fan = Fan(host, port=port)
+                try:
+                    await fan.async_init_device()
+                    await fan.async_set_param("state", "off")
+                finally:
+                    fan.async_disconnect()
+                self.assertEqual(device.values[0x0001], b"\x00")
+                self.assertEqual(fan.state, "off")
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
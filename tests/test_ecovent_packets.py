@@ -1,8 +1,10 @@
 """Regression tests for EcoVent packet building and writes."""
 
+import asyncio
 import unittest
 
 from ecovent_test_helpers import Fan
+import protocol_codec
 
 
 class PacketBuilderTest(unittest.TestCase):
@@ -29,6 +31,21 @@ class PacketBuilderTest(unittest.TestCase):
         self.assertEqual(fan.encode_params("00b9", "0e00"), "fe02b90e00")
         self.assertEqual(fan.encode_params("0302", "0102"), "ff03fe02020102")
 
+    def test_binary_frame_matches_hex_packet(self):
+        fan = Fan("192.0.2.1", password="secret", fan_id="0123456789ABCDEF")
+        data = fan.func["read"] + fan.encode_params("000100020302")
+        frame = fan.encode_frame(bytes.fromhex(data))
+        self.assertIsInstance(frame, bytes)
+        self.assertTrue(fan.validate_packet(frame))
+        self.assertEqual(frame.hex().upper(), fan.build_packet(data).upper())
+
+    def test_schedule_read_gets_default_selector_once(self):
+        fan = Fan("192.0.2.1")
+        self.assertEqual(fan.encode_params("00770001"), "fe0277010101")
+        self.assertEqual(
+            protocol_codec.encode_params("0077", b"\x02\x03"), b"\xfe\x02\x77\x02\x03"
+        )
+
     def test_update_does_not_read_write_only_reset_params(self):
         fan = Fan("192.0.2.1")
         calls = []
@@ -43,6 +60,65 @@ class PacketBuilderTest(unittest.TestCase):
         self.assertNotIn("0065", params)
         self.assertNotIn("0080", params)
 
+    def test_update_frame_is_compiled_once_per_identity_and_profile(self):
+        fan = Fan("192.0.2.1")
+        request = fan._update_request()
+        _, expected, frame = fan._compiled_read(request)
+
+        self.assertIs(fan._update_request(), request)
+        self.assertIs(fan._compiled_read(request)[2], frame)
+        self.assertIn(0x0001, expected)
+        self.assertEqual(
+            frame, fan.encode_frame(fan._encode_request(fan.func["read"], request))
+        )
+
+        fan.id = "0123456789ABCDEF"
+        rebuilt = fan._compiled_read(request)[2]
+        self.assertIsNot(rebuilt, frame)
+        self.assertIn(b"0123456789ABCDEF", rebuilt)
+
+        fan.unit_type = "0600"
+        self.assertNotEqual(fan._update_request(), request)
+
+    def test_poll_tiers_partition_the_full_update(self):
+        fan = Fan("192.0.2.1")
+        for profile_key in fan.device_profiles:
+            with self.subTest(profile=profile_key):
+                fan._set_device_profile(profile_key)
+                tiers = {
+                    tier: fan._request_param_ids(fan._tier_request({tier}))
+                    for tier in ("static", "slow", "fast")
+                }
+                self.assertEqual(
+                    tiers["static"] | tiers["slow"] | tiers["fast"],
+                    fan._request_param_ids(fan._update_request()),
+                )
+                self.assertFalse(tiers["static"] & (tiers["slow"] | tiers["fast"]))
+                self.assertFalse(tiers["slow"] & tiers["fast"])
+                self.assertLessEqual(
+                    fan._request_param_ids(fan.device_profile.quick_update_request),
+                    tiers["fast"],
+                )
+                self.assertIn(fan.get_params_index("unit_type"), tiers["static"])
+
+    def test_fast_tier_poll_skips_static_params(self):
+        fan = Fan("192.0.2.1")
+        calls = []
+
+        def do_func(func, param, value="", retries=10):
+            calls.append(param)
+            return True
+
+        fan.do_func = do_func
+        self.assertTrue(fan.update_tiers({"fast"}))
+
+        params = fan._request_param_ids(calls[0])
+        self.assertIn(0x0001, params)
+        self.assertIn(0x0002, params)
+        self.assertNotIn(0x0086, params)
+        self.assertNotIn(0x00B9, params)
+        self.assertNotIn(0x0063, params)
+
     def test_update_falls_back_to_individual_reads_after_bulk_failure(self):
         fan = Fan("192.0.2.1")
         calls = []
@@ -118,21 +194,81 @@ class PacketBuilderTest(unittest.TestCase):
         fan.unit_type = "0600"
         calls = []
 
-        def do_func(func, param, value="", retries=10):
-            calls.append((func, param, value))
+        def do_request(data, expected, retries=10):
+            calls.append((data, expected))
             return True
 
-        fan.do_func = do_func
+        fan._do_request = do_request
         fan.set_operating_mode_preset("silent")
 
         self.assertEqual(len(calls), 1)
-        func, params, value = calls[0]
-        self.assertEqual(func, fan.func["write_return"])
-        self.assertEqual(value, "")
-        self.assertIn("001e01", params)
-        self.assertIn("000300", params)
-        self.assertIn("000f00", params)
-        self.assertIn("000500", params)
+        data, expected = calls[0]
+        self.assertEqual(data[:1].hex(), fan.func["write_return"])
+        self.assertLessEqual({0x0003, 0x0005, 0x000F, 0x001E}, expected)
+        params = data[1:].hex()
+        self.assertIn("1e01", params)
+        self.assertIn("0300", params)
+        self.assertIn("0f00", params)
+        self.assertIn("0500", params)
+        self.assertEqual(len(params), 4 * len(expected))
+
+    def test_write_dependencies_skip_echoed_params(self):
+        fan = Fan("192.0.2.1")
+        fan.do_func = lambda func, param, value="", retries=10: True
+        fan.set_param("speed", "manual")
+        fan.set_man_speed_percent(50)
+
+        self.assertEqual(
+            fan.write_dependencies_request(),
+            fan.PRESET_SPEED_SETTINGS_REQUEST.lower() + "004a004b",
+        )
+        self.assertEqual(fan.write_dependencies_request(), "")
+
+    def test_unacknowledged_writes_need_no_dependent_read(self):
+        fan = Fan("192.0.2.1")
+        fan.do_func = lambda func, param, value="", retries=10: False
+        fan._do_request = lambda data, expected, retries=10: False
+        self.assertFalse(fan.set_param("speed", "manual"))
+        self.assertFalse(fan.set_man_speed_percent(50))
+        self.assertFalse(fan.set_params({"speed": "manual", "state": "on"}))
+
+        self.assertEqual(fan.write_dependencies_request(), "")
+
+        fan._do_request = lambda data, expected, retries=10: True
+        self.assertTrue(fan.set_params({"speed": "manual"}))
+        self.assertIn(
+            fan.PRESET_SPEED_SETTINGS_REQUEST.lower(), fan.write_dependencies_request()
+        )
+
+    def test_write_dependencies_follow_profile_parameters(self):
+        fan = Fan("192.0.2.1")
+        fan.unit_type = "0600"
+        fan._do_request = lambda data, expected, retries=10: True
+        fan.set_operating_mode_preset("silent")
+
+        request = fan.write_dependencies_request()
+        self.assertIn("0004", request)
+        self.assertIn("000e", request)
+        self.assertNotIn("001e", request)
+        self.assertNotIn("004a", request)
+
+    def test_async_write_dependencies_read_only_targeted_params(self):
+        fan = Fan("192.0.2.1")
+        reads = []
+
+        async def do_request(data, expected, retries=10, frame=None):
+            reads.append(expected)
+            return True
+
+        async def run():
+            fan._async_do_request = do_request
+            await fan.async_set_param("reset_alarms", "")
+            reads.clear()
+            self.assertTrue(await fan.async_read_write_dependencies())
+            self.assertTrue(await fan.async_read_write_dependencies())
+
+        asyncio.run(run())
+        self.assertEqual(reads, [frozenset({0x0083})])
 
     def test_extract_fan_boost_invert_value_stays_in_declared_options(self):
         fan = Fan("192.0.2.1")
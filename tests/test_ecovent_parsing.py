@@ -2,7 +2,7 @@
 
 import unittest
 
-from ecovent_test_helpers import Fan, packet_with_payload
+from ecovent_test_helpers import Fan, full_update_payload, packet_with_payload
 
 
 class ParseRobustnessTest(unittest.TestCase):
@@ -37,6 +37,64 @@ class ParseRobustnessTest(unittest.TestCase):
         self.assertEqual(fan.speed, "Unknown speed 153")
         self.assertEqual(fan.airflow, "Unknown airflow 68")
 
+    def test_parse_frame_returns_views_into_datagram(self):
+        fan = Fan("192.0.2.1")
+        packet = packet_with_payload([0x01, 0x01, 0xFF, 0x03, 0xFE, 0x02, 0x02, 0xE8, 0x03])
+        params = fan._parse_frame(packet)
+
+        self.assertEqual([param_id for param_id, _ in params], [0x0001, 0x0302])
+        self.assertIsInstance(params[1][1], memoryview)
+        self.assertIs(params[1][1].obj, packet)
+        self.assertEqual(bytes(params[1][1]), b"\xe8\x03")
+
+    def test_setters_decode_raw_bytes_and_hex_alike(self):
+        fan = Fan("192.0.2.1")
+        fan.fan1_speed = b"\xe8\x03"
+        fan.firmware = bytes.fromhex("0102e9070a0b")
+        fan.wifi_name = b"home"
+        self.assertEqual(fan.fan1_speed, "1000")
+        self.assertEqual(fan.wifi_name, "home")
+        firmware = fan.firmware
+
+        fan.fan1_speed = "e803"
+        fan.firmware = "0102e9070a0b"
+        self.assertEqual(fan.fan1_speed, "1000")
+        self.assertEqual(fan.firmware, firmware)
+
+    def test_decoder_table_matches_property_setters_for_full_update(self):
+        for profile_key in ("vento", "breezy", "extract_fan"):
+            with self.subTest(profile_key=profile_key):
+                table_fan = Fan("192.0.2.1")
+                setter_fan = Fan("192.0.2.1")
+                table_fan._set_device_profile(profile_key)
+                setter_fan._set_device_profile(profile_key)
+                packet = packet_with_payload(full_update_payload(table_fan))
+
+                self.assertTrue(table_fan.parse_response(packet))
+                for param_id, value in setter_fan._parse_frame(packet):
+                    if value is not None:
+                        name = setter_fan.params[param_id][0]
+                        setattr(setter_fan, name, bytes(value))
+
+                for param_id, (name, *_) in table_fan.params.items():
+                    self.assertEqual(
+                        getattr(table_fan, name), getattr(setter_fan, name), name
+                    )
+                self.assertEqual(table_fan.unknown_params, {})
+
+    def test_hot_path_params_decode_into_the_store_only(self):
+        fan = Fan("192.0.2.1")
+        payload = [0x02, 0x03, 0x44, 0x80, 0xFE, 0x02, 0x4A, 0xE8, 0x03]
+        self.assertTrue(fan.parse_response(packet_with_payload(payload)))
+
+        for name in ("speed", "man_speed", "fan1_speed"):
+            param_id = fan.get_params_index(name)
+            with self.subTest(name=name):
+                self.assertIsNone(fan._decoders[param_id][0])
+                self.assertEqual(fan._store.value(param_id), getattr(fan, name))
+                self.assertNotIn(f"_{name}", vars(fan))
+        self.assertEqual((fan.speed, fan.man_speed, fan.fan1_speed), ("high", 50, "1000"))
+
     def test_beeper_unknown_enum_value_is_stable_sensor_state(self):
         fan = Fan("192.0.2.1")
         fan.beeper = "03"
@@ -53,6 +111,7 @@ class ParseRobustnessTest(unittest.TestCase):
             fan.parse_response(packet_with_payload([0xFE, 0x02, 0x63, 0x6D, 0x01]))
         )
         self.assertEqual(fan.filter_timer_setpoint, "365 d")
+        self.assertEqual(fan.param_number("filter_timer_setpoint"), 365)
 
     def test_parse_response_reads_four_byte_filter_timer_countdown(self):
         fan = Fan("192.0.2.1")
@@ -62,6 +121,7 @@ class ParseRobustnessTest(unittest.TestCase):
             )
         )
         self.assertEqual(fan.filter_timer_countdown, "72d 8h 17m ")
+        self.assertEqual(fan.param_number("filter_timer_countdown"), 1736.3)
 
     def test_parse_response_reads_padded_filter_timer_countdown(self):
         fan = Fan("192.0.2.1")
@@ -72,6 +132,19 @@ class ParseRobustnessTest(unittest.TestCase):
         )
         self.assertEqual(fan.filter_timer_countdown, "72d 8h 17m ")
 
+    def test_duration_params_keep_numeric_hours(self):
+        fan = Fan("192.0.2.1")
+        fan.timer_counter = "050c03"
+        fan.machine_hours = "1e020a00"
+        fan.battery_voltage = "e40c"
+
+        self.assertEqual(fan.timer_counter, "3h 12m 5s ")
+        self.assertEqual(fan.param_number("timer_counter"), 3.201)
+        self.assertEqual(fan.machine_hours, "10d 2h 30m ")
+        self.assertEqual(fan.param_number("machine_hours"), 242.5)
+        self.assertEqual(fan.param_number("battery_voltage"), 3300)
+        self.assertIsNone(fan.param_number("state"))
+
     def test_parse_response_rejects_dangling_extended_marker(self):
         fan = Fan("192.0.2.1")
         self.assertFalse(fan.parse_response(packet_with_payload([0xFF])))
@@ -91,3 +164,57 @@ class ParseRobustnessTest(unittest.TestCase):
         self.assertTrue(fan.parse_response(packet_with_payload([0xFD, 0x65, 0x01, 0x01])))
         self.assertEqual(fan.unknown_params, {})
         self.assertEqual(fan.state, "on")
+
+    def test_parse_response_records_changed_params_only(self):
+        fan = Fan("192.0.2.1")
+        self.assertIsNone(fan.pop_changed_params())
+
+        self.assertTrue(fan.parse_response(packet_with_payload([0x01, 0x01, 0x02, 0x01])))
+        self.assertEqual(fan.pop_changed_params(), {0x0001, 0x0002})
+
+        self.assertTrue(fan.parse_response(packet_with_payload([0x01, 0x01, 0x02, 0x03])))
+        self.assertEqual(fan.pop_changed_params(), {0x0002})
+
+        self.assertTrue(fan.parse_response(packet_with_payload([0x01, 0x01, 0x02, 0x03])))
+        self.assertEqual(fan.pop_changed_params(), set())
+
+    def test_profile_switch_marks_every_param_changed(self):
+        fan = Fan("192.0.2.1")
+        fan.pop_changed_params()
+        self.assertTrue(
+            fan.parse_response(packet_with_payload([0xFE, 0x02, 0xB9, 0x14, 0x00]))
+        )
+        self.assertIsNone(fan.pop_changed_params())
+
+    def test_param_store_keeps_raw_value_and_age(self):
+        fan = Fan("192.0.2.1")
+        self.assertIsNone(fan.param_age("state"))
+        self.assertTrue(fan.parse_response(packet_with_payload([0x01, 0x01])))
+
+        self.assertEqual(fan._store.raw(0x0001), b"\x01")
+        self.assertGreaterEqual(fan.param_age("state"), 0)
+        self.assertIsNone(fan.param_age("speed"))
+
+    def test_profile_switch_keeps_values_of_same_named_params(self):
+        fan = Fan("192.0.2.1")
+        self.assertTrue(
+            fan.parse_response(
+                packet_with_payload([0x01, 0x01, 0xFE, 0x02, 0xB9, 0x14, 0x00])
+            )
+        )
+        self.assertNotEqual(fan.profile_key, "vento")
+        self.assertEqual(fan.state, "on")
+
+    def test_snapshot_is_read_only_and_isolated_from_later_responses(self):
+        fan = Fan("192.0.2.1")
+        self.assertTrue(fan.parse_response(packet_with_payload([0x01, 0x00])))
+        snapshot = fan.snapshot()
+
+        self.assertTrue(fan.parse_response(packet_with_payload([0x01, 0x01, 0xEE, 0x02])))
+        self.assertEqual(fan.state, "on")
+        self.assertEqual(snapshot.state, "off")
+        self.assertEqual(fan.unknown_params, {0x00EE: "02"})
+        self.assertEqual(snapshot.unknown_params, {})
+        self.assertIsInstance(snapshot, Fan)
+        with self.assertRaises(AttributeError):
+            snapshot.state = "01"
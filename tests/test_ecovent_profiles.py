@@ -293,16 +293,24 @@ class ProfileParseTest(unittest.TestCase):
 
         calls = []
 
-        def fake_do_func(func, param, value="", retries=10):
-            calls.append((func, param, value, retries))
+        def fake_do_request(data, expected, retries=10):
+            calls.append((data, expected, retries))
             return True
 
-        fan.do_func = fake_do_func
+        fan._do_request = fake_do_request
 
         self.assertTrue(fan.set_rtc_datetime(datetime(2026, 4, 23, 19, 45, 30)))
         self.assertEqual(
             calls,
-            [(fan.func["write_return"], "006f1e2d1300701704041a", "", 10)],
+            [
+                (
+                    bytes.fromhex(
+                        fan.func["write_return"] + "fe036f1e2d13fe04701704041a"
+                    ),
+                    {0x006F, 0x0070},
+                    10,
+                )
+            ],
         )
 
     def test_vento_profile_keeps_byte_scaled_speed_values(self):
@@ -320,6 +328,58 @@ class ProfileParseTest(unittest.TestCase):
         fan.beeper = "02"
         self.assertEqual(fan.beeper, "toggle")
 
+    def test_repeated_unit_type_keeps_compiled_requests(self):
+        fan = Fan("192.0.2.1")
+        fan.unit_type = "1400"
+        request = fan._update_request()
+        tier_request = fan._tier_request({"fast"})
+
+        fan.unit_type = "1400"
+        self.assertIs(fan._update_request(), request)
+        self.assertIs(fan._tier_requests[frozenset({"fast"})], tier_request)
+
+        fan.unit_type = "0300"
+        self.assertIsNot(fan._update_request(), request)
+        self.assertEqual(fan._tier_requests, {})
+
+    def test_param_index_matches_profile_maps(self):
+        fan = Fan("192.0.2.1")
+        for profile_key in fan.device_profiles:
+            with self.subTest(profile=profile_key):
+                fan._set_device_profile(profile_key)
+                for params in (fan.params, fan.write_params):
+                    for index, (name, mapping) in params.items():
+                        self.assertEqual(fan.get_params_index(name), index)
+                        for raw, value in (mapping or {}).items():
+                            self.assertEqual(
+                                fan.get_params_values(name, value), [index, raw]
+                            )
+                self.assertEqual(fan.get_params_values("missing", "on"), [None, None])
+
+    def test_activity_values_ignore_fan_rpm_and_countdowns(self):
+        fan = Fan("192.0.2.1")
+        fan.state = "01"
+        before = fan.activity_values()
+        fan.fan1_speed = "0401"
+        fan.timer_counter = "0a0000"
+        self.assertEqual(fan.activity_values(), before)
+
+        fan.humidity = "40"
+        self.assertNotEqual(fan.activity_values(), before)
+
+    def test_timer_running_follows_boost_and_timer_mode(self):
+        fan = Fan("192.0.2.1")
+        fan.boost_status = "00"
+        fan.timer_mode = "00"
+        self.assertFalse(fan.timer_running)
+
+        fan.timer_mode = "02"
+        self.assertTrue(fan.timer_running)
+
+        fan.timer_mode = "00"
+        fan.boost_status = "02"
+        self.assertTrue(fan.timer_running)
+
     def test_parse_response_names_newer_atmo_unit_type(self):
         fan = Fan("192.0.2.1")
         self.assertTrue(
@@ -3,7 +3,7 @@
 import unittest
 
 from ecovent_test_helpers import COMPONENT_PATH  # noqa: F401  Ensures sys.path setup.
-from sensor_helpers import enum_options_with_value
+from sensor_helpers import EnumOptions, enum_options_with_value
 
 
 class SensorEnumOptionsTest(unittest.TestCase):
@@ -23,5 +23,28 @@ class SensorEnumOptionsTest(unittest.TestCase):
         self.assertIsNone(enum_options_with_value(None, "Unknown beeper 3"))
 
 
+class EnumOptionsCacheTest(unittest.TestCase):
+    def test_options_keep_identity_for_known_values(self):
+        cache = EnumOptions(("off", "on"))
+        options = cache.include("on")
+
+        self.assertEqual(options, ["off", "on"])
+        self.assertIs(cache.include("off"), options)
+        self.assertIs(cache.include(None), options)
+
+    def test_options_grow_once_per_new_value(self):
+        cache = EnumOptions(["off", "on"])
+        known = cache.include("on")
+        grown = cache.include("Unknown beeper 3")
+
+        self.assertIsNot(grown, known)
+        self.assertEqual(grown, ["off", "on", "Unknown beeper 3"])
+        self.assertIs(cache.include("Unknown beeper 3"), grown)
+        self.assertIs(cache.include("on"), grown)
+
+    def test_sensor_without_options_stays_without(self):
+        self.assertIsNone(EnumOptions(None).include("Unknown beeper 3"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,12 @@
 """Regression tests for EcoVent discovery and transport."""
 
+import asyncio
 import socket
 import unittest
 from unittest.mock import patch
 
 from ecovent_test_helpers import Fan, packet_with_payload
+import protocol_transport
 
 
 class DiscoveryTest(unittest.TestCase):
@@ -41,6 +43,24 @@ class TransportTest(unittest.TestCase):
         fan = Fan("192.0.2.1")
         self.assertFalse(fan.receive())
 
+    def test_socket_is_kept_between_requests(self):
+        device = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(device.close)
+        device.bind(("127.0.0.1", 0))
+        device.settimeout(1)
+        fan = Fan("127.0.0.1", port=device.getsockname()[1])
+        self.addCleanup(fan.close)
+
+        fan.send(fan._encode_request(fan.func["read"], "0001"))
+        sock = fan.socket
+        _, addr = device.recvfrom(1024)
+        device.sendto(packet_with_payload([0x01, 0x01]), addr)
+        self.assertTrue(fan.parse_response(fan.receive()))
+        fan.send(fan._encode_request(fan.func["read"], "0001"))
+
+        self.assertIs(fan.socket, sock)
+        self.assertEqual(fan.state, "on")
+
     def test_do_func_retries_invalid_packet_before_success(self):
         fan = Fan("192.0.2.1")
         good_packet = packet_with_payload([0x01, 0x01])
@@ -61,6 +81,325 @@ class TransportTest(unittest.TestCase):
         self.assertEqual(len(sent), 2)
         self.assertEqual(fan.state, "on")
 
+    def test_do_func_skips_late_reply_to_other_request(self):
+        fan = Fan("192.0.2.1")
+        responses = [packet_with_payload([0x02, 0x03]), packet_with_payload([0x01, 0x01])]
+        sent = []
+
+        fan.send = sent.append
+        fan.receive = lambda: responses.pop(0) if responses else False
+
+        self.assertTrue(fan.do_func(fan.func["read"], "0001"))
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(fan.state, "on")
+        self.assertIsNone(fan.speed)
+
+    def test_parse_response_rejects_params_outside_request(self):
+        fan = Fan("192.0.2.1")
+        packet = packet_with_payload([0x01, 0x01, 0x02, 0x03])
+
+        self.assertFalse(fan.parse_response(packet, expected={0x0001}))
+        self.assertIsNone(fan.state)
+        self.assertTrue(fan.parse_response(packet, expected={0x0001, 0x0002}))
+        self.assertEqual((fan.state, fan.speed), ("on", "high"))
+
+    def test_parse_response_rejects_reply_missing_requested_params(self):
+        fan = Fan("192.0.2.1")
+        partial = packet_with_payload([0x01, 0x01])
+        unsupported = packet_with_payload([0x01, 0x01, 0xFD, 0x02])
+
+        self.assertFalse(fan.parse_response(partial, expected={0x0001, 0x0002}))
+        self.assertIsNone(fan.state)
+        self.assertTrue(fan.parse_response(unsupported, expected={0x0001, 0x0002}))
+        self.assertEqual(fan.state, "on")
+
+
+class RttEstimatorTest(unittest.TestCase):
+    def test_first_sample_sets_timeout_from_measured_rtt(self):
+        rtt = protocol_transport.RttEstimator(0.4)
+        rtt.sample(0.02)
+        self.assertAlmostEqual(rtt.srtt, 0.02)
+        self.assertAlmostEqual(rtt.rto, 0.06)
+
+    def test_rto_is_clamped(self):
+        rtt = protocol_transport.RttEstimator(0.4)
+        rtt.sample(0.001)
+        self.assertEqual(rtt.rto, protocol_transport.MIN_RTO)
+        rtt.sample(5)
+        self.assertEqual(rtt.rto, protocol_transport.MAX_RTO)
+
+    def test_expired_wait_backs_off_until_next_sample(self):
+        rtt = protocol_transport.RttEstimator(0.4)
+        rtt.expired()
+        self.assertAlmostEqual(rtt.timeout, 0.8)
+        rtt.expired()
+        self.assertEqual(rtt.timeout, protocol_transport.MAX_RTO)
+        rtt.sample(0.1)
+        self.assertEqual(rtt.backoff, 0)
+        self.assertAlmostEqual(rtt.timeout, 0.3)
+
+    def test_backoff_does_not_carry_into_next_request(self):
+        rtt = protocol_transport.RttEstimator(0.4)
+        rtt.expired()
+        rtt.expired()
+        rtt.start_request()
+        self.assertAlmostEqual(rtt.timeout, 0.4)
+
+
+class TransportMetricsTest(unittest.TestCase):
+    def test_rtt_histogram_buckets_by_upper_bound(self):
+        metrics = protocol_transport.TransportMetrics()
+        for rtt in (0.004, 0.005, 0.03, 3.0):
+            metrics.rtt(rtt)
+        histogram = metrics.as_dict()["rtt_histogram"]
+        self.assertEqual(histogram["<=5ms"], 2)
+        self.assertEqual(histogram["<=50ms"], 1)
+        self.assertEqual(histogram[">2000ms"], 1)
+        self.assertEqual(sum(histogram.values()), 4)
+
+    def test_checksum_failures_are_counted(self):
+        fan = Fan("192.0.2.1")
+        packet = packet_with_payload([0x01, 0x01])
+        self.assertFalse(fan.parse_response(packet[:-1] + bytes([packet[-1] ^ 1])))
+        self.assertFalse(fan.parse_response(b"\x00\x00" + packet[2:]))
+        self.assertEqual(fan.transport_stats["checksum_failures"], 1)
+
+    def test_transport_value_matches_transport_stats(self):
+        fan = Fan("192.0.2.1")
+        fan._rtt.sample(0.02)
+        fan._metrics.rtt(0.02)
+        fan._metrics.requests = 3
+
+        for name, value in fan.transport_stats.items():
+            with self.subTest(name=name):
+                self.assertEqual(fan.transport_value(name), value)
+
+
+class _ReplyingDevice(asyncio.DatagramProtocol):
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.requests = []
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.requests.append(data)
+        if self.replies:
+            reply = self.replies.pop(0)
+            for datagram in reply if isinstance(reply, list) else [reply]:
+                if datagram is not None:
+                    self.transport.sendto(datagram, addr)
+
+
+class AsyncTransportTest(unittest.IsolatedAsyncioTestCase):
+    async def _device(self, replies):
+        loop = asyncio.get_running_loop()
+        transport, device = await loop.create_datagram_endpoint(
+            lambda: _ReplyingDevice(replies), local_addr=("127.0.0.1", 0)
+        )
+        self.addCleanup(transport.close)
+        return device, transport.get_extra_info("sockname")[1]
+
+    async def test_async_do_func_reads_reply_without_executor(self):
+        device, port = await self._device([packet_with_payload([0x01, 0x01])])
+        fan = Fan("127.0.0.1", port=port)
+        self.addCleanup(fan.close)
+
+        self.assertTrue(await fan.async_do_func(fan.func["read"], "0001"))
+        self.assertEqual(fan.state, "on")
+        expected = fan.build_packet(fan.func["read"] + fan.encode_params("0001"))
+        self.assertEqual(device.requests[0], bytes.fromhex(expected))
+
+    async def test_async_do_func_retries_after_lost_reply(self):
+        fan = Fan("127.0.0.1")
+        self.addCleanup(fan.close)
+        fan._rtt = protocol_transport.RttEstimator(0.05)
+        replies = [None, packet_with_payload([0x01, 0x00])]
+        device, fan._port = await self._device(replies)
+
+        self.assertTrue(await fan.async_do_func(fan.func["read"], "0001", retries=3))
+        self.assertEqual(len(device.requests), 2)
+        self.assertEqual(fan.state, "off")
+
+    async def test_async_do_func_ignores_reply_to_earlier_request(self):
+        stale = packet_with_payload([0x02, 0x03])
+        device, port = await self._device([[stale, packet_with_payload([0x01, 0x01])]])
+        fan = Fan("127.0.0.1", port=port)
+        self.addCleanup(fan.close)
+
+        self.assertTrue(await fan.async_do_func(fan.func["read"], "0001"))
+        self.assertEqual(len(device.requests), 1)
+        self.assertEqual(fan.state, "on")
+        self.assertIsNone(fan.speed)
+
+    async def test_stale_quick_read_reply_is_not_taken_for_bulk_read(self):
+        stale = packet_with_payload([0x01, 0x00])
+        bulk = packet_with_payload([0x01, 0x01, 0x02, 0x03])
+        device, port = await self._device([[stale, bulk]])
+        fan = Fan("127.0.0.1", port=port)
+        self.addCleanup(fan.close)
+
+        self.assertTrue(await fan.async_do_func(fan.func["read"], "00010002"))
+        self.assertEqual(len(device.requests), 1)
+        self.assertEqual((fan.state, fan.speed), ("on", "high"))
+
+    async def test_async_do_func_gives_up_after_retries(self):
+        fan = Fan("127.0.0.1")
+        self.addCleanup(fan.close)
+        fan._rtt = protocol_transport.RttEstimator(0.02)
+        device, fan._port = await self._device([])
+
+        self.assertFalse(await fan.async_do_func(fan.func["read"], "0001", retries=2))
+        self.assertEqual(len(device.requests), 2)
+
+    async def test_async_do_func_stops_when_retry_budget_is_spent(self):
+        fan = Fan("127.0.0.1")
+        self.addCleanup(fan.close)
+        fan._rtt = protocol_transport.RttEstimator(0.02)
+        device, fan._port = await self._device([])
+        fan.reset_retry_budget(1)
+
+        self.assertFalse(await fan.async_do_func(fan.func["read"], "0001", retries=5))
+        self.assertEqual(len(device.requests), 2)
+        self.assertEqual(fan.transport_stats["retry_budget"], 0)
+        self.assertEqual(fan.transport_stats["retries"], 1)
+        self.assertEqual(fan.transport_stats["timeouts"], 2)
+
+    async def test_async_do_func_measures_round_trip(self):
+        device, port = await self._device([packet_with_payload([0x01, 0x01])])
+        fan = Fan("127.0.0.1", port=port)
+        self.addCleanup(fan.close)
+
+        self.assertTrue(await fan.async_do_func(fan.func["read"], "0001"))
+        stats = fan.transport_stats
+        self.assertEqual(stats["samples"], 1)
+        self.assertLess(stats["rto"], fan.RESPONSE_TIMEOUT)
+
+    async def test_async_requests_update_transport_metrics(self):
+        fan = Fan("127.0.0.1")
+        self.addCleanup(fan.close)
+        fan._rtt = protocol_transport.RttEstimator(0.05)
+        reply = packet_with_payload([0x01, 0x01])
+        device, fan._port = await self._device([None, reply])
+
+        self.assertTrue(await fan.async_do_func(fan.func["read"], "0001", retries=3))
+        stats = fan.transport_stats
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["responses"], 1)
+        self.assertEqual((stats["timeouts"], stats["retries"]), (1, 1))
+        self.assertEqual(stats["bytes_out"], sum(map(len, device.requests)))
+        self.assertEqual(stats["bytes_in"], len(reply))
+        # Karn's algorithm: a retransmitted request yields no RTT sample.
+        self.assertEqual(sum(stats["rtt_histogram"].values()), 0)
+
+    async def test_failed_bulk_read_is_counted_as_fallback(self):
+        fan = Fan("127.0.0.1")
+        self.addCleanup(fan.close)
+        fan._rtt = protocol_transport.RttEstimator(0.02)
+        device, fan._port = await self._device([])
+
+        self.assertFalse(await fan._async_read_params("00010002"))
+        self.assertEqual(len(device.requests), 3 + 2)
+        stats = fan.transport_stats
+        self.assertEqual(stats["bulk_read_fallbacks"], 1)
+        self.assertIs(stats["bulk_read_supported"], False)
+
+    async def test_spent_retry_budget_keeps_bulk_reads(self):
+        fan = Fan("127.0.0.1")
+        self.addCleanup(fan.close)
+        fan._rtt = protocol_transport.RttEstimator(0.02)
+        device, fan._port = await self._device([])
+        fan.reset_retry_budget(0)
+
+        self.assertFalse(await fan._async_read_params("00010002"))
+        self.assertEqual(len(device.requests), 1)
+        stats = fan.transport_stats
+        self.assertEqual(stats["bulk_read_fallbacks"], 0)
+        self.assertIsNone(stats["bulk_read_supported"])
+
+    async def test_writes_keep_their_attempts_after_spent_budget(self):
+        fan = Fan("127.0.0.1")
+        self.addCleanup(fan.close)
+        fan._rtt = protocol_transport.RttEstimator(0.02)
+        device, fan._port = await self._device([None, packet_with_payload([0x01, 0x00])])
+        fan.reset_retry_budget(0)
+
+        self.assertTrue(await fan.async_set_param("state", "off"))
+        self.assertEqual(len(device.requests), 2)
+        self.assertEqual(fan.transport_stats["retry_budget"], 0)
+
+    async def test_failed_request_waits_no_longer_than_fixed_timeouts(self):
+        fan = Fan("127.0.0.1")
+        self.addCleanup(fan.close)
+        fan.RESPONSE_TIMEOUT = 0.02
+        fan._rtt = protocol_transport.RttEstimator(0.02)
+        device, fan._port = await self._device([])
+        loop = asyncio.get_running_loop()
+
+        for _ in range(2):
+            started = loop.time()
+            self.assertFalse(
+                await fan.async_do_func(fan.func["write_return"], "0001", "00")
+            )
+            # Backed-off waits would take 0.02 + 0.04 + 0.08 + ... ~= 0.7 s.
+            self.assertLess(loop.time() - started, 10 * 0.02 + 0.1)
+        self.assertGreaterEqual(len(device.requests), 2 * 4)
+
+    async def test_async_requests_reuse_one_endpoint(self):
+        replies = [packet_with_payload([0x01, 0x01]), packet_with_payload([0x02, 0x01])]
+        device, port = await self._device(replies)
+        fan = Fan("127.0.0.1", port=port)
+        self.addCleanup(fan.close)
+
+        self.assertTrue(await fan.async_do_func(fan.func["read"], "0001"))
+        endpoint = fan._endpoint
+        self.assertTrue(await fan.async_do_func(fan.func["read"], "0002"))
+        self.assertIs(fan._endpoint, endpoint)
+
+        fan.close()
+        self.assertIsNone(fan._endpoint)
+
+    async def test_fans_share_one_socket_and_replies_are_routed(self):
+        first, first_port = await self._device(
+            [packet_with_payload([0x01, 0x01], fan_id=b"AAAA000000000001")]
+        )
+        second, second_port = await self._device(
+            [packet_with_payload([0x01, 0x00], fan_id=b"BBBB000000000002")]
+        )
+        fan_a = Fan("127.0.0.1", fan_id="AAAA000000000001", port=first_port)
+        fan_b = Fan("127.0.0.1", fan_id="BBBB000000000002", port=second_port)
+        self.addCleanup(fan_a.close)
+        self.addCleanup(fan_b.close)
+
+        results = await asyncio.gather(
+            fan_a.async_do_func(fan_a.func["read"], "0001"),
+            fan_b.async_do_func(fan_b.func["read"], "0001"),
+        )
+
+        self.assertEqual(results, [True, True])
+        self.assertEqual((fan_a.state, fan_b.state), ("on", "off"))
+        self.assertIs(fan_a._endpoint.endpoint, fan_b._endpoint.endpoint)
+        self.assertEqual(fan_a._endpoint.endpoint.route_count, 2)
+
+    async def test_shared_socket_closes_with_last_device(self):
+        device, port = await self._device([packet_with_payload([0x01, 0x01])])
+        fan = Fan("127.0.0.1", port=port)
+        self.addCleanup(fan.close)
+        self.assertTrue(await fan.async_do_func(fan.func["read"], "0001"))
+        endpoint = fan._endpoint.endpoint
+
+        fan.close()
+
+        self.assertFalse(endpoint.is_open)
+
+    def test_frame_device_id_reads_response_header(self):
+        packet = packet_with_payload([0x01, 0x01], fan_id=b"0123456789ABCDEF")
+        self.assertEqual(
+            protocol_transport.frame_device_id(packet), "0123456789ABCDEF"
+        )
+        self.assertIsNone(protocol_transport.frame_device_id(packet[:6]))
+
 
 if __name__ == "__main__":
     unittest.main()
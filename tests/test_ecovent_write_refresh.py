@@ -0,0 +1,110 @@
+"""Tests for the debounced read-back of values derived from writes."""
+
+import asyncio
+import unittest
+
+try:
+    import voluptuous as vol
+except ImportError:
+    vol = None
+
+from ecovent_test_helpers import Fan
+from config_helpers import entry_polling_options
+from const import (
+    DEFAULT_REFRESH_COOLDOWN,
+    MIN_UPDATE_INTERVAL,
+    REFRESH_COOLDOWN,
+    UPDATE_INTERVAL,
+)
+from coordinator_helpers import TrailingCall
+
+
+class WriteBurstTest(unittest.TestCase):
+    def test_burst_of_writes_shares_one_dependent_read(self):
+        fan = Fan("192.0.2.1")
+        requests = []
+
+        async def do_request(data, expected, retries=10, frame=None):
+            requests.append((data[:1].hex(), expected))
+            return True
+
+        async def run():
+            fan._async_do_request = do_request
+            await fan.async_set_params({"speed": "manual"})
+            await fan.async_set_man_speed_percent(40)
+            await fan.async_set_man_speed_percent(60)
+            await fan.async_set_param("reset_alarms", "")
+            requests.clear()
+            self.assertTrue(await fan.async_read_write_dependencies())
+            self.assertTrue(await fan.async_read_write_dependencies())
+
+        asyncio.run(run())
+        [(function, expected)] = requests
+        self.assertEqual(function, fan.func["read"])
+        self.assertLessEqual({0x004A, 0x004B, 0x0083}, expected)
+        self.assertNotIn(0x0044, expected)
+
+
+class TrailingCallTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.runs = []
+
+        async def refresh():
+            self.runs.append(asyncio.get_running_loop().time())
+
+        self.refresh = TrailingCall(0.05, refresh)
+
+    async def test_burst_inside_cooldown_runs_once_after_first_call(self):
+        started = asyncio.get_running_loop().time()
+        for _ in range(3):
+            await self.refresh.async_call()
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(len(self.runs), 1)
+        self.assertGreaterEqual(self.runs[0] - started, 0.05)
+
+    async def test_call_after_run_schedules_another(self):
+        await self.refresh.async_call()
+        await asyncio.sleep(0.08)
+        await self.refresh.async_call()
+        await asyncio.sleep(0.08)
+
+        self.assertEqual(len(self.runs), 2)
+
+    async def test_cancel_drops_pending_run(self):
+        await self.refresh.async_call()
+        self.refresh.cancel()
+        await asyncio.sleep(0.08)
+
+        self.assertEqual(self.runs, [])
+
+
+class RefreshCooldownOptionTest(unittest.TestCase):
+    def test_option_is_taken_from_config_entry(self):
+        options = entry_polling_options({REFRESH_COOLDOWN: 2.5, UPDATE_INTERVAL: 5})
+
+        self.assertEqual(options[REFRESH_COOLDOWN], 2.5)
+        self.assertEqual(options[UPDATE_INTERVAL], 5)
+
+    def test_option_defaults_for_older_entries(self):
+        options = entry_polling_options({})
+
+        self.assertEqual(options[REFRESH_COOLDOWN], DEFAULT_REFRESH_COOLDOWN)
+        self.assertIsNone(options[MIN_UPDATE_INTERVAL])
+
+    @unittest.skipIf(vol is None, "voluptuous is not installed")
+    def test_schema_accepts_and_defaults_option(self):
+        from config_schema import polling_fields
+
+        schema = vol.Schema(polling_fields(entry_polling_options({})))
+
+        self.assertEqual(schema({})[REFRESH_COOLDOWN], DEFAULT_REFRESH_COOLDOWN)
+        self.assertEqual(schema({REFRESH_COOLDOWN: "0.5"})[REFRESH_COOLDOWN], 0.5)
+        self.assertNotIn(MIN_UPDATE_INTERVAL, schema({}))
+        with self.assertRaises(vol.Invalid):
+            schema({REFRESH_COOLDOWN: -1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,17 +37,24 @@ def _class_method(tree, class_name, method_name):
     raise AssertionError(f"{class_name}.{method_name} not found")
 
 
-def _executor_calls(node, target_attr):
-    for call in ast.walk(node):
+def _awaited_calls(node, target_attr):
+    for awaited in ast.walk(node):
+        if not isinstance(awaited, ast.Await):
+            continue
+        call = awaited.value
         if not isinstance(call, ast.Call):
             continue
         func = call.func
-        if not isinstance(func, ast.Attribute) or func.attr != "async_add_executor_job":
-            continue
-        if not call.args:
+        if isinstance(func, ast.Attribute) and func.attr == target_attr:
+            yield call
+
+
+def _calls(node, target_attr):
+    for call in ast.walk(node):
+        if not isinstance(call, ast.Call):
             continue
-        callback = call.args[0]
-        if isinstance(callback, ast.Attribute) and callback.attr == target_attr:
+        func = call.func
+        if isinstance(func, ast.Attribute) and func.attr == target_attr:
             yield call
 
 
@@ -80,21 +87,24 @@ class Issue35RegressionTest(unittest.TestCase):
             any(
                 len(call.args) >= 3 and isinstance(call.args[2], ast.Constant)
                 and call.args[2].value is True
-                for call in _executor_calls(turn_on, "set_percentage")
+                for call in _calls(turn_on, "_queue_percentage")
             )
         )
+        self.assertEqual(
+            len(list(_awaited_calls(turn_on, "async_write_params"))), 1
+        )
         self.assertTrue(
             any(
-                len(call.args) >= 3 and isinstance(call.args[2], ast.Constant)
-                and call.args[2].value is True
-                for call in _executor_calls(set_percentage, "set_percentage")
+                len(call.args) >= 2 and isinstance(call.args[1], ast.Constant)
+                and call.args[1].value is True
+                for call in _awaited_calls(set_percentage, "_async_set_percentage")
             )
         )
         self.assertTrue(
             any(
-                len(call.args) >= 3 and isinstance(call.args[2], ast.Constant)
-                and call.args[2].value is True
-                for call in _executor_calls(set_preset, "set_preset_mode")
+                len(call.args) >= 2 and isinstance(call.args[1], ast.Constant)
+                and call.args[1].value is True
+                for call in _awaited_calls(set_preset, "_async_set_preset_mode")
             )
         )
 
@@ -112,6 +122,16 @@ class Issue35RegressionTest(unittest.TestCase):
         self.assertIn("hidden_by=None", init_source)
         self.assertNotIn('f"switch.{device_slug}_weekly_schedule"', init_source)
 
+    def test_switch_toggle_leaves_state_to_coordinator(self):
+        tree = _tree(SWITCH_PATH)
+
+        for method_name in ("async_turn_on", "async_turn_off"):
+            method = _class_method(tree, "VentoSwitch", method_name)
+            self.assertEqual(
+                len(list(_awaited_calls(method, "async_write_params"))), 1
+            )
+            self.assertEqual(list(_calls(method, "async_write_ha_state")), [])
+
     def test_reported_legacy_entity_migrations_are_listed(self):
         init_source = INIT_PATH.read_text()
 